@@ -1,11 +1,48 @@
 # backend/src/api/router.py
 
-from fastapi import APIRouter, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
+import os
+
+from src.jobs.queue import IngestionQueue, INTERACTIVE
 
 router = APIRouter()
 
+# 수집 큐 (lifespan이 앱 시작 시 생성해 주입)
+ingestion_queue: Optional[IngestionQueue] = None
+
+def set_ingestion_queue(queue: Optional[IngestionQueue]):
+    global ingestion_queue
+    ingestion_queue = queue
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명 동안 수집 큐 실행 (FastAPI(lifespan=lifespan))
+    
+    Sanic 워커와 같은 작업 저장소(storage.job_store())를 쓰므로 어느 쪽에서 등록한 작업이든 함께 처리된다.
+    """
+    from src.langchain_controller import LangChainController
+    
+    controller = LangChainController()
+    await controller.storage.init()
+    queue = IngestionQueue(
+        controller,
+        workers=int(os.getenv("INGEST_WORKERS", 2)),
+        max_attempts=int(os.getenv("INGEST_MAX_ATTEMPTS", 3))
+    )
+    await queue.start()
+    set_ingestion_queue(queue)
+    try:
+        yield
+    finally:
+        set_ingestion_queue(None)
+        await queue.stop(timeout=float(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", 15)))
+        controller.retriever.save()
+        await controller.tavily_api.close()
+        controller.storage.close()
+
 class NewsRequest(BaseModel):
     query: str
     sources: List[str]
@@ -19,13 +56,30 @@ class ContextRequest(BaseModel):
 
 @router.post("/api/news/collect")
 async def collect_news(request: NewsRequest):
-    """뉴스 수집 엔드포인트"""
+    """뉴스 수집 엔드포인트 (수집 작업 등록 후 작업 id 반환)"""
+    if ingestion_queue is None:
+        raise HTTPException(status_code=503, detail="ingestion queue is not running")
     try:
-        # NewsSystem의 collect_news 메서드 호출
-        pass
+        job_id = await ingestion_queue.submit(
+            request.query,
+            include_domains=request.sources or None,
+            priority=INTERACTIVE,
+            source="fastapi"
+        )
+        return {"job_id": job_id, "status": "queued"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/api/news/jobs/{job_id}")
+async def get_collect_job(job_id: str):
+    """수집 작업 상태 조회 엔드포인트"""
+    if ingestion_queue is None:
+        raise HTTPException(status_code=503, detail="ingestion queue is not running")
+    job = await ingestion_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    return job
+
 @router.post("/api/news/analyze")
 async def analyze_news(request: ContextRequest):
     """뉴스 분석 엔드포인트"""
@@ -0,0 +1,9 @@
+# backend/src/main.py
+
+from fastapi import FastAPI
+
+from backend.src.api.router import lifespan, router
+
+# uvicorn backend.src.main:app (저장소 루트에서 실행)
+app = FastAPI(lifespan=lifespan)
+app.include_router(router)
@@ -0,0 +1,133 @@
+"""오프라인 벤치마크용 외부 의존성 대역 (Tavily MCP 서버, 채팅 모델, MongoDB)"""
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+import hashlib
+import json
+import random
+import time
+
+from aiohttp import web
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+VOCAB = [
+    "ai", "반도체", "금리", "election", "climate", "openai", "삼성전자", "nvidia",
+    "인공지능", "economy", "inflation", "market", "regulation", "energy", "배터리",
+    "health", "security", "trade", "tariff", "startup", "robot", "우주", "전기차"
+]
+
+DOMAINS = ["reuters.com", "bbc.com", "cnn.com", "ap.org"]
+
+def make_article(query: str, index: int, article_chars: int, rng: random.Random) -> Dict:
+    """검색어/순번으로 결정되는 가짜 기사"""
+    digest = hashlib.sha1(f"{query}:{index}".encode("utf-8")).hexdigest()[:12]
+    words = rng.sample(VOCAB, 6)
+    sentence = " ".join(words) + ". "
+    content = (f"{query} {sentence}" * (article_chars // (len(sentence) + len(query) + 1) + 1))[:article_chars]
+    return {
+        "title": f"{query} {' '.join(words[:4])} {index}",
+        "url": f"https://fake-news.example.com/{digest}",
+        "domain": rng.choice(DOMAINS),
+        "content": content
+    }
+
+class FakeTavilyServer:
+    """Tavily MCP /search 응답을 흉내 내는 로컬 HTTP 서버
+
+    latency_ms만큼 지연 후 max_results개의 기사를 돌려준다. 같은 검색어에는 같은 URL이 나온다.
+    """
+    def __init__(self, latency_ms: float = 50.0, article_chars: int = 1500, host: str = "127.0.0.1", port: int = 0):
+        self.latency_ms = latency_ms
+        self.article_chars = article_chars
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def _search(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        payload = await request.json()
+        await asyncio.sleep(self.latency_ms / 1000)
+        rng = random.Random(payload["query"])
+        results = [
+            make_article(payload["query"], i, self.article_chars, rng)
+            for i in range(payload.get("max_results", 10))
+        ]
+        return web.json_response({"results": results})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1/search", self._search)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+class FakeChatModel(BaseChatModel):
+    """초당 tokens_per_sec 속도로 output_tokens개 토큰을 생성하는 채팅 모델
+
+    요약/분석 통합 프롬프트도 처리되도록 JSON 형식 응답을 만든다.
+    """
+    tokens_per_sec: float = 200.0
+    output_tokens: int = 60
+    model_name: str = "fake-chat"
+    temperature: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _tokens(self, messages: List[BaseMessage]) -> List[str]:
+        seed = hashlib.sha1("".join(str(m.content) for m in messages).encode("utf-8")).hexdigest()
+        words = [VOCAB[int(seed[i % 40], 16) % len(VOCAB)] for i in range(self.output_tokens)]
+        body = json.dumps({
+            "summary": " ".join(words),
+            "analysis": {"issues": words[0], "stakeholders": words[1], "impact": words[2], "industries": words[3]}
+        }, ensure_ascii=False)
+        # 응답 문자열을 output_tokens개 조각으로 나눔
+        size = max(1, len(body) // self.output_tokens)
+        return [body[i:i + size] for i in range(0, len(body), size)]
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        tokens = self._tokens(messages)
+        time.sleep(len(tokens) / self.tokens_per_sec)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(tokens)))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        self.calls += 1
+        tokens = self._tokens(messages)
+        await asyncio.sleep(len(tokens) / self.tokens_per_sec)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(tokens)))])
+
+    async def _astream(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        self.calls += 1
+        for token in self._tokens(messages):
+            await asyncio.sleep(1 / self.tokens_per_sec)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+def use_memory_mongo():
+    """NewsStorage가 메모리 MongoDB(mongomock-motor)를 쓰도록 교체
+
+    텍스트 인덱스($text)는 지원되지 않으므로 검색 시나리오는 접두어 검색만 측정한다.
+    """
+    from mongomock_motor import AsyncMongoMockClient
+    from src.storage import news_storage
+    news_storage.AsyncIOMotorClient = AsyncMongoMockClient
+
+def use_fake_llm(model: FakeChatModel):
+    """컨트롤러가 생성하는 ChatOpenAI 대신 가짜 모델 사용"""
+    from src import langchain_controller
+    langchain_controller.ChatOpenAI = lambda **kwargs: model
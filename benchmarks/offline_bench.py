@@ -0,0 +1,249 @@
+"""외부 의존성 없이 실행하는 종합 벤치마크
+
+Tavily MCP는 로컬 가짜 서버, LLM은 가짜 채팅 모델, MongoDB는 메모리 대역(mongomock-motor)으로 대체한다.
+--mongo-uri를 주면 실제 MongoDB를 사용하고 텍스트 인덱스 검색도 측정한다.
+--storage sqlite를 주면 내장 SQLite 저장소(FTS5 검색 포함)를 workdir 아래 파일로 사용한다.
+
+시나리오:
+    ingest     process_news_command 수집 처리량 (건/초, LLM 호출 수)
+    http       코퍼스 크기별 /news/search/<keyword>, /news/headlines 지연 시간
+    websocket  /news/analyze_stream 첫 프레임/전체 지연 시간
+각 시나리오의 tracemalloc 최고 사용량과 프로세스 최대 RSS도 함께 기록한다.
+
+사용법:
+    python -m benchmarks.offline_bench --sizes 1000 10000 --output offline_bench.json
+    python -m benchmarks.offline_bench --storage sqlite --output offline_bench_sqlite.json
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+import aiohttp
+
+from .fakes import FakeChatModel, FakeTavilyServer, VOCAB, use_fake_llm, use_memory_mongo
+
+SEARCH_QUERIES = {"prefix": "반도*", "token": "반도체", "phrase": '"climate regulation"'}
+
+def summarize(timings: List[float]) -> Dict:
+    timings = sorted(timings)
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[max(0, int(len(timings) * 0.95) - 1)], 3),
+        "max_ms": round(timings[-1], 3)
+    }
+
+def max_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+async def track_memory(name: str, coro) -> Dict:
+    """시나리오 실행 중 파이썬 힙 최고 사용량 측정"""
+    tracemalloc.reset_peak()
+    result = await coro
+    _, peak = tracemalloc.get_traced_memory()
+    result["memory"] = {"peak_traced_mb": round(peak / (1024 * 1024), 2), "max_rss_mb": max_rss_mb()}
+    print(json.dumps({name: result}, ensure_ascii=False, default=str))
+    return result
+
+async def bench_ingest(queries: int, max_results: int) -> Dict:
+    """수집 명령 처리량"""
+    from src.langchain_controller import LangChainController
+    controller = LangChainController()
+    await controller.storage.init()
+    await controller.tavily_api.start()
+    try:
+        started = time.perf_counter()
+        stats = []
+        for i in range(queries):
+            await controller.process_news_command(f"{random.choice(VOCAB)} {i} 뉴스 수집", max_results=max_results)
+            stats.append(controller.last_ingest_stats)
+        elapsed = time.perf_counter() - started
+        articles = sum(s.articles for s in stats)
+        return {
+            "queries": queries,
+            "articles": articles,
+            "llm_calls": sum(s.llm_calls for s in stats),
+            "elapsed_s": round(elapsed, 3),
+            "articles_per_sec": round(articles / elapsed, 3) if elapsed else 0.0,
+            "peak_in_flight": max(s.peak_in_flight for s in stats)
+        }
+    finally:
+        await controller.tavily_api.close()
+        controller.storage.close()
+
+async def seed(storage, current: int, size: int):
+    """헤드라인 코퍼스를 current건에서 목표 크기까지 채움 (저장소 공통 일괄 저장 경로 사용)"""
+    batch = []
+    for i in range(current, size):
+        words = random.sample(VOCAB, 6)
+        batch.append({
+            "title": " ".join(words[:4]) + f" {i}",
+            "url": f"https://bench.example.com/{i}",
+            "source": random.choice(["reuters.com", "bbc.com", "cnn.com"]),
+            "keywords": words
+        })
+        if len(batch) == 5000:
+            await storage.save_headlines_bulk(batch)
+            batch = []
+    if batch:
+        await storage.save_headlines_bulk(batch)
+
+async def timed_get(session: aiohttp.ClientSession, url: str, repeat: int) -> Dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        async with session.get(url) as response:
+            await response.read()
+            response.raise_for_status()
+        timings.append((time.perf_counter() - started) * 1000)
+    return summarize(timings)
+
+async def bench_http(base_url: str, storage, sizes: List[int], repeat: int, text_search: bool) -> Dict:
+    """코퍼스 크기별 조회 지연 시간"""
+    queries = SEARCH_QUERIES if text_search else {"prefix": SEARCH_QUERIES["prefix"]}
+    rows, current = [], 0
+    async with aiohttp.ClientSession() as session:
+        for size in sorted(sizes):
+            await seed(storage, current, size)
+            current = max(current, size)
+            row = {"corpus_size": size}
+            for name, query in queries.items():
+                row[f"search_{name}"] = await timed_get(session, f"{base_url}/news/search/{query}?days=365&limit=50", repeat)
+            row["headlines_page"] = await timed_get(session, f"{base_url}/news/headlines?days=365&limit=50", repeat)
+            keyword = "ai" if text_search else "ai*"
+            row["headlines_keyword"] = await timed_get(session, f"{base_url}/news/headlines?days=365&keywords={keyword}&limit=50", repeat)
+            rows.append(row)
+    return {"results": rows}
+
+async def bench_websocket(base_url: str, repeat: int, article_chars: int) -> Dict:
+    """분석/요약 토큰 스트리밍 지연 시간"""
+    first_frame, total, frames = [], [], []
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(f"{base_url.replace('http', 'ws', 1)}/news/analyze_stream") as ws:
+            for i in range(repeat):
+                # 캐시 적중을 피하도록 매번 다른 본문 전송
+                content = f"{i} " + " ".join(random.choices(VOCAB, k=article_chars // 6))
+                started = time.perf_counter()
+                await ws.send_str(content)
+                count = 0
+                while True:
+                    message = await ws.receive()
+                    if message.type != aiohttp.WSMsgType.TEXT:
+                        raise RuntimeError(f"웹소켓 연결 오류: {message.data}")
+                    frame = json.loads(message.data)
+                    if count == 0:
+                        first_frame.append((time.perf_counter() - started) * 1000)
+                    count += 1
+                    if frame.get("type") == "end" or "error" in frame and "type" not in frame:
+                        break
+                total.append((time.perf_counter() - started) * 1000)
+                frames.append(count)
+    return {"first_frame": summarize(first_frame), "total": summarize(total), "frames_per_request": statistics.mean(frames)}
+
+async def start_app(port: int):
+    """news_api 앱을 현재 프로세스에서 실행"""
+    from src.api.news_api import app
+    server = await app.create_server(host="127.0.0.1", port=port, return_asyncio_server=True, access_log=False)
+    await server.startup()
+    await server.before_start()
+    await server.after_start()
+    return app, server
+
+async def stop_app(server):
+    await server.before_stop()
+    server.close()
+    await server.wait_closed()
+    await server.after_stop()
+
+async def run(args) -> Dict:
+    tracemalloc.start()
+    tavily = FakeTavilyServer(latency_ms=args.tavily_latency_ms, article_chars=args.article_chars)
+    await tavily.start()
+    os.environ["TAVILY_MCP_URL"] = tavily.base_url
+    os.environ.setdefault("SMITHERY_API_KEY", "bench")
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    os.environ["VECTOR_INDEX_PATH"] = args.workdir
+    os.environ["NEWS_STORAGE_BACKEND"] = args.storage
+    if args.storage == "sqlite":
+        os.makedirs(args.workdir, exist_ok=True)
+        sqlite_path = os.path.join(args.workdir, "offline_bench.db")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(sqlite_path + suffix):
+                os.remove(sqlite_path + suffix)
+        os.environ["NEWS_SQLITE_PATH"] = sqlite_path
+    elif args.mongo_uri:
+        os.environ["MONGODB_URI"] = args.mongo_uri
+        os.environ["NEWS_DB_NAME"] = args.db
+    else:
+        use_memory_mongo()
+    model = FakeChatModel(tokens_per_sec=args.tokens_per_sec, output_tokens=args.output_tokens)
+    use_fake_llm(model)
+
+    report = {
+        "started_at": datetime.now().isoformat(),
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "scenarios": {}
+    }
+    try:
+        if "ingest" in args.scenarios:
+            report["scenarios"]["ingest"] = await track_memory("ingest", bench_ingest(args.queries, args.max_results))
+            report["scenarios"]["ingest"]["tavily_requests"] = tavily.requests
+
+        if {"http", "websocket"} & set(args.scenarios):
+            app, server = await start_app(args.port)
+            base_url = f"http://127.0.0.1:{args.port}"
+            try:
+                if "http" in args.scenarios:
+                    storage = app.ctx.controller.storage
+                    report["scenarios"]["http"] = await track_memory(
+                        "http", bench_http(base_url, storage, args.sizes, args.repeat, text_search=bool(args.mongo_uri) or args.storage == "sqlite")
+                    )
+                if "websocket" in args.scenarios:
+                    report["scenarios"]["websocket"] = await track_memory(
+                        "websocket", bench_websocket(base_url, args.repeat, args.article_chars)
+                    )
+            finally:
+                if args.mongo_uri and args.storage == "mongo":
+                    await app.ctx.controller.storage.client.drop_database(args.db)
+                await stop_app(server)
+    finally:
+        await tavily.close()
+        tracemalloc.stop()
+    report["llm_calls"] = model.calls
+    return report
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="오프라인 종합 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", default=["ingest", "http", "websocket"], choices=["ingest", "http", "websocket"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--max-results", type=int, default=10)
+    parser.add_argument("--article-chars", type=int, default=1500)
+    parser.add_argument("--tavily-latency-ms", type=float, default=50.0)
+    parser.add_argument("--tokens-per-sec", type=float, default=200.0)
+    parser.add_argument("--output-tokens", type=int, default=60)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--storage", default="mongo", choices=["mongo", "sqlite"])
+    parser.add_argument("--mongo-uri", default=None)
+    parser.add_argument("--db", default="news_offline_bench")
+    parser.add_argument("--workdir", default=".bench_index")
+    parser.add_argument("--output", default="offline_bench.json")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+
+if __name__ == "__main__":
+    main()
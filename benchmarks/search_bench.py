@@ -0,0 +1,135 @@
+"""저장 뉴스 검색 지연 시간 벤치마크 (코퍼스 크기별, API와 같은 첫 페이지 조회)
+
+사용법:
+    MONGODB_URI=mongodb://localhost:27017 python -m benchmarks.search_bench --sizes 10000 100000 1000000
+    python -m benchmarks.search_bench --backend sqlite --db news_bench.db --sizes 10000 100000
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+
+from src.storage.backends import BACKENDS, create_storage
+from src.storage.news_storage import NewsStorage
+
+VOCAB = [
+    "ai", "반도체", "금리", "election", "climate", "openai", "삼성전자", "nvidia",
+    "인공지능", "economy", "inflation", "market", "regulation", "energy", "배터리",
+    "health", "security", "trade", "tariff", "startup", "robot", "우주", "전기차"
+]
+
+QUERIES = {
+    "token": "반도체",
+    "prefix": "infl*",
+    "phrase": '"climate regulation"',
+}
+
+def make_headline(i: int) -> Dict:
+    words = random.sample(VOCAB, 6)
+    return {
+        "timestamp": datetime.now() - timedelta(minutes=i),
+        "title": " ".join(words[:4]) + f" {i}",
+        "url": f"https://bench.example.com/{i}",
+        "source": random.choice(["reuters.com", "bbc.com", "cnn.com"]),
+        "keywords": words
+    }
+
+def open_storage(backend: str, db: str):
+    """create_storage와 같은 설정으로 저장소 생성 (db는 MongoDB DB 이름 또는 SQLite 파일 경로)"""
+    os.environ["NEWS_DB_NAME" if backend == "mongo" else "NEWS_SQLITE_PATH"] = db
+    return create_storage(backend)
+
+async def count_headlines(storage) -> int:
+    if isinstance(storage, NewsStorage):
+        return await storage.headlines.estimated_document_count()
+    [row] = await storage._fetch("SELECT COUNT(*) FROM headlines")
+    return row[0]
+
+async def insert_batch(storage, batch: List[Dict]):
+    if isinstance(storage, NewsStorage):
+        await storage.headlines.insert_many(batch, ordered=False)
+    else:
+        await storage.save_headlines_bulk(batch)
+
+async def seed(storage, size: int):
+    """코퍼스를 목표 크기까지 채움"""
+    current = await count_headlines(storage)
+    batch = []
+    for i in range(current, size):
+        batch.append(make_headline(i))
+        if len(batch) == 5000:
+            await insert_batch(storage, batch)
+            batch = []
+    if batch:
+        await insert_batch(storage, batch)
+
+async def measure(fn, repeat: int) -> Dict:
+    timings: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        "max_ms": round(timings[-1], 3)
+    }
+
+async def legacy_regex(storage: NewsStorage, keyword: str, limit: int):
+    """기존 비앵커 정규식 검색 (비교 기준, 같은 페이지 크기)"""
+    match = {"$or": [
+        {"title": {"$regex": keyword, "$options": "i"}},
+        {"keywords": {"$regex": keyword, "$options": "i"}},
+    ]}
+    await storage.headlines.find(match).sort("timestamp", -1).limit(limit).to_list(None)
+
+async def drop(storage, backend: str, db: str):
+    if backend == "mongo":
+        await storage.headlines.drop()
+        return
+    storage.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db + suffix):
+            os.remove(db + suffix)
+
+async def run(backend: str, sizes: List[int], repeat: int, limit: int, db: str) -> Dict:
+    storage = open_storage(backend, db)
+    await drop(storage, backend, db)
+    storage = open_storage(backend, db)
+    await storage.init()
+    report = {"started_at": datetime.now().isoformat(), "backend": backend, "repeat": repeat, "limit": limit, "results": []}
+    for size in sorted(sizes):
+        await seed(storage, size)
+        row = {"corpus_size": size}
+        for name, query in QUERIES.items():
+            row[name] = await measure(lambda: storage.search_news_page(query, limit=limit), repeat)
+        if backend == "mongo":
+            row["legacy_regex"] = await measure(lambda: legacy_regex(storage, "반도체", limit), repeat)
+        report["results"].append(row)
+        print(json.dumps(row, ensure_ascii=False))
+    await drop(storage, backend, db)
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 검색 벤치마크")
+    parser.add_argument("--backend", choices=BACKENDS, default="mongo")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50, help="페이지 크기 (검색 API의 limit)")
+    parser.add_argument("--db", default=None, help="MongoDB DB 이름 또는 SQLite 파일 경로")
+    parser.add_argument("--output", default="bench_output.json")
+    args = parser.parse_args()
+    
+    db = args.db or ("news_bench" if args.backend == "mongo" else "news_bench.db")
+    report = asyncio.run(run(args.backend, args.sizes, args.repeat, args.limit, db))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""앱 import/워커 기동 시간 측정 및 예산 초과 검사
+
+새 인터프리터에서 측정하므로 이미 import된 모듈의 영향을 받지 않는다.
+예산(ms)을 넘으면 종료 코드 1을 반환한다. 같은 예산 검사는 STARTUP_BUDGET_TESTS=1일 때 tests/test_startup.py가 pytest로 수행한다.
+
+사용법:
+    python -m benchmarks.startup_bench --import-budget-ms 800 --controller-budget-ms 3000
+    python -m benchmarks.startup_bench --output startup_bench.json
+"""
+from typing import Dict, Optional
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+IMPORT_SNIPPET = """
+import time
+started = time.perf_counter()
+import src.api.news_api
+print((time.perf_counter() - started) * 1000)
+"""
+
+CONTROLLER_SNIPPET = """
+import os, time
+os.environ.setdefault("SMITHERY_API_KEY", "bench")
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+started = time.perf_counter()
+from src.langchain_controller import LangChainController
+LangChainController()
+print((time.perf_counter() - started) * 1000)
+"""
+
+def measure(snippet: str, repeat: int, cwd: Optional[str] = None) -> Dict:
+    """새 프로세스에서 snippet 실행 시간(ms) 측정 (cwd는 src 패키지가 있는 저장소 루트)"""
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", snippet],
+            check=True, capture_output=True, text=True, cwd=cwd
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "max_ms": round(timings[-1], 3)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="기동 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=800.0)
+    parser.add_argument("--controller-budget-ms", type=float, default=3000.0)
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 (기본값: 표준 출력만)")
+    args = parser.parse_args()
+
+    report = {
+        "import": measure(IMPORT_SNIPPET, args.repeat),
+        "controller": measure(CONTROLLER_SNIPPET, args.repeat),
+        "budget_ms": {"import": args.import_budget_ms, "controller": args.controller_budget_ms}
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    over = report["import"]["p50_ms"] > args.import_budget_ms or report["controller"]["p50_ms"] > args.controller_budget_ms
+    sys.exit(1 if over else 0)
+
+if __name__ == "__main__":
+    main()
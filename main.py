@@ -1,24 +1,40 @@
-from langchain.chains import LLMChain
-from langchain.agents import Tool, AgentExecutor
-from langchain.memory import ConversationBufferMemory
-
-from src.langchain_controller import LangChainController
-from src.langgraph_workflow import NewsWorkflow
-
 from dotenv import load_dotenv
 load_dotenv(".venv/.env") # .env 파일 로드
 
 class NewsSystem:
     def __init__(self):
-        self.memory = ConversationBufferMemory(memory_key="chat_history")
+        self._controller = None
+        
+    @property
+    def controller(self):
+        """LangChain 컨트롤러 (처음 사용할 때 생성)"""
+        if self._controller is None:
+            from src.langchain_controller import LangChainController
+            self._controller = LangChainController()
+        return self._controller
+        
+    async def ready(self):
+        """저장소 초기화 후 컨트롤러 반환 (인덱스 생성은 처음 한 번만)"""
+        await self.controller.storage.init()
+        return self.controller
+        
+    async def close(self):
+        """벡터 인덱스 저장, HTTP 세션/저장소 정리"""
+        if self._controller is None:
+            return
+        self._controller.retriever.save()
+        await self._controller.tavily_api.close()
+        self._controller.storage.close()
         
     async def process_command(self, command: str):
         """사용자 명령어 처리"""
-        pass
+        controller = await self.ready()
+        return await controller.process_news_command(command)
 
-    async def collect_news(self):
-        """Tavily를 통한 뉴스 수집"""
-        pass
+    async def collect_news(self, query: str, max_results: int = 10):
+        """Tavily를 통한 뉴스 수집 (LangGraph 워크플로우로 요약/분석 후 저장)"""
+        controller = await self.ready()
+        return await controller.execute_langgraph_workflow(query, max_results=max_results)
 
     async def analyze_news(self):
         """Think MCP를 통한 뉴스 분석"""
@@ -30,4 +46,4 @@ async def main():
     
 if __name__ == "__main__":
     import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -0,0 +1 @@
+# analytics package 
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""저장된 헤드라인으로 키워드 집계 재구성
+
+기존 집계를 비우고 헤드라인을 배치 단위로 읽어 구간(일/주/월)·출처별 카운터를 다시 채운다.
+헤드라인 저장 시 집계가 함께 갱신되므로, 집계 도입 이전 데이터나 어긋난 집계를 바로잡을 때만 실행한다.
+재구성 중 수집된 헤드라인은 중복 집계될 수 있으므로 수집을 멈춘 상태에서 실행한다.
+
+사용법:
+    python -m src.analytics.backfill --batch-size 5000
+    NEWS_STORAGE_BACKEND=sqlite python -m src.analytics.backfill
+"""
+from typing import Dict
+import argparse
+import asyncio
+import json
+import time
+
+from dotenv import load_dotenv
+
+from ..storage.backends import BACKENDS, create_storage
+from .trends import count_increments
+
+async def backfill(storage, batch_size: int = 5000) -> Dict:
+    """집계 초기화 후 전체 헤드라인 재집계"""
+    await storage.init()
+    started = time.perf_counter()
+    await storage.reset_keyword_counts()
+
+    headlines, batch = 0, []
+    async for headline in storage.iter_headlines(fields=["source", "keywords"]):
+        batch.append(headline)
+        if len(batch) >= batch_size:
+            await storage.add_keyword_counts(count_increments(batch))
+            headlines += len(batch)
+            batch = []
+    if batch:
+        await storage.add_keyword_counts(count_increments(batch))
+        headlines += len(batch)
+    return {"headlines": headlines, "elapsed_sec": round(time.perf_counter() - started, 3)}
+
+async def run(backend: str, batch_size: int) -> Dict:
+    storage = create_storage(backend)
+    try:
+        return await backfill(storage, batch_size)
+    finally:
+        storage.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 집계 재구성")
+    parser.add_argument("--storage", default=None, choices=BACKENDS, help="기본값: NEWS_STORAGE_BACKEND")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    load_dotenv(".venv/.env")
+    report = asyncio.run(run(args.storage, args.batch_size))
+    print(json.dumps(report, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+# 집계 구간 종류
+WINDOWS = ("day", "week", "month")
+
+# 모든 출처 합계를 나타내는 source 값
+ALL_SOURCES = "*"
+
+# 헤드라인 보관 기간과 같게 구간이 끝난 뒤 1년 동안 카운터 유지
+RETENTION_DAYS = 365
+
+# 조회 가능한 최대 상위 키워드 수
+MAX_TOP_K = 100
+
+def window_key(kind: str, day: date) -> str:
+    """날짜가 속한 구간 키 (day:2024-06-01, week:2024-W22, month:2024-06)"""
+    if kind == "day":
+        return f"day:{day.isoformat()}"
+    if kind == "week":
+        year, week, _ = day.isocalendar()
+        return f"week:{year}-W{week:02d}"
+    if kind == "month":
+        return f"month:{day:%Y-%m}"
+    raise ValueError(f"지원하지 않는 집계 구간입니다: {kind} (사용 가능: {', '.join(WINDOWS)})")
+
+def window_start(kind: str, day: date) -> date:
+    """구간 첫날"""
+    if kind == "week":
+        return day - timedelta(days=day.weekday())
+    if kind == "month":
+        return day.replace(day=1)
+    return day
+
+def window_end(kind: str, day: date) -> date:
+    """구간 마지막 날"""
+    start = window_start(kind, day)
+    if kind == "week":
+        return start + timedelta(days=6)
+    if kind == "month":
+        return (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start
+
+def previous_day(kind: str, day: date) -> date:
+    """직전 구간에 속한 날짜"""
+    return window_start(kind, day) - timedelta(days=1)
+
+def count_increments(headlines: Iterable[Dict]) -> Dict[Tuple[str, str, str], int]:
+    """새 헤드라인의 (구간 키, 출처, 키워드)별 증가량
+
+    출처별 카운터와 전체 합계(ALL_SOURCES) 카운터를 함께 만든다. 같은 헤드라인의 중복 키워드는 한 번만 센다.
+    """
+    increments: Counter = Counter()
+    for headline in headlines:
+        day = headline["timestamp"].date()
+        sources = (headline.get("source") or "unknown", ALL_SOURCES)
+        for term in set(headline.get("keywords") or []):
+            for kind in WINDOWS:
+                key = window_key(kind, day)
+                for source in sources:
+                    increments[(key, source, term)] += 1
+    return dict(increments)
+
+def counter_expiry(key: str) -> datetime:
+    """구간 키의 카운터 만료 시각 (구간 종료 후 RETENTION_DAYS일)"""
+    kind, value = key.split(":", 1)
+    if kind == "day":
+        day = date.fromisoformat(value)
+    elif kind == "week":
+        year, week = value.split("-W")
+        day = date.fromisocalendar(int(year), int(week), 1)
+    else:
+        day = date.fromisoformat(f"{value}-01")
+    return datetime.combine(window_end(kind, day) + timedelta(days=RETENTION_DAYS + 1), datetime.min.time())
+
+async def get_trends(storage, window: str = "day", day: Optional[date] = None, source: Optional[str] = None, k: int = 10) -> Dict:
+    """구간별 상위 키워드와 직전 구간 대비 변화
+
+    집계 카운터의 (구간, 출처, 횟수) 인덱스에서 상위 k개만 읽으므로 저장된 헤드라인 수와 무관하게 일정한 비용이 든다.
+    """
+    if not 1 <= k <= MAX_TOP_K:
+        raise ValueError(f"k는 1~{MAX_TOP_K} 사이여야 합니다.")
+    day = day or datetime.now().date()
+    source = source or ALL_SOURCES
+    key = window_key(window, day)
+    previous_key = window_key(window, previous_day(window, day))
+
+    top = await storage.top_keywords(key, source, k)
+    previous = await storage.keyword_counts(previous_key, source, [term for term, _ in top])
+    return {
+        "window": window,
+        "key": key.split(":", 1)[1],
+        "source": source,
+        "terms": [
+            {"term": term, "count": count, "previous": previous.get(term, 0), "change": count - previous.get(term, 0)}
+            for term, count in top
+        ]
+    }
@@ -2,32 +2,226 @@ from sanic import Sanic, response
 from sanic.response import json
 from sanic_ext import validate
 
+from bson import ObjectId
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from functools import partial
+import asyncio
+from json import dumps as json_dumps
+from typing import AsyncIterator, List, Dict, Optional
 from datetime import datetime
+import os
+import tempfile
+import time
 
-from ..langchain_controller import LangChainController
+from ..analytics.trends import get_trends
+from ..jobs.queue import IngestionQueue, INTERACTIVE
+from ..metrics.telemetry import clear_snapshots, configure_logging, current_trace, log_error, metrics, render_all, server_timing, write_snapshot
 
 app = Sanic("news_collector")
-controller = LangChainController()
+
+# 종료 시 진행 중 요청/수집 작업을 기다리는 최대 시간(초)
+app.config.GRACEFUL_SHUTDOWN_TIMEOUT = float(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", 15))
+
+# 다른 워커가 반영한 키워드 DF 통계를 다시 불러오는 주기(초)
+KEYWORD_STATS_REFRESH = float(os.getenv("KEYWORD_STATS_REFRESH", 60))
+
+# 오래된 요약 월별 보관, 헤드라인에 복사된 만료 요약 정리, 보관 기간이 지난 문서 삭제 주기(초)
+SUMMARY_MAINTENANCE_INTERVAL = float(os.getenv("SUMMARY_MAINTENANCE_INTERVAL", 3600))
+
+# 워커별 지표 스냅샷 기록 주기(초)
+# NEWS_METRICS_DIR이 있으면 /metrics는 어느 워커가 받든 모든 워커의 지표를 합산해 응답한다 (없으면 응답한 워커의 지표만)
+METRICS_PUBLISH_INTERVAL = float(os.getenv("METRICS_PUBLISH_INTERVAL", 5))
+
+async def _refresh_keyword_stats(controller):
+    while True:
+        await asyncio.sleep(KEYWORD_STATS_REFRESH)
+        try:
+            await controller.load_keyword_stats()
+        except Exception as e:
+            # 일시적인 저장소 오류로 갱신이 멈추지 않도록 기록 후 다음 주기에 재시도
+            log_error("keyword_stats.refresh", e)
+
+async def _maintain_summaries(controller):
+    storage = controller.storage
+    while True:
+        await asyncio.sleep(SUMMARY_MAINTENANCE_INTERVAL)
+        # 한 단계가 실패해도 나머지 단계와 다음 주기는 계속 실행
+        for step in (storage.archive_summaries, storage.expire_summary_view, storage.purge_expired):
+            try:
+                await step()
+            except Exception as e:
+                log_error("summary_maintenance", e, step=step.__name__)
+
+async def _publish_metrics(directory):
+    while True:
+        await asyncio.sleep(METRICS_PUBLISH_INTERVAL)
+        try:
+            write_snapshot(directory)
+        except Exception as e:
+            log_error("metrics.publish", e)
+
+@app.before_server_start
+async def setup_worker(app, loop):
+    """워커 단위 컨트롤러/HTTP 커넥션 풀/수집 큐 생성
+    
+    LangChain/LangGraph 등 무거운 모듈은 앱 import 시점이 아니라 워커 시작 시점에 불러온다.
+    """
+    from ..langchain_controller import LangChainController
+    
+    configure_logging()
+    controller = LangChainController()
+    await controller.storage.init()
+    await controller.tavily_api.start()
+    await controller.retriever.sync()
+    await controller.load_keyword_stats()
+    
+    jobs = IngestionQueue(
+        controller,
+        workers=int(os.getenv("INGEST_WORKERS", 2)),
+        max_attempts=int(os.getenv("INGEST_MAX_ATTEMPTS", 3))
+    )
+    await jobs.start()
+    app.ctx.controller = controller
+    app.ctx.jobs = jobs
+    app.ctx.keyword_stats_task = asyncio.create_task(_refresh_keyword_stats(controller))
+    app.ctx.summary_maintenance_task = asyncio.create_task(_maintain_summaries(controller))
+    app.ctx.metrics_dir = os.getenv("NEWS_METRICS_DIR")
+    app.ctx.metrics_task = asyncio.create_task(_publish_metrics(app.ctx.metrics_dir)) if app.ctx.metrics_dir else None
+
+@app.before_server_stop
+async def drain_worker(app, loop):
+    """새 수집 작업 점유를 멈추고 진행 중 작업 마무리 (남은 작업은 다른 워커로 넘김)"""
+    app.ctx.keyword_stats_task.cancel()
+    app.ctx.summary_maintenance_task.cancel()
+    if app.ctx.metrics_task is not None:
+        app.ctx.metrics_task.cancel()
+    await app.ctx.jobs.stop(timeout=app.config.GRACEFUL_SHUTDOWN_TIMEOUT)
+
+@app.after_server_stop
+async def teardown_worker(app, loop):
+    """벡터 인덱스 저장 및 HTTP 커넥션 풀 정리"""
+    controller = app.ctx.controller
+    controller.retriever.save()
+    await controller.tavily_api.close()
+    controller.storage.close()
+    if app.ctx.metrics_dir:
+        write_snapshot(app.ctx.metrics_dir)
+
+# 이 헤더가 1인 요청은 구간별 소요 시간을 Server-Timing 응답 헤더로 돌려줌
+DEBUG_TRACE_HEADER = "X-Debug-Trace"
+
+@app.on_request
+async def start_trace(request):
+    request.ctx.started = time.perf_counter()
+    if request.headers.get(DEBUG_TRACE_HEADER) == "1":
+        request.ctx.trace = []
+        current_trace.set(request.ctx.trace)
+
+@app.on_response
+async def finish_trace(request, response):
+    """라우트별 지연 시간 기록 및 디버그 트레이스 헤더 추가"""
+    metrics.observe(
+        "news_http_request_seconds",
+        time.perf_counter() - request.ctx.started,
+        route=request.route.path if request.route else "unmatched",
+        method=request.method,
+        status=response.status
+    )
+    trace = getattr(request.ctx, "trace", None)
+    if trace is not None:
+        response.headers["Server-Timing"] = server_timing(trace)
+
+# 페이지 조회 최대 건수
+MAX_PAGE_LIMIT = 1000
+
+# 스트리밍 토큰 대기열 크기 (클라이언트가 느리면 생성 측이 대기)
+STREAM_QUEUE_SIZE = 64
+
+def _default(value):
+    """MongoDB 문서의 ObjectId/datetime 직렬화"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(value).__name__}")
+
+dumps = partial(json_dumps, default=_default, ensure_ascii=False)
+
+def _query_fields(request) -> Optional[List[str]]:
+    """`fields=title,url` 또는 `fields=-content` 형태의 projection 파라미터"""
+    fields = request.args.get("fields")
+    return [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+
+def _query_int(request, name: str) -> Optional[int]:
+    """정수 쿼리 파라미터 (형식이 잘못되면 ValueError)"""
+    value = request.args.get(name)
+    return int(value) if value else None
+
+def _query_limit(request) -> Optional[int]:
+    """페이지 크기 (MAX_PAGE_LIMIT로 제한, 1 미만이면 ValueError)"""
+    limit = _query_int(request, "limit")
+    if limit is None:
+        return None
+    if limit < 1:
+        raise ValueError("limit은 1 이상이어야 합니다.")
+    return min(limit, MAX_PAGE_LIMIT)
+
+async def _stream_ndjson(request, docs: AsyncIterator[Dict], batch_size: int = 100):
+    """비동기 제너레이터 결과를 NDJSON으로 스트리밍"""
+    stream = await request.respond(content_type="application/x-ndjson")
+    lines = []
+    async for doc in docs:
+        lines.append(dumps(doc))
+        if len(lines) >= batch_size:
+            await stream.send("\n".join(lines) + "\n")
+            lines = []
+    if lines:
+        await stream.send("\n".join(lines) + "\n")
+    await stream.eof()
 
 @dataclass
 class NewsSearchRequest:
     query: str
     max_results: int = 10
 
+@dataclass
+class SavedQueryRequest:
+    query: str
+    interval_minutes: int = 60
+    max_results: int = 10
+
 @app.post("/news/search")
 @validate(json=NewsSearchRequest)
 async def search_news(request, body: NewsSearchRequest):
-    """뉴스 검색 API"""
+    """뉴스 검색 API (수집 작업 등록 후 즉시 응답)"""
     try:
-        results = await controller.call_tavily_api(body.query)
-        message = await controller.process_news_command(f"뉴스 검색 {body.query}")
+        job_id = await request.app.ctx.jobs.submit(body.query, body.max_results, priority=INTERACTIVE)
         return json({
-            "message": message,
-            "count": len(results),
-            "results": results
-        })
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"/news/jobs/{job_id}"
+        }, status=202)
+    except Exception as e:
+        return response.json({"error": str(e)}, status=500)
+
+@app.get("/news/jobs/<job_id>")
+async def get_job(request, job_id: str):
+    """수집 작업 상태/진행률 조회"""
+    try:
+        job = await request.app.ctx.jobs.get(job_id)
+        if job is None:
+            return response.json({"error": "job not found"}, status=404)
+        return json(job, dumps=dumps)
+    except Exception as e:
+        return response.json({"error": str(e)}, status=500)
+
+@app.post("/news/saved_queries")
+@validate(json=SavedQueryRequest)
+async def add_saved_query(request, body: SavedQueryRequest):
+    """주기 수집 검색어 등록"""
+    try:
+        saved_id = await request.app.ctx.jobs.add_saved_query(body.query, body.interval_minutes * 60, body.max_results)
+        return json({"id": saved_id}, status=201)
     except Exception as e:
         return response.json({"error": str(e)}, status=500)
 
@@ -35,10 +229,20 @@ async def search_news(request, body: NewsSearchRequest):
 async def get_headlines(request):
     """저장된 헤드라인 조회"""
     try:
-        days = request.args.get("days", type=int)
+        days = _query_int(request, "days")
         keywords = request.args.get("keywords")
-        results = await controller.storage.get_headlines(days, keywords)
-        return json(results)
+        fields = _query_fields(request)
+        if request.args.get("stream"):
+            return await _stream_ndjson(request, request.app.ctx.controller.storage.iter_headlines(days, keywords, fields))
+            
+        limit = _query_limit(request)
+        if limit:
+            page = await request.app.ctx.controller.storage.get_headlines_page(days, keywords, limit, request.args.get("cursor"), fields)
+            return json(page, dumps=dumps)
+        results = await request.app.ctx.controller.storage.get_headlines(days, keywords, fields)
+        return json(results, dumps=dumps)
+    except ValueError as e:
+        return response.json({"error": str(e)}, status=400)
     except Exception as e:
         return response.json({"error": str(e)}, status=500)
 
@@ -46,10 +250,51 @@ async def get_headlines(request):
 async def get_summaries(request):
     """저장된 요약 조회"""
     try:
-        days = request.args.get("days", type=int)
+        days = _query_int(request, "days")
         headline_id = request.args.get("headline_id")
-        results = await controller.storage.get_summaries(days, headline_id)
-        return json(results)
+        fields = _query_fields(request)
+        if request.args.get("stream"):
+            return await _stream_ndjson(request, request.app.ctx.controller.storage.iter_summaries(days, headline_id, fields))
+            
+        limit = _query_limit(request)
+        if limit:
+            page = await request.app.ctx.controller.storage.get_summaries_page(days, headline_id, limit, request.args.get("cursor"), fields)
+            return json(page, dumps=dumps)
+        results = await request.app.ctx.controller.storage.get_summaries(days, headline_id, fields)
+        return json(results, dumps=dumps)
+    except ValueError as e:
+        return response.json({"error": str(e)}, status=400)
+    except Exception as e:
+        return response.json({"error": str(e)}, status=500)
+
+@app.get("/news/archive/<month>")
+async def get_archive(request, month: str):
+    """월별 요약 보관본 조회 (month: YYYY-MM)"""
+    try:
+        datetime.strptime(month, "%Y-%m")
+        results = await request.app.ctx.controller.storage.get_archive(month)
+        return json(results, dumps=dumps)
+    except ValueError as e:
+        return response.json({"error": str(e)}, status=400)
+    except Exception as e:
+        return response.json({"error": str(e)}, status=500)
+
+@app.get("/news/trends")
+async def get_keyword_trends(request):
+    """구간(day/week/month)별 상위 키워드와 직전 구간 대비 변화 (date: YYYY-MM-DD, 기본값 오늘)"""
+    try:
+        day = request.args.get("date")
+        k = _query_int(request, "k")
+        results = await get_trends(
+            request.app.ctx.controller.storage,
+            window=request.args.get("window", "day"),
+            day=datetime.strptime(day, "%Y-%m-%d").date() if day else None,
+            source=request.args.get("source"),
+            k=10 if k is None else k
+        )
+        return json(results, dumps=dumps)
+    except ValueError as e:
+        return response.json({"error": str(e)}, status=400)
     except Exception as e:
         return response.json({"error": str(e)}, status=500)
 
@@ -57,12 +302,40 @@ async def get_summaries(request):
 async def search_stored_news(request, keyword: str):
     """저장된 뉴스 검색"""
     try:
-        days = request.args.get("days", type=int)
-        results = await controller.storage.search_news(keyword, days)
-        return json(results)
+        days = _query_int(request, "days")
+        if request.args.get("stream"):
+            return await _stream_ndjson(request, request.app.ctx.controller.storage.iter_search_news(keyword, days))
+            
+        limit = _query_limit(request)
+        if limit:
+            page = await request.app.ctx.controller.storage.search_news_page(keyword, days, limit, request.args.get("cursor"))
+            return json(page, dumps=dumps)
+        results = await request.app.ctx.controller.storage.search_news(keyword, days)
+        return json(results, dumps=dumps)
+    except ValueError as e:
+        return response.json({"error": str(e)}, status=400)
     except Exception as e:
         return response.json({"error": str(e)}, status=500)
 
+@app.get("/news/limits")
+async def get_limits(request):
+    """업스트림 호출 한도 상태 (대기열 깊이, 평균 대기 시간, 현재 동시성 한도)"""
+    return json({
+        "llm": request.app.ctx.controller.llm_limiter.stats(),
+        "mcp": request.app.ctx.controller.mcp_limiter.stats()
+    })
+
+@app.get("/metrics")
+async def get_metrics(request):
+    """Prometheus 형식 지표 (NEWS_METRICS_DIR이 있으면 모든 워커 합산, 없으면 응답한 워커 프로세스 단위)"""
+    directory = request.app.ctx.metrics_dir
+    if directory:
+        write_snapshot(directory)
+        body = render_all(directory)
+    else:
+        body = metrics.render()
+    return response.text(body, content_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.websocket("/news/stream")
 async def news_stream(request, ws):
     """실시간 뉴스 스트리밍"""
@@ -72,13 +345,14 @@ async def news_stream(request, ws):
             query = await ws.recv()
             
             # 뉴스 검색 및 결과 전송
-            results = await controller.call_tavily_api(query)
-            await ws.send(json(results))
+            results = await request.app.ctx.controller.call_tavily_api(query)
+            await ws.send(dumps(results))
             
-            # 저장소에 저장
-            await controller.process_news_command(f"뉴스 검색 {query}")
+            # 저장소 저장은 수집 큐에서 처리 (검색 결과는 캐시로 공유)
+            job_id = await request.app.ctx.jobs.submit(query, priority=INTERACTIVE, source="stream")
+            await ws.send(dumps({"job_id": job_id, "status": "queued"}))
     except Exception as e:
-        await ws.send(json({"error": str(e)}))
+        await ws.send(dumps({"error": str(e)}))
 
 @app.post("/news/analyze")
 async def analyze_content(request):
@@ -88,7 +362,7 @@ async def analyze_content(request):
         if not content:
             return response.json({"error": "content is required"}, status=400)
             
-        result = await controller.analyze_news(content)
+        result = await request.app.ctx.controller.analyze_news(content)
         return json(result)
     except Exception as e:
         return response.json({"error": str(e)}, status=500)
@@ -101,30 +375,80 @@ async def summarize_content(request):
         if not content:
             return response.json({"error": "content is required"}, status=400)
             
-        result = await controller.summarize_news(content)
+        result = await request.app.ctx.controller.summarize_news(content)
         return json(result)
     except Exception as e:
         return response.json({"error": str(e)}, status=500)
 
+async def _produce_tokens(queue: asyncio.Queue, kind: str, tokens: AsyncIterator[str]):
+    """체인 토큰을 대기열에 적재 (대기열이 가득 차면 대기)"""
+    try:
+        async for token in tokens:
+            await queue.put((kind, token, None))
+        await queue.put((kind, None, None))
+    except Exception as e:
+        await queue.put((kind, None, str(e)))
+
+async def _stream_analysis(controller, ws, content: str):
+    """분석/요약을 동시에 실행하며 태그된 토큰 프레임 전송"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+    producers = [
+        asyncio.create_task(_produce_tokens(queue, "analysis", controller.stream_analysis(content))),
+        asyncio.create_task(_produce_tokens(queue, "summary", controller.stream_summary(content)))
+    ]
+    seq = {"analysis": 0, "summary": 0}
+    try:
+        remaining = len(producers)
+        while remaining:
+            kind, token, error = await queue.get()
+            frame = {"type": kind, "seq": seq[kind]}
+            seq[kind] += 1
+            if token is not None:
+                frame["token"] = token
+            else:
+                remaining -= 1
+                frame["done"] = True
+                if error:
+                    frame["error"] = error
+            await ws.send(dumps(frame))
+        await ws.send(dumps({"type": "end"}))
+    finally:
+        # 소켓 종료 등으로 중단되면 진행 중인 생성 취소
+        for task in producers:
+            task.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
+
 @app.websocket("/news/analyze_stream")
 async def analyze_stream(request, ws):
-    """실시간 뉴스 분석 스트리밍"""
+    """실시간 뉴스 분석 스트리밍
+    
+    프레임: {"type": "analysis"|"summary", "seq": n, "token": "..."} / {"type": ..., "seq": n, "done": true} / {"type": "end"}
+    """
     try:
         while True:
             # 클라이언트로부터 뉴스 내용 수신
             content = await ws.recv()
-            
-            # 분석 및 요약 실행
-            analysis = await controller.analyze_news(content)
-            summary = await controller.summarize_news(content)
-            
-            # 결과 전송
-            await ws.send(json({
-                "analysis": analysis,
-                "summary": summary
-            }))
+            if content is None:
+                break
+                
+            await _stream_analysis(request.app.ctx.controller, ws, content)
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
-        await ws.send(json({"error": str(e)}))
+        await ws.send(dumps({"error": str(e)}))
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8000, debug=True) 
\ No newline at end of file
+    # NEWS_WORKERS=auto 이면 CPU 코어 수만큼 워커 프로세스 실행 (워커마다 컨트롤러/DB 클라이언트/HTTP 풀 생성)
+    workers = os.getenv("NEWS_WORKERS", "1")
+    # 워커가 여럿이면 /metrics가 모든 워커의 지표를 합산하도록 스냅샷 디렉터리 지정 (워커 프로세스가 환경 변수를 물려받음)
+    if workers != "1":
+        os.environ.setdefault("NEWS_METRICS_DIR", os.path.join(tempfile.gettempdir(), f"news-metrics-{os.getpid()}"))
+        clear_snapshots(os.environ["NEWS_METRICS_DIR"])
+    app.run(
+        host=os.getenv("NEWS_HOST", "0.0.0.0"),
+        port=int(os.getenv("NEWS_PORT", 8000)),
+        fast=workers == "auto",
+        workers=1 if workers == "auto" else int(workers),
+        debug=os.getenv("NEWS_DEBUG") == "1",
+        access_log=os.getenv("NEWS_DEBUG") == "1"
+    ) 
\ No newline at end of file
@@ -1,49 +1,128 @@
 from typing import Dict, List, Optional
 import aiohttp
+import asyncio
+from contextlib import AsyncExitStack
 import os
+import random
 from datetime import datetime
 import json
 
+from ..text.keywords import KeywordExtractor
+from ..metrics.telemetry import timed
+
+# 기본 검색 대상 뉴스 도메인
+DEFAULT_DOMAINS = ["news.google.com", "reuters.com", "ap.org", "bbc.com", "cnn.com"]
+
+# 재시도 대상 상태 코드 (요청 한도 초과 및 서버 오류)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class TavilyAPIError(Exception):
+    """Tavily MCP 호출 실패"""
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(f"Tavily MCP API 오류: {status} {message}".strip())
+        self.status = status
+        
 class TavilyNewsAPI:
-    def __init__(self):
-        self.base_url = "http://localhost:8000/v1"  # Smithery MCP 서버 주소
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_connections: int = 100,
+        keepalive_timeout: float = 30.0,
+        request_timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        keyword_extractor: Optional[KeywordExtractor] = None,
+        limiter=None
+    ):
+        self.base_url = base_url or os.getenv("TAVILY_MCP_URL", "http://localhost:8000/v1")  # Smithery MCP 서버 주소
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=request_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.keyword_extractor = keyword_extractor or KeywordExtractor()
+        self.limiter = limiter
+        
+    async def start(self):
+        """워커 단위 공유 세션 생성"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self._session
+        
+    async def close(self):
+        """공유 세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
         
-    async def search_news(self, query: str, max_results: int = 10) -> List[Dict]:
+    @timed("tavily.search_news")
+    async def search_news(self, query: str, max_results: int = 10, include_domains: Optional[List[str]] = None) -> List[Dict]:
         """뉴스 검색 API 호출"""
-        async with aiohttp.ClientSession() as session:
-            payload = {
-                "query": query,
-                "search_depth": "advanced",
-                "include_domains": ["news.google.com", "reuters.com", "ap.org", "bbc.com", "cnn.com"],
-                "max_results": max_results,
-                "type": "news"
-            }
+        payload = {
+            "query": query,
+            "search_depth": "advanced",
+            "include_domains": include_domains or DEFAULT_DOMAINS,
+            "max_results": max_results,
+            "type": "news"
+        }
+        data = await self._post("/search", payload)
+        return self._process_results(data)
+        
+    async def _post(self, path: str, payload: Dict) -> Dict:
+        """재시도(지터 포함 지수 백오프)를 적용한 POST 요청"""
+        session = await self.start()
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with AsyncExitStack() as stack:
+                    if self.limiter is not None:
+                        await stack.enter_async_context(self.limiter.slot())
+                    async with session.post(f"{self.base_url}{path}", json=payload) as response:
+                        if response.status == 200:
+                            return await response.json()
+                        if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                            raise TavilyAPIError(response.status)
+                        retry_after = response.headers.get("Retry-After")
+                if self.limiter is not None:
+                    self.limiter.record_overload()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == self.max_retries:
+                    raise
+                retry_after = None
+            await asyncio.sleep(self._backoff(attempt, retry_after))
             
-            async with session.post(f"{self.base_url}/search", json=payload) as response:
-                if response.status != 200:
-                    raise Exception(f"Tavily MCP API 오류: {response.status}")
-                    
-                data = await response.json()
-                return self._process_results(data)
-                
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """다음 재시도까지 대기 시간 (full jitter)"""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+        
     def _process_results(self, data: Dict) -> List[Dict]:
         """API 응답 처리"""
+        items = data.get("results", [])
+        
+        # 응답 전체를 한 번에 키워드 추출 (제목 + 본문)
+        keywords = self.keyword_extractor.extract_batch([
+            f"{item.get('title') or ''} {item.get('content') or ''}" for item in items
+        ])
+        
         results = []
-        for item in data.get("results", []):
+        for item, item_keywords in zip(items, keywords):
             result = {
                 "title": item.get("title"),
                 "url": item.get("url"),
                 "source": item.get("domain"),
                 "content": item.get("content"),
-                "keywords": self._extract_keywords(item.get("content", "")),
+                "keywords": item_keywords,
                 "timestamp": datetime.now()  # 수집 시점
             }
             results.append(result)
         return results
-        
-    def _extract_keywords(self, content: str) -> List[str]:
-        """본문에서 키워드 추출"""
-        words = content.lower().split()
-        stopwords = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to"}
-        keywords = [word for word in words if word not in stopwords and len(word) > 3]
-        return list(set(keywords))[:10]
@@ -0,0 +1 @@
+# cache package 
\ No newline at end of file
@@ -0,0 +1,253 @@
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional
+import asyncio
+import hashlib
+import json
+import re
+import time
+import unicodedata
+
+from ..metrics.telemetry import log_sampled, metrics, record_llm_usage, span
+from ..ratelimit.limiter import estimate_tokens
+
+def normalize_content(content: str) -> str:
+    """캐시 키용 본문 정규화 (유니코드 NFC + 공백 정리)"""
+    content = unicodedata.normalize("NFC", content or "")
+    return re.sub(r"\s+", " ", content).strip()
+
+def make_cache_key(template: str, model_name: str, temperature: float, content: str) -> str:
+    """(프롬프트 템플릿, 모델, 온도, 정규화된 본문) 기준 해시 키"""
+    payload = json.dumps(
+        [template, model_name, temperature, normalize_content(content)],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class LRUCache:
+    """크기 제한이 있는 프로세스 내 LRU 캐시"""
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data: OrderedDict = OrderedDict()
+        
+    def get(self, key: str) -> Optional[str]:
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+        
+    def set(self, key: str, value: str):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            
+    def __len__(self) -> int:
+        return len(self._data)
+
+class MongoCacheTier:
+    """MongoDB 영구 캐시 계층 (TTL 인덱스로 만료)"""
+    def __init__(self, collection, ttl_seconds: int = 7 * 24 * 60 * 60):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        self._ready = False
+        
+    async def _ensure_index(self):
+        if not self._ready:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0)
+            self._ready = True
+            
+    async def get(self, key: str) -> Optional[str]:
+        await self._ensure_index()
+        doc = await self.collection.find_one(
+            {"_id": key, "expires_at": {"$gt": datetime.now()}},
+            {"value": 1}
+        )
+        return doc["value"] if doc else None
+        
+    async def set(self, key: str, value: str):
+        await self._ensure_index()
+        await self.collection.update_one(
+            {"_id": key},
+            {"$set": {"value": value, "expires_at": datetime.now() + timedelta(seconds=self.ttl_seconds)}},
+            upsert=True
+        )
+
+class LLMResultCache:
+    """LRU(메모리) + 선택적 영구 계층으로 구성된 LLM 결과 캐시
+
+    영구 계층은 MongoCacheTier(뉴스 저장소) 또는 SQLiteCacheTier(로컬 디스크 파일)를 사용한다.
+    같은 키의 미스가 동시에 발생하면 get_or_compute가 LLM 호출 한 번의 결과를 함께 사용한다.
+    """
+    def __init__(self, max_size: int = 1024, persistent=None):
+        self.memory = LRUCache(max_size)
+        self.persistent = persistent
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        
+    async def get(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        if self.persistent is not None:
+            value = await self.persistent.get(key)
+            if value is not None:
+                self.persistent_hits += 1
+                self.memory.set(key, value)
+                return value
+        self.misses += 1
+        return None
+        
+    async def set(self, key: str, value: str):
+        self.memory.set(key, value)
+        if self.persistent is not None:
+            await self.persistent.set(key, value)
+            
+    def inflight(self, key: str) -> Optional[asyncio.Future]:
+        """key에 대해 진행 중인 계산 (없으면 None)"""
+        return self._inflight.get(key)
+        
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[str]]) -> str:
+        """캐시 미스 후 계산 (같은 키의 계산이 진행 중이면 그 결과를 기다림)"""
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._compute(key, compute))
+            self._inflight[key] = flight
+            flight.add_done_callback(partial(self._finish, key))
+        else:
+            self.coalesced += 1
+        # 계산은 별도 태스크에서 실행되므로 한 요청이 취소돼도 같은 결과를 기다리는 다른 요청은 영향받지 않음
+        return await asyncio.shield(flight)
+        
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[str]]) -> str:
+        # 미스 확인 이후 먼저 끝난 계산이 있으면 그 결과를 사용
+        value = self.memory.get(key)
+        if value is None:
+            value = await compute()
+            await self.set(key, value)
+        return value
+        
+    def _finish(self, key: str, flight: asyncio.Future):
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우에도 경고가 남지 않도록 예외를 소비
+        if not flight.cancelled():
+            flight.exception()
+            
+    def stats(self) -> Dict:
+        """적중/미스 통계"""
+        total = self.hits + self.persistent_hits + self.misses
+        return {
+            "hits": self.hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "size": len(self.memory),
+            "hit_rate": round((self.hits + self.persistent_hits) / total, 4) if total else 0.0
+        }
+
+class CachedChain:
+    """LLMChain 앞단 캐시 래퍼 (arun(content=...) 인터페이스 유지)
+    
+    limiter가 주어지면 캐시 미스로 실제 LLM을 호출할 때만 한도를 적용한다.
+    name은 지표/로그에서 체인을 구분하는 이름이다.
+    """
+    def __init__(self, chain, cache: LLMResultCache, limiter=None, max_output_tokens: int = 512, name: str = "chain"):
+        self.chain = chain
+        self.cache = cache
+        self.limiter = limiter
+        self.max_output_tokens = max_output_tokens
+        self.name = name
+        
+    @property
+    def model_name(self) -> str:
+        llm = self.chain.llm
+        return getattr(llm, "model_name", type(llm).__name__)
+        
+    def _prompt_tokens(self, content: str) -> int:
+        return estimate_tokens(self.chain.prompt.template) + estimate_tokens(content)
+        
+    async def _enter_slot(self, stack: AsyncExitStack, content: str):
+        if self.limiter is not None:
+            tokens = self._prompt_tokens(content) + self.max_output_tokens
+            await stack.enter_async_context(self.limiter.slot(tokens=tokens))
+        
+    def cache_key(self, content: str) -> str:
+        return make_cache_key(
+            self.chain.prompt.template,
+            self.model_name,
+            getattr(self.chain.llm, "temperature", None),
+            content
+        )
+        
+    async def _lookup(self, key: str) -> Optional[str]:
+        cached = await self.cache.get(key)
+        metrics.inc("news_llm_cache_total", chain=self.name, result="miss" if cached is None else "hit")
+        return cached
+        
+    def _record(self, content: str, result: str, started: float):
+        """토큰/비용 지표 누적 및 샘플 로그"""
+        prompt_tokens = self._prompt_tokens(content)
+        completion_tokens = estimate_tokens(result)
+        record_llm_usage(self.name, self.model_name, prompt_tokens, completion_tokens)
+        log_sampled(
+            "llm_call",
+            chain=self.name,
+            model=self.model_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            content_preview=content[:200]
+        )
+        
+    async def _call(self, content: str) -> str:
+        async with AsyncExitStack() as stack:
+            await self._enter_slot(stack, content)
+            started = time.perf_counter()
+            with span("llm.arun", chain=self.name):
+                result = await self.chain.arun(content=content)
+        self._record(content, result, started)
+        return result
+        
+    async def arun(self, content: str) -> str:
+        key = self.cache_key(content)
+        cached = await self._lookup(key)
+        if cached is not None:
+            return cached
+        return await self.cache.get_or_compute(key, partial(self._call, content))
+        
+    async def astream(self, content: str) -> AsyncIterator[str]:
+        """토큰 단위 스트리밍 (캐시 적중 시 한 번에 반환, 완료 후 캐시에 저장)"""
+        key = self.cache_key(content)
+        cached = await self._lookup(key)
+        if cached is not None:
+            yield cached
+            return
+        # 같은 본문을 처리 중인 호출이 있으면 새로 호출하지 않고 그 결과를 사용
+        flight = self.cache.inflight(key)
+        if flight is not None:
+            yield await asyncio.shield(flight)
+            return
+            
+        tokens = []
+        async with AsyncExitStack() as stack:
+            await self._enter_slot(stack, content)
+            started = time.perf_counter()
+            with span("llm.astream", chain=self.name):
+                async for chunk in (self.chain.prompt | self.chain.llm).astream({"content": content}):
+                    token = getattr(chunk, "content", chunk)
+                    if token:
+                        tokens.append(token)
+                        yield token
+        result = "".join(tokens)
+        self._record(content, result, started)
+        await self.cache.set(key, result)
+        
+    def __getattr__(self, name):
+        return getattr(self.chain, name)
@@ -0,0 +1,102 @@
+from datetime import datetime
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import json
+import time
+
+from .llm_cache import LRUCache, normalize_content
+
+class SearchCache:
+    """Tavily 검색 single-flight + TTL 캐시
+    
+    같은 (정규화된 검색어, max_results, 도메인 목록) 요청이 동시에 들어오면
+    업스트림 호출 한 번의 결과를 함께 사용하고, 결과는 ttl초 동안 재사용한다.
+    shared 계층(예: SQLiteCacheTier)이 주어지면 다른 워커 프로세스의 결과도 재사용한다.
+    """
+    def __init__(self, fetch: Callable[..., Awaitable[List[Dict]]], ttl: float = 60.0, max_size: int = 256, shared=None):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.shared = shared
+        self._results = LRUCache(max_size)
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.hits = 0
+        self.shared_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        
+    @staticmethod
+    def make_key(query: str, max_results: int, include_domains: Optional[List[str]]) -> Tuple:
+        return (
+            normalize_content(query).lower(),
+            max_results,
+            tuple(sorted(include_domains)) if include_domains else None
+        )
+        
+    async def search(self, query: str, max_results: int = 10, include_domains: Optional[List[str]] = None) -> List[Dict]:
+        key = self.make_key(query, max_results, include_domains)
+        
+        cached = self._results.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.hits += 1
+            return self._copy(cached[1])
+            
+        # 같은 요청이 진행 중이면 그 결과를 기다림
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._load(key, query, max_results, include_domains))
+            self._inflight[key] = flight
+            flight.add_done_callback(partial(self._finish, key))
+        else:
+            self.coalesced += 1
+        # 검색은 별도 태스크에서 실행되므로 한 요청이 취소돼도 같은 검색을 기다리는 다른 요청은 영향받지 않음
+        return self._copy(await asyncio.shield(flight))
+        
+    async def _load(self, key: Tuple, query: str, max_results: int, include_domains: Optional[List[str]]) -> List[Dict]:
+        results = await self._load_shared(key)
+        if results is None:
+            self.misses += 1
+            kwargs = {"include_domains": include_domains} if include_domains else {}
+            results = await self.fetch(query, max_results, **kwargs)
+            if self.shared is not None:
+                await self.shared.set(self._shared_key(key), self._dumps(results), self.ttl)
+        else:
+            self.shared_hits += 1
+        self._results.set(key, (time.monotonic() + self.ttl, results))
+        return results
+        
+    def _finish(self, key: Tuple, flight: asyncio.Future):
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우에도 경고가 남지 않도록 예외를 소비
+        if not flight.cancelled():
+            flight.exception()
+            
+    async def _load_shared(self, key: Tuple) -> Optional[List[Dict]]:
+        if self.shared is None:
+            return None
+        value = await self.shared.get(self._shared_key(key))
+        return self._loads(value) if value is not None else None
+        
+    @staticmethod
+    def _shared_key(key: Tuple) -> str:
+        return json.dumps(key, ensure_ascii=False)
+        
+    @staticmethod
+    def _dumps(results: List[Dict]) -> str:
+        return json.dumps(results, ensure_ascii=False, default=lambda value: value.isoformat())
+        
+    @staticmethod
+    def _loads(value: str) -> List[Dict]:
+        results = json.loads(value)
+        for item in results:
+            if isinstance(item.get("timestamp"), str):
+                item["timestamp"] = datetime.fromisoformat(item["timestamp"])
+        return results
+        
+    @staticmethod
+    def _copy(results: List[Dict]) -> List[Dict]:
+        return [dict(item) for item in results]
+        
+    def stats(self) -> Dict:
+        return {"hits": self.hits, "shared_hits": self.shared_hits, "coalesced": self.coalesced, "misses": self.misses}
@@ -0,0 +1,70 @@
+from typing import Optional
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+
+class SQLiteCacheTier:
+    """여러 워커 프로세스가 함께 쓰는 SQLite 캐시 계층 (MongoCacheTier와 같은 get/set 인터페이스)
+
+    WAL 모드로 동시 읽기를 허용하고, 파일 I/O는 스레드에서 수행해 이벤트 루프를 막지 않는다.
+    같은 파일을 여러 용도로 쓸 수 있도록 namespace로 키를 구분한다.
+    """
+    def __init__(self, path: str, namespace: str, ttl_seconds: int = 7 * 24 * 60 * 60, purge_every: int = 500):
+        self.path = path
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.purge_every = purge_every
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM cache WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (self.namespace, key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, value: str, ttl_seconds: float):
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, value, time.time() + ttl_seconds)
+            )
+            # 만료 항목은 주기적으로 정리 (TTL 인덱스 대체)
+            self._writes += 1
+            if self._writes % self.purge_every == 0:
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        await asyncio.to_thread(self._set, key, value, ttl_seconds or self.ttl_seconds)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1 @@
+# jobs package 
\ No newline at end of file
@@ -0,0 +1,285 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import asyncio
+import os
+import socket
+import uuid
+
+from pymongo import ASCENDING, ReturnDocument
+
+from ..metrics.telemetry import log_error
+from ..ratelimit import limiter
+
+# 우선순위 (작을수록 먼저 처리)
+INTERACTIVE = 0
+SCHEDULED = 10
+
+# 저장소 오류가 이어질 때 워커가 다시 시도하기까지 기다리는 최대 시간(초)
+ERROR_BACKOFF_MAX = 60.0
+
+class MongoJobStore:
+    """수집 작업/저장 검색어의 MongoDB 저장소 (ingest_jobs, saved_queries, workflow_runs 컬렉션)"""
+    def __init__(self, db):
+        self.jobs = db.ingest_jobs
+        self.saved_queries = db.saved_queries
+        self.runs = db.workflow_runs
+        
+    async def init(self):
+        await self.jobs.create_index([("status", ASCENDING), ("priority", ASCENDING), ("created_at", ASCENDING)])
+        await self.jobs.create_index("finished_at", expireAfterSeconds=7 * 24 * 60 * 60)
+        
+    async def insert(self, job: Dict):
+        await self.jobs.insert_one(job)
+        
+    async def get(self, job_id: str) -> Optional[Dict]:
+        return await self.jobs.find_one({"_id": job_id})
+        
+    async def get_run(self, job_id: str) -> Optional[Dict]:
+        """작업의 워크플로우 체크포인트 (기사 목록/기사별 진행 상태)"""
+        return await self.runs.find_one({"_id": job_id}, {"items.title": 1, "articles": 1})
+        
+    async def claim(self, worker_id: str, lease_seconds: int) -> Optional[Dict]:
+        """대기 중이거나 lease가 만료된 작업을 우선순위 순으로 원자적으로 점유"""
+        now = datetime.now()
+        return await self.jobs.find_one_and_update(
+            {"$or": [
+                {"status": "queued"},
+                {"status": "running", "lease_until": {"$lt": now}}
+            ]},
+            {
+                "$set": {
+                    "status": "running",
+                    "worker": worker_id,
+                    "started_at": now,
+                    "lease_until": now + timedelta(seconds=lease_seconds)
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("priority", ASCENDING), ("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER
+        )
+        
+    async def renew(self, job_id: str, worker_id: str, lease_seconds: int):
+        await self.jobs.update_one(
+            {"_id": job_id, "worker": worker_id},
+            {"$set": {"lease_until": datetime.now() + timedelta(seconds=lease_seconds)}}
+        )
+        
+    async def release(self, job_id: str, worker_id: str):
+        """점유 해제 후 다시 대기 상태로 (종료로 중단된 것이므로 시도 횟수에서 제외)"""
+        await self.jobs.update_one(
+            {"_id": job_id, "worker": worker_id},
+            {"$set": {"status": "queued"}, "$unset": {"lease_until": "", "worker": ""}, "$inc": {"attempts": -1}}
+        )
+        
+    async def finish(self, job_id: str, update: Dict):
+        await self.jobs.update_one({"_id": job_id}, {"$set": update, "$unset": {"lease_until": ""}})
+        
+    async def add_saved_query(self, saved: Dict) -> str:
+        result = await self.saved_queries.insert_one(saved)
+        return str(result.inserted_id)
+        
+    async def next_due_saved_query(self, now: datetime) -> Optional[Dict]:
+        """실행 시각이 된 저장 검색어 하나를 꺼내고 다음 실행 시각을 갱신"""
+        return await self.saved_queries.find_one_and_update(
+            {"next_run_at": {"$lte": now}},
+            [{"$set": {"next_run_at": {"$add": [now, {"$multiply": ["$interval_seconds", 1000]}]}}}]
+        )
+
+class IngestionQueue:
+    """영속화되는 수집 작업 큐 (저장소는 storage.job_store()가 제공)
+    
+    워커는 우선순위/생성 순서대로 원자적으로 작업을 점유한다.
+    점유(lease)가 만료된 running 작업은 다른 워커가 다시 가져가므로 재시작 후에도 이어서 처리된다.
+    작업 id는 워크플로우 run_id로 쓰이므로 재실행 시 기사 단위 체크포인트부터 재개된다.
+    점유 횟수가 max_attempts를 넘은 작업(처리 중 워커 프로세스가 반복해서 죽은 작업)은 dead 상태로 종료한다.
+    """
+    def __init__(
+        self,
+        controller,
+        workers: int = 2,
+        lease_seconds: int = 300,
+        poll_interval: float = 5.0,
+        schedule_interval: float = 30.0,
+        max_attempts: int = 3
+    ):
+        self.controller = controller
+        self.store = controller.storage.job_store()
+        self.workers = workers
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.schedule_interval = schedule_interval
+        self.max_attempts = max_attempts
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._draining = False
+        
+    async def start(self):
+        """워커/스케줄러 시작"""
+        await self.store.init()
+        self._wakeup = asyncio.Event()
+        self._draining = False
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._scheduler_task = asyncio.create_task(self._scheduler())
+        
+    async def stop(self, timeout: float = 0.0):
+        """워커/스케줄러 종료
+        
+        새 작업 점유를 멈추고 진행 중 작업이 끝나기를 최대 timeout초 기다린다.
+        그때까지 끝나지 않은 작업은 다시 queued로 돌려 다른 워커가 체크포인트부터 이어서 처리한다.
+        """
+        self._draining = True
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            self._tasks.append(self._scheduler_task)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._tasks and timeout > 0:
+            await asyncio.wait(self._tasks, timeout=timeout)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._scheduler_task = None
+        
+    async def submit(
+        self,
+        query: str,
+        max_results: int = 10,
+        include_domains: Optional[List[str]] = None,
+        priority: int = INTERACTIVE,
+        source: str = "api"
+    ) -> str:
+        """수집 작업 등록 후 작업 id 반환"""
+        job_id = uuid.uuid4().hex
+        await self.store.insert({
+            "_id": job_id,
+            "query": query,
+            "max_results": max_results,
+            "include_domains": include_domains,
+            "priority": priority,
+            "source": source,
+            "status": "queued",
+            "created_at": datetime.now()
+        })
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job_id
+        
+    async def get(self, job_id: str) -> Optional[Dict]:
+        """작업 상태 및 기사 단위 진행률"""
+        job = await self.store.get(job_id)
+        if not job:
+            return None
+        run = await self.store.get_run(job_id)
+        if run and run.get("items") is not None:
+            articles = run.get("articles", {}).values()
+            job["progress"] = {
+                "total": len(run["items"]),
+                "summarized": sum(1 for article in articles if "summary" in article),
+                "analyzed": sum(1 for article in articles if "analysis" in article),
+                "saved": sum(1 for article in articles if article.get("saved"))
+            }
+        return job
+        
+    async def _renew_lease(self, job_id: str):
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await self.store.renew(job_id, self.worker_id, self.lease_seconds)
+            except Exception as e:
+                log_error("ingest.renew_lease", e, job_id=job_id)
+                
+    def _backoff(self, failures: int) -> float:
+        return min(self.poll_interval * 2 ** (failures - 1), ERROR_BACKOFF_MAX)
+        
+    async def _idle(self):
+        """새 작업 등록 알림 또는 poll_interval까지 대기"""
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+            
+    async def _worker(self):
+        failures = 0
+        while not self._draining:
+            try:
+                job = await self.store.claim(self.worker_id, self.lease_seconds)
+                if job is None:
+                    await self._idle()
+                elif job.get("attempts", 0) > self.max_attempts:
+                    await self._dead_letter(job)
+                else:
+                    await self._run(job)
+                failures = 0
+            except Exception as e:
+                # 저장소 일시 장애로 워커가 멈추지 않도록 기록 후 점점 길게 쉬었다가 재시도
+                failures += 1
+                log_error("ingest.worker", e, worker=self.worker_id, failures=failures)
+                await asyncio.sleep(self._backoff(failures))
+                
+    async def _dead_letter(self, job: Dict):
+        """반복해서 완료되지 못한 작업을 다시 점유하지 않도록 종료"""
+        await self.store.finish(job["_id"], {
+            "status": "dead",
+            "error": f"{job['attempts'] - 1}회 시도 후에도 완료되지 않아 중단했습니다.",
+            "finished_at": datetime.now()
+        })
+        
+    async def _run(self, job: Dict):
+        # 대화형 요청으로 등록된 작업은 대화형 몫, 주기 수집 등은 백그라운드 한도로 LLM/MCP 호출
+        interactive = job.get("priority", SCHEDULED) <= INTERACTIVE
+        limiter.request_priority.set(limiter.INTERACTIVE if interactive else limiter.BACKGROUND)
+        lease = asyncio.create_task(self._renew_lease(job["_id"]))
+        try:
+            result = await self.controller.execute_langgraph_workflow(
+                job["query"],
+                run_id=job["_id"],
+                max_results=job.get("max_results", 10),
+                include_domains=job.get("include_domains")
+            )
+            update = {"status": "done", "result": result}
+        except asyncio.CancelledError:
+            # 종료로 중단된 작업은 lease 만료를 기다리지 않고 바로 반환
+            await self.store.release(job["_id"], self.worker_id)
+            raise
+        except Exception as e:
+            update = {"status": "failed", "error": str(e)}
+        finally:
+            lease.cancel()
+        update["finished_at"] = datetime.now()
+        await self.store.finish(job["_id"], update)
+        
+    async def add_saved_query(self, query: str, interval_seconds: int, max_results: int = 10) -> str:
+        """주기 수집 검색어 등록"""
+        return await self.store.add_saved_query({
+            "query": query,
+            "interval_seconds": interval_seconds,
+            "max_results": max_results,
+            "next_run_at": datetime.now()
+        })
+        
+    async def _scheduler(self):
+        """실행 시각이 된 저장 검색어를 낮은 우선순위로 등록"""
+        while True:
+            try:
+                await self._submit_due(datetime.now())
+            except Exception as e:
+                # 다음 주기에 다시 시도 (이번 주기에 못 꺼낸 검색어는 next_run_at이 그대로 남음)
+                log_error("ingest.scheduler", e, worker=self.worker_id)
+            await asyncio.sleep(self.schedule_interval)
+            
+    async def _submit_due(self, now: datetime):
+        while True:
+            saved = await self.store.next_due_saved_query(now)
+            if saved is None:
+                return
+            await self.submit(
+                saved["query"],
+                max_results=saved.get("max_results", 10),
+                priority=SCHEDULED,
+                source="schedule"
+            )
@@ -1,19 +1,101 @@
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 from langchain.chat_models import ChatOpenAI
-from langchain.memory import ConversationBufferMemory
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, List, Dict, Optional
+import asyncio
+import json
 import os
+import re
+import time
+import uuid
 
 from .api.tavily_api import TavilyNewsAPI
-from .storage.news_storage import NewsStorage
+from .storage.backends import create_storage
+from .retrieval.retriever import SummaryRetriever
+from .text.keywords import KeywordExtractor
+from .text.dedup import cluster, encode, minhash, nearest
+from .text.chunking import TokenChunker, chunk_budget, strip_boilerplate
+from .cache.llm_cache import LLMResultCache, CachedChain
+from .cache.search_cache import SearchCache
+from .cache.shared_store import SQLiteCacheTier
+from .ratelimit.limiter import UpstreamLimiter, estimate_tokens
+from .metrics.telemetry import record_llm_usage, span
+
+# 긴 본문 기준 길이 (초과 시 청크 map-reduce 처리)
+LONG_CONTENT_LENGTH = 2000
+
+# 분석 결과 항목 (주요 이슈, 관계자/기관, 잠재적 영향, 관련 산업/분야)
+ANALYSIS_FIELDS = ["issues", "stakeholders", "impact", "industries"]
+
+def parse_digest(text: str) -> Dict:
+    """요약+분석 JSON 응답 파싱 (형식이 어긋나면 원문을 그대로 보존)"""
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    try:
+        data = json.loads(match.group(0)) if match else {}
+    except ValueError:
+        data = {}
+    if not isinstance(data, dict) or "summary" not in data:
+        return {"summary": (text or "").strip(), "analysis": {"full_analysis": (text or "").strip()}}
+    analysis = data.get("analysis") if isinstance(data.get("analysis"), dict) else {}
+    return {
+        "summary": str(data["summary"]).strip(),
+        "analysis": {field: analysis.get(field, "") for field in ANALYSIS_FIELDS}
+    }
+
+@dataclass
+class IngestStats:
+    """수집 실행 단위 처리량 통계"""
+    articles: int = 0
+    llm_calls: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    duplicates: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    elapsed: float = 0.0
+
+    @property
+    def articles_per_sec(self) -> float:
+        return self.articles / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "articles": self.articles,
+            "llm_calls": self.llm_calls,
+            "peak_in_flight": self.peak_in_flight,
+            "duplicates": self.duplicates,
+            "elapsed": round(self.elapsed, 3),
+            "articles_per_sec": round(self.articles_per_sec, 3)
+        }
 
 class LangChainController:
-    def __init__(self):
-        self.memory = ConversationBufferMemory(memory_key="chat_history")
-        self.tavily_api = TavilyNewsAPI()
-        self.storage = NewsStorage()
+    def __init__(self, max_concurrency: int = 8):
+        self._memory = None
+        self.keyword_extractor = KeywordExtractor()
+        
+        # 업스트림별 호출 한도 (요청/분, 토큰/분, 적응형 동시성)
+        self.llm_limiter = UpstreamLimiter(
+            "openai",
+            requests_per_minute=float(os.getenv("LLM_RPM", 3500)),
+            tokens_per_minute=float(os.getenv("LLM_TPM", 90000)),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", 32))
+        )
+        self.mcp_limiter = UpstreamLimiter(
+            "tavily_mcp",
+            requests_per_minute=float(os.getenv("TAVILY_RPM", 600)),
+            max_concurrency=int(os.getenv("TAVILY_MAX_CONCURRENCY", 16))
+        )
+        
+        # 워커 프로세스 간 공유 캐시 파일 (SHARED_CACHE_PATH 설정 시 검색/LLM 결과 공유)
+        self.shared_cache_path = os.getenv("SHARED_CACHE_PATH")
+        
+        self.tavily_api = TavilyNewsAPI(keyword_extractor=self.keyword_extractor, limiter=self.mcp_limiter)
+        self.search_cache = SearchCache(
+            self.tavily_api.search_news,
+            ttl=float(os.getenv("SEARCH_CACHE_TTL", 60)),
+            shared=SQLiteCacheTier(self.shared_cache_path, "search") if self.shared_cache_path else None
+        )
+        self.storage = create_storage()
         self.smithery_api_key = os.getenv("SMITHERY_API_KEY")
         if not self.smithery_api_key:
             raise ValueError("SMITHERY_API_KEY 환경 변수가 설정되지 않았습니다.")
@@ -55,89 +137,257 @@ class LangChainController:
             """
         )
         
+        # LLM 결과 캐시 영구 계층
+        # LLM_CACHE_PERSIST=mongo|storage 이면 뉴스 저장소, disk 이면 로컬 파일(LLM_CACHE_PATH), 아니면 공유 캐시 파일
+        persistent = None
+        llm_cache_ttl = int(os.getenv("LLM_CACHE_TTL", 7 * 24 * 60 * 60))
+        llm_cache_persist = os.getenv("LLM_CACHE_PERSIST")
+        if llm_cache_persist in ("mongo", "storage"):
+            persistent = self.storage.cache_tier("llm", llm_cache_ttl)
+        elif llm_cache_persist == "disk":
+            path = os.getenv("LLM_CACHE_PATH") or self.shared_cache_path or "llm_cache.db"
+            persistent = SQLiteCacheTier(path, "llm", ttl_seconds=llm_cache_ttl)
+        elif self.shared_cache_path:
+            persistent = SQLiteCacheTier(self.shared_cache_path, "llm", ttl_seconds=llm_cache_ttl)
+        self.llm_cache = LLMResultCache(
+            max_size=int(os.getenv("LLM_CACHE_SIZE", 1024)),
+            persistent=persistent
+        )
+        
         # 요약 체인
-        self.summary_chain = LLMChain(
+        self.summary_chain = CachedChain(LLMChain(
             llm=self.llm,
-            prompt=self.summary_prompt,
-            verbose=True
-        )
+            prompt=self.summary_prompt
+        ), self.llm_cache, self.llm_limiter, name="summary")
         
         # 분석 체인
-        self.analysis_chain = LLMChain(
+        self.analysis_chain = CachedChain(LLMChain(
             llm=self.llm,
-            prompt=self.analysis_prompt,
-            verbose=True
+            prompt=self.analysis_prompt
+        ), self.llm_cache, self.llm_limiter, name="analysis")
+        
+        # 요약+분석 통합 프롬프트 (긴 본문의 청크 map 단계)
+        self.digest_prompt = PromptTemplate(
+            input_variables=["content"],
+            template="""
+            다음 뉴스 기사 일부를 요약하고 분석해주세요.
+            아래 JSON 형식으로만 답해주세요.
+            {{"summary": "3-4문장 요약",
+              "analysis": {{"issues": "주요 이슈", "stakeholders": "영향력 있는 관계자/기관",
+                           "impact": "잠재적 영향", "industries": "관련 산업/분야"}}}}
+            
+            기사 내용:
+            {content}
+            """
+        )
+        
+        # 부분 결과 병합 프롬프트 (reduce 단계)
+        self.reduce_prompt = PromptTemplate(
+            input_variables=["content"],
+            template="""
+            다음은 같은 뉴스 기사의 여러 부분에 대한 요약/분석 결과입니다.
+            중복을 제거하고 하나의 일관된 결과로 통합해주세요.
+            요약은 3-4문장, 분석 항목은 각각 2문장 이내로 작성하고
+            입력과 같은 JSON 형식으로만 답해주세요.
+            
+            부분 결과:
+            {content}
+            """
         )
         
-        # 텍스트 분할기
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=2000,
-            chunk_overlap=200
+        # 질의응답 프롬프트 (RAG)
+        self.qa_prompt = PromptTemplate(
+            input_variables=["question", "context"],
+            template="""
+            아래 뉴스 요약들만 근거로 질문에 답해주세요.
+            근거가 부족하면 모른다고 답해주세요.
+            
+            뉴스 요약:
+            {context}
+            
+            질문: {question}
+            
+            답변:
+            """
         )
+        self.digest_chain = CachedChain(LLMChain(
+            llm=self.llm,
+            prompt=self.digest_prompt
+        ), self.llm_cache, self.llm_limiter, name="digest")
+        self.reduce_chain = CachedChain(LLMChain(
+            llm=self.llm,
+            prompt=self.reduce_prompt
+        ), self.llm_cache, self.llm_limiter, name="reduce")
+        self.reduce_fanin = int(os.getenv("REDUCE_FANIN", 6))
         
-    async def process_news_command(self, command: str):
+        self.qa_chain = LLMChain(
+            llm=self.llm,
+            prompt=self.qa_prompt
+        )
+        
+        # 요약 벡터 검색 (VECTOR_INDEX_PATH 지정 시 디스크에 저장)
+        self.retriever = SummaryRetriever(
+            self.storage,
+            index_path=os.getenv("VECTOR_INDEX_PATH")
+        )
+        
+        # 텍스트 분할기 (통합 프롬프트와 출력 토큰을 뺀 예산 안에서 문단/문장 경계로 분할)
+        self.text_splitter = TokenChunker(
+            max_tokens=chunk_budget(
+                self.digest_chain.model_name,
+                estimate_tokens(self.digest_prompt.template),
+                self.digest_chain.max_output_tokens,
+                int(os.getenv("CHUNK_MAX_TOKENS", 2000))
+            ),
+            overlap_tokens=int(os.getenv("CHUNK_OVERLAP_TOKENS", 40))
+        )
+        
+        # 동시 LLM 호출 상한 (기사/청크 전체에 걸쳐 공유)
+        self.max_concurrency = int(os.getenv("NEWS_MAX_CONCURRENCY", max_concurrency))
+        self.last_ingest_stats: Optional[IngestStats] = None
+        
+        # 근접 중복 기사 묶음 기준 (최근 DEDUP_DAYS일 헤드라인, 토큰 2-gram 자카드 유사도 추정치)
+        self.dedup_days = int(os.getenv("DEDUP_DAYS", 3))
+        self.dedup_threshold = float(os.getenv("DEDUP_THRESHOLD", 0.6))
+        
+        # 요약 일괄 기록 단위 (실행마다 자기 요약만 나눠서 기록)
+        self.summary_batch_size = int(os.getenv("SUMMARY_BATCH_SIZE", 50))
+        
+        # 수집/질의응답 워크플로우 (최초 실행 시 구성)
+        self._workflow = None
+        
+    async def process_news_command(self, command: str, max_results: int = 10):
         """뉴스 수집 명령 처리"""
         search_query = command.replace("뉴스 검색", "").replace("뉴스 수집", "").strip()
         if not search_query:
             raise ValueError("검색어를 입력해주세요.")
             
-        # Tavily API로 뉴스 검색
-        news_items = await self.tavily_api.search_news(search_query)
-        
-        # 검색 결과 처리 및 저장
-        for item in news_items:
-            # 헤드라인 저장
-            headline_id = await self.storage.save_headline({
-                "title": item["title"],
-                "url": item["url"],
-                "source": item["source"],
-                "keywords": item["keywords"]
-            })
-            
-            # 본문 분할 (긴 텍스트 처리)
-            content = item["content"]
-            if len(content) > 2000:
-                chunks = self.text_splitter.split_text(content)
-                summaries = []
-                analyses = []
+        result = await self.execute_langgraph_workflow(search_query, max_results=max_results)
+        return result["message"]
+        
+    async def collect_news(self, query: str, max_results: int = 10, include_domains: Optional[List[str]] = None) -> List[Dict]:
+        """Tavily 검색 후 새 기사를 키워드 DF 통계에 반영"""
+        # Tavily API로 뉴스 검색 (동일 검색어는 캐시/진행 중 요청 공유)
+        news_items = await self.search_cache.search(query, max_results, include_domains)
+        
+        # 새로 수집된 기사만 키워드 DF 통계에 반영
+        existing = await self.storage.existing_urls([item["url"] for item in news_items])
+        self.keyword_extractor.observe(
+            f"{item['title'] or ''} {item['content'] or ''}"
+            for item in news_items if item["url"] not in existing
+        )
+        await self.storage.update_term_stats(*self.keyword_extractor.drain())
+        await self.mark_duplicates(news_items)
+        return news_items
+        
+    async def mark_duplicates(self, news_items: List[Dict]):
+        """같은 기사의 다른 출처 사본 표시
+        
+        배치 안에서 MinHash 유사도가 높은 기사끼리 묶어 첫 기사만 대표로 남기고(duplicate_of = 대표 순번),
+        대표가 최근 저장된 헤드라인과 유사하면 묶음 전체를 그 헤드라인에 연결한다(canonical_id).
+        중복으로 표시된 기사는 요약/분석하지 않는다.
+        """
+        signatures = [minhash(f"{item['title'] or ''} {item['content'] or ''}") for item in news_items]
+        roots = cluster(signatures, self.dedup_threshold)
+        candidates = await self.storage.find_near_duplicates(signatures, self.dedup_days)
+        
+        canonical_ids = {}
+        for i, (item, signature, root) in enumerate(zip(news_items, signatures, roots)):
+            item["minhash"] = encode(signature)
+            if root != i:
+                continue
+            # 같은 URL을 다시 수집한 경우는 중복으로 보지 않음
+            match = nearest(signature, [c for c in candidates if c.get("url") != item["url"]], self.dedup_threshold)
+            if match is not None:
+                canonical_ids[i] = match["_id"]
                 
-                # 각 청크별 요약 및 분석
-                for chunk in chunks:
-                    summary = await self.summary_chain.arun(content=chunk)
-                    analysis = await self.analysis_chain.arun(content=chunk)
-                    summaries.append(summary)
-                    analyses.append(analysis)
+        for i, (item, root) in enumerate(zip(news_items, roots)):
+            if root in canonical_ids:
+                item["canonical_id"] = canonical_ids[root]
+            elif root != i:
+                item["duplicate_of"] = str(root)
                 
-                # 최종 요약 및 분석 결합
-                final_summary = " ".join(summaries)
-                final_analysis = self._combine_analyses(analyses)
-            else:
-                # 짧은 텍스트는 직접 처리
-                final_summary = await self.summary_chain.arun(content=content)
-                final_analysis = await self.analysis_chain.arun(content=content)
-            
-            # 요약 정보 저장
-            await self.storage.save_summary({
-                "headline_id": headline_id,
-                "content": content,
-                "summary": final_summary,
-                "analysis": final_analysis
-            })
+    async def link_duplicates(self, news_items: List[Dict], headline_ids: Dict[str, Any], keys: List[str]):
+        """저장된 중복 헤드라인을 대표 헤드라인에 연결"""
+        links = {}
+        for key in keys:
+            item = news_items[int(key)]
+            if "canonical_id" in item:
+                links[headline_ids[key]] = item["canonical_id"]
+            elif "duplicate_of" in item:
+                links[headline_ids[key]] = headline_ids[item["duplicate_of"]]
+        if links:
+            await self.storage.link_duplicates(links)
+        
+    async def save_headlines(self, news_items: List[Dict]) -> List:
+        """헤드라인 일괄 저장 (URL 기준 upsert)"""
+        return await self.storage.save_headlines_bulk([{
+            "title": item["title"],
+            "url": item["url"],
+            "source": item["source"],
+            "keywords": item["keywords"],
+            "minhash": item.get("minhash")
+        } for item in news_items])
+        
+    def is_long(self, content: str) -> bool:
+        return len(content or "") > LONG_CONTENT_LENGTH
+        
+    async def summarize_article(self, content: str, semaphore: asyncio.Semaphore, stats: IngestStats) -> str:
+        """짧은 기사 요약"""
+        return await self._run_chain(self.summary_chain, strip_boilerplate(content), semaphore, stats)
+        
+    async def analyze_article(self, content: str, semaphore: asyncio.Semaphore, stats: IngestStats) -> str:
+        """짧은 기사 분석"""
+        return await self._run_chain(self.analysis_chain, strip_boilerplate(content), semaphore, stats)
+        
+    async def digest_article(self, content: str, semaphore: asyncio.Semaphore, stats: IngestStats) -> Dict:
+        """긴 기사 요약+분석 (청크별 통합 프롬프트 map 후 계층적 reduce)
+        
+        LLM 호출 수는 청크 n개에 대해 약 n * fanin / (fanin - 1)회이며,
+        결과 크기는 청크 수와 무관하게 한 건의 요약/분석으로 유지된다.
+        """
+        with span("split_text"):
+            chunks = self.text_splitter.split_text(content)
+        partials = await asyncio.gather(*(
+            self._run_chain(self.digest_chain, chunk, semaphore, stats) for chunk in chunks
+        ))
+        results = [parse_digest(partial) for partial in partials]
+        
+        # fanin개씩 묶어 하나가 남을 때까지 병합
+        while len(results) > 1:
+            groups = [results[i:i + self.reduce_fanin] for i in range(0, len(results), self.reduce_fanin)]
+            merged = await asyncio.gather(*(
+                self._run_chain(self.reduce_chain, json.dumps(group, ensure_ascii=False), semaphore, stats)
+                if len(group) > 1 else self._passthrough(group[0])
+                for group in groups
+            ))
+            results = [parse_digest(text) if isinstance(text, str) else text for text in merged]
             
-        return f"{len(news_items)}개의 뉴스를 수집하고 분석했습니다."
+        result = results[0]
+        result["analysis"]["chunks_count"] = len(chunks)
+        return result
         
-    def _combine_analyses(self, analyses: List[str]) -> Dict:
-        """여러 분석 결과 통합"""
-        # TODO: 더 나은 통합 로직 구현
-        combined = "\n".join(analyses)
-        return {
-            "full_analysis": combined,
-            "chunks_count": len(analyses)
-        }
+    async def _passthrough(self, result: Dict) -> Dict:
+        return result
+        
+    async def _run_chain(self, chain, content: str, semaphore: asyncio.Semaphore, stats: IngestStats) -> str:
+        """동시 호출 상한 안에서 체인 실행"""
+        async with semaphore:
+            stats.llm_calls += 1
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+            try:
+                return await chain.arun(content=content)
+            finally:
+                stats.in_flight -= 1
+        
+    async def load_keyword_stats(self):
+        """저장된 키워드 DF 통계 불러오기"""
+        self.keyword_extractor.load(*await self.storage.load_term_stats())
         
-    async def call_tavily_api(self, query: str) -> List[Dict]:
+    async def call_tavily_api(self, query: str, max_results: int = 10) -> List[Dict]:
         """Tavily API 직접 호출"""
-        return await self.tavily_api.search_news(query)
+        return await self.search_cache.search(query, max_results)
         
     async def analyze_news(self, content: str) -> Dict:
         """뉴스 내용 분석"""
@@ -149,13 +399,83 @@ class LangChainController:
         summary = await self.summary_chain.arun(content=content)
         return {"summary": summary}
         
+    def stream_analysis(self, content: str) -> AsyncIterator[str]:
+        """뉴스 내용 분석 (토큰 스트리밍)"""
+        return self.analysis_chain.astream(content)
+        
+    def stream_summary(self, content: str) -> AsyncIterator[str]:
+        """뉴스 내용 요약 (토큰 스트리밍)"""
+        return self.summary_chain.astream(content)
+        
+    async def answer_question(self, question: str, k: int = 5, days: Optional[int] = None) -> Dict:
+        """저장된 요약 기반 질의응답 (RAG)"""
+        docs = await self.retriever.search(question, k, days)
+        if not docs:
+            return {"answer": "관련된 뉴스 요약을 찾지 못했습니다.", "sources": []}
+            
+        context = "\n\n".join(f"[{i + 1}] {doc['summary']}" for i, doc in enumerate(docs))
+        prompt_tokens = estimate_tokens(self.qa_prompt.template) + estimate_tokens(context) + estimate_tokens(question)
+        async with self.llm_limiter.slot(tokens=prompt_tokens + 512):
+            with span("llm.arun", chain="qa"):
+                answer = await self.qa_chain.arun(question=question, context=context)
+        record_llm_usage("qa", self.llm.model_name, prompt_tokens, estimate_tokens(answer))
+        return {
+            "answer": answer,
+            "sources": [{"headline_id": str(doc["headline_id"]), "score": doc["score"]} for doc in docs]
+        }
+        
     async def call_think_mcp(self):
         """Think MCP API 호출"""
         # TODO: Think MCP 구현
         pass
         
-    async def execute_langgraph_workflow(self):
-        """LangGraph Workflow 실행"""
-        # TODO: LangGraph 워크플로우 구현
-        pass 
+    @property
+    def memory(self):
+        """대화 메모리 (처음 사용할 때 생성)"""
+        if self._memory is None:
+            from langchain.memory import ConversationBufferMemory
+            self._memory = ConversationBufferMemory(memory_key="chat_history")
+        return self._memory
+        
+    @property
+    def workflow(self):
+        """LangGraph 워크플로우 (첫 실행 시점에 import 및 컴파일)"""
+        if self._workflow is None:
+            from .langgraph_workflow import NewsWorkflow
+            self._workflow = NewsWorkflow(self).build_workflow()
+        return self._workflow
+        
+    async def execute_langgraph_workflow(
+        self,
+        query: str,
+        run_id: Optional[str] = None,
+        max_results: int = 10,
+        include_domains: Optional[List[str]] = None
+    ) -> Dict:
+        """LangGraph Workflow 실행 (같은 run_id로 다시 실행하면 체크포인트부터 이어서 처리)"""
+        run_id = run_id or uuid.uuid4().hex
+        stats = IngestStats()
+        state = await self.workflow.ainvoke(
+            {"query": query, "run_id": run_id, "max_results": max_results, "include_domains": include_domains},
+            config={
+                "configurable": {
+                    "thread_id": run_id,
+                    "semaphore": asyncio.Semaphore(self.max_concurrency),
+                    "stats": stats
+                }
+            }
+        )
+        stats.elapsed = time.perf_counter() - stats.started_at
+        self.last_ingest_stats = stats
+        
+        count = state.get("saved", 0)
+        return {
+            "run_id": run_id,
+            "count": count,
+            "stats": stats.to_dict(),
+            "message": (
+                f"{count}개의 뉴스를 수집하고 분석했습니다. "
+                f"({stats.articles_per_sec:.2f}건/초, 최대 동시 LLM 호출 {stats.peak_in_flight}건)"
+            )
+        } 
  
\ No newline at end of file
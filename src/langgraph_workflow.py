@@ -1,31 +1,198 @@
-from typing import Dict, Any
-from langgraph.graph import Graph, StateGraph
+from typing import Annotated, Dict, Any, List, Optional, TypedDict
+import asyncio
 
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import Graph, StateGraph, START, END
+
+from .text.dedup import is_duplicate
+
+def merge_dicts(left: Dict, right: Dict) -> Dict:
+    """병렬 브랜치의 기사별 결과 병합"""
+    return {**(left or {}), **(right or {})}
+
+class NewsState(TypedDict, total=False):
+    """워크플로우 상태 (기사 키는 검색 결과 내 순번 문자열)"""
+    # 수집
+    query: str
+    run_id: str
+    max_results: int
+    include_domains: Optional[List[str]]
+    items: List[Dict]
+    progress: Dict[str, Dict]
+    headline_ids: Dict[str, Any]
+    summaries: Dict[str, str]
+    analyses: Annotated[Dict[str, Any], merge_dicts]
+    saved: int
+    
+    # 질의응답
+    question: str
+    k: int
+    days: Optional[int]
+    answer: str
+    sources: List[Dict]
+    
 class NewsWorkflow:
-    def __init__(self):
-        self.graph = StateGraph()
+    def __init__(self, controller=None, checkpointer=None):
+        self.controller = controller
+        self.checkpointer = checkpointer  # LangGraph 체크포인터 (선택)
+        self.checkpoints = controller.storage.checkpoint_store() if controller else None
+        self.graph = StateGraph(NewsState)
+        
+    def _runtime(self, config: RunnableConfig):
+        """실행 단위 동시성 제한/통계 객체"""
+        configurable = config.get("configurable", {})
+        return configurable["semaphore"], configurable["stats"]
+        
+    def _pending(self, state: NewsState, field: str, long: Optional[bool] = None, canonical: bool = False) -> List[str]:
+        """체크포인트에 해당 필드가 없는 기사 키 (long 지정 시 본문 길이로, canonical이면 중복 기사 제외)"""
+        progress = state.get("progress", {})
+        return [
+            str(i) for i, item in enumerate(state["items"])
+            if field not in progress.get(str(i), {})
+            and (long is None or self.controller.is_long(item["content"]) == long)
+            and not (canonical and is_duplicate(item))
+        ]
         
     async def collect_news_node(self, state: Dict[str, Any]):
         """뉴스 수집 노드"""
-        pass
+        run = await self.checkpoints.load(state["run_id"])
+        if run and run.get("items") is not None:
+            # 재시작: 저장된 검색 결과와 기사별 진행 상태로 이어서 실행
+            return {"items": run["items"], "progress": run.get("articles", {})}
+            
+        await self.checkpoints.start(state["run_id"], state["query"])
+        items = await self.controller.collect_news(
+            state["query"],
+            state.get("max_results", 10),
+            state.get("include_domains")
+        )
+        await self.checkpoints.save_items(state["run_id"], items)
+        return {"items": items, "progress": {}}
         
     async def save_headline_node(self, state: Dict[str, Any]):
         """헤드라인 저장 노드"""
-        pass
+        progress = state.get("progress", {})
+        headline_ids = {
+            key: values["headline_id"] for key, values in progress.items() if "headline_id" in values
+        }
+        pending = self._pending(state, "headline_id")
+        if pending:
+            ids = await self.controller.save_headlines([state["items"][int(key)] for key in pending])
+            headline_ids.update(zip(pending, ids))
+            await self.controller.link_duplicates(state["items"], headline_ids, pending)
+            await self.checkpoints.update_articles(state["run_id"], {
+                key: {"headline_id": headline_id} for key, headline_id in zip(pending, ids)
+            })
+        return {"headline_ids": headline_ids}
+        
+    async def _run_articles(self, state: NewsState, keys: List[str], process) -> Dict[str, Dict]:
+        """기사별 LLM 처리 후 완료될 때마다 체크포인트 기록 (process는 {필드: 값} 반환)"""
+        results = {}
+        
+        async def run(key: str):
+            values = await process(state["items"][int(key)]["content"])
+            await self.checkpoints.update_articles(state["run_id"], {key: values})
+            results[key] = values
+            
+        await asyncio.gather(*(run(key) for key in keys))
+        return results
+        
+    def _completed(self, state: NewsState, field: str) -> Dict[str, Any]:
+        """체크포인트에 이미 기록된 기사별 값"""
+        return {
+            key: values[field] for key, values in state.get("progress", {}).items() if field in values
+        }
         
-    async def save_summary_node(self, state: Dict[str, Any]):
+    async def summarize_node(self, state: Dict[str, Any], config: RunnableConfig):
+        """본문 요약 노드 (긴 본문은 요약과 분석을 한 번에 처리)"""
+        semaphore, stats = self._runtime(config)
+        
+        async def summarize(content: str) -> Dict:
+            return {"summary": await self.controller.summarize_article(content, semaphore, stats)}
+            
+        async def digest(content: str) -> Dict:
+            return await self.controller.digest_article(content, semaphore, stats)
+            
+        short, long = await asyncio.gather(
+            self._run_articles(state, self._pending(state, "summary", long=False, canonical=True), summarize),
+            self._run_articles(state, self._pending(state, "summary", long=True, canonical=True), digest)
+        )
+        summaries = self._completed(state, "summary")
+        summaries.update({key: values["summary"] for key, values in {**short, **long}.items()})
+        return {
+            "summaries": summaries,
+            "analyses": {key: values["analysis"] for key, values in long.items()}
+        }
+        
+    async def save_summary_node(self, state: Dict[str, Any], config: RunnableConfig):
         """본문 요약 저장 노드"""
-        pass
+        _, stats = self._runtime(config)
+        pending = self._pending(state, "saved", canonical=True)
+        
+        # 실행마다 자기 요약만 일괄 기록하고, 기록된 묶음만 체크포인트에 저장 완료로 표시
+        size = self.controller.summary_batch_size
+        for start in range(0, len(pending), size):
+            keys = pending[start:start + size]
+            await self.controller.storage.save_summaries_bulk([
+                {
+                    "headline_id": state["headline_ids"][key],
+                    "content": state["items"][int(key)]["content"],
+                    "summary": state["summaries"][key],
+                    "analysis": state["analyses"][key]
+                }
+                for key in keys
+            ])
+            await self.checkpoints.update_articles(state["run_id"], {key: {"saved": True} for key in keys})
+        await self.checkpoints.finish(state["run_id"])
+        stats.articles += len(pending)
+        stats.duplicates = sum(1 for item in state["items"] if is_duplicate(item))
+        # 중복으로 건너뛴 기사는 제외 (재시작 전에 저장한 기사는 포함)
+        return {"saved": len(self._completed(state, "saved")) + len(pending)}
         
     async def rag_qa_node(self, state: Dict[str, Any]):
         """RAG 질의응답 처리 노드"""
-        pass
+        result = await self.controller.answer_question(
+            state["question"],
+            k=state.get("k", 5),
+            days=state.get("days")
+        )
+        return {"answer": result["answer"], "sources": result["sources"]}
+        
+    async def process_analysis_node(self, state: Dict[str, Any], config: RunnableConfig):
+        """분석 결과 처리 노드 (긴 본문의 분석은 요약 노드에서 함께 생성)"""
+        semaphore, stats = self._runtime(config)
         
-    async def process_analysis_node(self, state: Dict[str, Any]):
-        """분석 결과 처리 노드"""
-        pass
+        async def analyze(content: str) -> Dict:
+            return {"analysis": await self.controller.analyze_article(content, semaphore, stats)}
+            
+        results = await self._run_articles(state, self._pending(state, "analysis", long=False, canonical=True), analyze)
+        analyses = self._completed(state, "analysis")
+        analyses.update({key: values["analysis"] for key, values in results.items()})
+        return {"analyses": analyses}
+        
+    def _route(self, state: NewsState) -> str:
+        return "rag_qa" if state.get("question") else "collect_news"
         
     def build_workflow(self):
-        """워크플로우 구성"""
-        # 노드 연결 및 워크플로우 구성
-        pass 
\ No newline at end of file
+        """워크플로우 구성
+        
+        collect_news ─┬─ save_headline ────┐
+                      ├─ summarize ────────┼─ save_summary
+                      └─ process_analysis ─┘
+        (question이 주어지면 rag_qa만 실행)
+        """
+        self.graph.add_node("collect_news", self.collect_news_node)
+        self.graph.add_node("save_headline", self.save_headline_node)
+        self.graph.add_node("summarize", self.summarize_node)
+        self.graph.add_node("process_analysis", self.process_analysis_node)
+        self.graph.add_node("save_summary", self.save_summary_node)
+        self.graph.add_node("rag_qa", self.rag_qa_node)
+        
+        self.graph.add_conditional_edges(START, self._route, ["collect_news", "rag_qa"])
+        for branch in ("save_headline", "summarize", "process_analysis"):
+            self.graph.add_edge("collect_news", branch)
+        self.graph.add_edge(["save_headline", "summarize", "process_analysis"], "save_summary")
+        self.graph.add_edge("save_summary", END)
+        self.graph.add_edge("rag_qa", END)
+        
+        return self.graph.compile(checkpointer=self.checkpointer)
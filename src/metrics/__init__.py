@@ -0,0 +1 @@
+# metrics package 
\ No newline at end of file
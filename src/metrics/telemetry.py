@@ -0,0 +1,237 @@
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import time
+import traceback
+
+# 지연 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 모델별 1K 토큰당 가격 (USD, 입력/출력)
+MODEL_PRICES = {
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4o": (0.0025, 0.01)
+}
+
+# 요청 단위 트레이스 (디버그 헤더가 있는 요청에서만 리스트가 설정됨)
+current_trace: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("current_trace", default=None)
+
+logger = logging.getLogger("news")
+
+# 구조화 로그 샘플링 비율 (0이면 기록하지 않음)
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", 0.01))
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _format_labels(labels: Tuple, extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram 형식)"""
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+class MetricsRegistry:
+    """프로세스 단위 카운터/히스토그램 저장소"""
+    def __init__(self):
+        self.counters: Dict[str, Dict[Tuple, float]] = defaultdict(lambda: defaultdict(float))
+        self.histograms: Dict[str, Dict[Tuple, Histogram]] = defaultdict(dict)
+        self.descriptions: Dict[str, str] = {}
+
+    def describe(self, name: str, description: str):
+        self.descriptions[name] = description
+
+    def inc(self, name: str, value: float = 1.0, **labels):
+        self.counters[name][tuple(sorted(labels.items()))] += value
+
+    def observe(self, name: str, value: float, **labels):
+        series = self.histograms[name]
+        key = tuple(sorted(labels.items()))
+        if key not in series:
+            series[key] = Histogram()
+        series[key].observe(value)
+
+    def snapshot(self) -> Dict:
+        """JSON으로 기록할 수 있는 현재 값 (다른 워커 프로세스와 합산용)"""
+        return {
+            "counters": {
+                name: [[list(labels), value] for labels, value in series.items()]
+                for name, series in self.counters.items()
+            },
+            "histograms": {
+                name: [[list(labels), histogram.counts, histogram.count, histogram.sum] for labels, histogram in series.items()]
+                for name, series in self.histograms.items()
+            }
+        }
+
+    def merge(self, snapshot: Dict):
+        """다른 프로세스의 스냅샷 값을 더함 (히스토그램 구간은 DEFAULT_BUCKETS로 같음)"""
+        for name, series in snapshot["counters"].items():
+            for labels, value in series:
+                self.counters[name][tuple(map(tuple, labels))] += value
+        for name, series in snapshot["histograms"].items():
+            for labels, counts, count, total in series:
+                histogram = self.histograms[name].setdefault(tuple(map(tuple, labels)), Histogram())
+                histogram.counts = [a + b for a, b in zip(histogram.counts, counts)]
+                histogram.count += count
+                histogram.sum += total
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines = []
+        for name, series in sorted(self.counters.items()):
+            if name in self.descriptions:
+                lines.append(f"# HELP {name} {self.descriptions[name]}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in sorted(series.items()):
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+        for name, series in sorted(self.histograms.items()):
+            if name in self.descriptions:
+                lines.append(f"# HELP {name} {self.descriptions[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in sorted(series.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    bucket = _format_labels(labels, 'le="%s"' % bound)
+                    lines.append(f"{name}_bucket{bucket} {cumulative}")
+                bucket = _format_labels(labels, 'le="+Inf"')
+                lines.append(f"{name}_bucket{bucket} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+metrics.describe("news_span_seconds", "Duration of instrumented operations")
+metrics.describe("news_http_request_seconds", "HTTP request latency by route")
+metrics.describe("news_llm_tokens_total", "Estimated LLM tokens by chain")
+metrics.describe("news_llm_cost_usd_total", "Estimated LLM cost by chain")
+metrics.describe("news_llm_cache_total", "LLM result cache lookups by chain")
+metrics.describe("news_background_errors_total", "Errors caught in background loops by task")
+
+def clear_snapshots(directory: str):
+    """워커 지표 스냅샷 디렉터리 준비 (이전 실행의 스냅샷 삭제)"""
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.endswith(".json"):
+            os.remove(os.path.join(directory, name))
+
+def write_snapshot(directory: str):
+    """이 프로세스의 지표를 <directory>/<pid>.json에 원자적으로 기록"""
+    path = os.path.join(directory, f"{os.getpid()}.json")
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(metrics.snapshot(), f)
+    os.replace(f"{path}.tmp", path)
+
+def render_all(directory: str) -> str:
+    """디렉터리의 모든 워커 스냅샷을 합산한 Prometheus 텍스트
+
+    종료/재시작된 워커의 스냅샷도 남겨 두고 합산하므로 카운터 합계가 줄어들지 않는다.
+    """
+    combined = MetricsRegistry()
+    combined.descriptions = dict(metrics.descriptions)
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as f:
+                combined.merge(json.load(f))
+        except (OSError, ValueError):
+            # 기록 중이거나 지워진 파일은 건너뜀
+            continue
+    return combined.render()
+
+@contextmanager
+def span(name: str, **labels):
+    """구간 소요 시간을 히스토그램과 (활성화된 경우) 요청 트레이스에 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        metrics.observe("news_span_seconds", elapsed, span=name, **labels)
+        trace = current_trace.get()
+        if trace is not None:
+            trace.append((".".join([name, *map(str, labels.values())]), elapsed))
+
+def timed(name: str):
+    """비동기 함수/비동기 제너레이터 전체 실행 시간을 span으로 기록하는 데코레이터"""
+    def decorator(fn):
+        if inspect.isasyncgenfunction(fn):
+            @functools.wraps(fn)
+            async def generator_wrapper(*args, **kwargs):
+                with span(name):
+                    async for item in fn(*args, **kwargs):
+                        yield item
+            return generator_wrapper
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def server_timing(trace: List[Tuple[str, float]]) -> str:
+    """트레이스를 Server-Timing 헤더 값으로 변환 (같은 구간은 합산)"""
+    totals: Dict[str, List[float]] = {}
+    for name, elapsed in trace:
+        total = totals.setdefault(name, [0.0, 0])
+        total[0] += elapsed
+        total[1] += 1
+    return ", ".join(
+        f'{name};dur={elapsed * 1000:.1f};desc="x{count}"' for name, (elapsed, count) in totals.items()
+    )
+
+def record_llm_usage(chain: str, model: str, prompt_tokens: int, completion_tokens: int):
+    """체인별 토큰/비용 누적"""
+    metrics.inc("news_llm_tokens_total", prompt_tokens, chain=chain, kind="prompt")
+    metrics.inc("news_llm_tokens_total", completion_tokens, chain=chain, kind="completion")
+    price = MODEL_PRICES.get(model)
+    if price is not None:
+        metrics.inc("news_llm_cost_usd_total", (prompt_tokens * price[0] + completion_tokens * price[1]) / 1000, chain=chain)
+
+def log_sampled(event: str, **fields):
+    """LOG_SAMPLE_RATE 비율로 JSON 한 줄 로그 기록"""
+    if LOG_SAMPLE_RATE > 0 and random.random() < LOG_SAMPLE_RATE:
+        logger.info(json.dumps({"event": event, **fields}, ensure_ascii=False, default=str))
+
+def log_error(event: str, error: BaseException, **fields):
+    """백그라운드 루프에서 잡은 오류를 JSON 한 줄 로그로 기록 (샘플링 없음)"""
+    metrics.inc("news_background_errors_total", task=event)
+    logger.error(json.dumps({
+        "event": event,
+        "error": repr(error),
+        "traceback": "".join(traceback.format_exception(type(error), error, error.__traceback__)),
+        **fields
+    }, ensure_ascii=False, default=str))
+
+def configure_logging(level: int = logging.INFO):
+    """구조화 로그를 표준 출력으로 내보내도록 설정 (JSON 한 줄 그대로 출력)"""
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = False
@@ -0,0 +1 @@
+# ratelimit package 
\ No newline at end of file
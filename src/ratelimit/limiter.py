@@ -0,0 +1,178 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+import asyncio
+import time
+
+# 호출 우선순위 (작업 큐는 주기 수집 등 SCHEDULED 작업만 BACKGROUND로 설정)
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+request_priority: ContextVar[str] = ContextVar("request_priority", default=INTERACTIVE)
+
+# 과부하로 간주하는 상태 코드
+OVERLOAD_STATUSES = {429, 500, 502, 503, 504}
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (영문 약 4자당 1토큰, 한글 등은 1자당 약 1토큰)"""
+    text = text or ""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+def is_overload(error: BaseException) -> bool:
+    """요청 한도 초과/서버 과부하 오류 여부"""
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    return status in OVERLOAD_STATUSES
+
+class TokenBucket:
+    """분당 한도 토큰 버킷"""
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        
+    async def acquire(self, amount: float = 1):
+        """토큰이 충분해질 때까지 대기 후 차감 (capacity보다 큰 요청은 capacity로 제한)"""
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+class AdaptiveConcurrency:
+    """AIMD 방식 동시 실행 한도
+    
+    성공 시 한도를 1/limit씩 늘리고(가산 증가), 과부하 오류나 지연 급증 시 절반으로 줄인다(승산 감소).
+    """
+    def __init__(self, initial: int = 8, min_limit: int = 1, max_limit: int = 64, latency_factor: float = 2.0):
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_factor = latency_factor
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        
+    @property
+    def condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+        
+    def available(self, share: float = 1.0) -> bool:
+        return self.in_flight < max(1, int(self.limit * share))
+        
+    async def acquire(self, share: float = 1.0):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.available(share))
+            self.in_flight += 1
+            
+    async def release(self, latency: float, overloaded: bool):
+        self._adjust(latency, overloaded)
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+            
+    def on_overload(self):
+        """슬롯 밖에서 관측한 과부하 응답(예: 재시도로 흡수된 429) 반영"""
+        self._adjust(self.baseline or 0.0, True)
+        
+    def _adjust(self, latency: float, overloaded: bool):
+        spike = self.baseline is not None and latency > self.baseline * self.latency_factor
+        if overloaded or spike:
+            # 같은 과부하 구간에서 연속으로 줄이지 않도록 지연 기준 시간만큼 간격을 둠
+            now = time.monotonic()
+            if now - self._last_decrease > (self.baseline or latency):
+                self.limit = max(self.min_limit, self.limit / 2)
+                self._last_decrease = now
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        if not overloaded:
+            # 지연 기준값은 최근 성공 요청의 지수 이동 평균
+            self.baseline = latency if self.baseline is None else 0.9 * self.baseline + 0.1 * latency
+
+class UpstreamLimiter:
+    """업스트림(LLM, MCP)별 요청/토큰 한도 + 적응형 동시성 제한
+    
+    백그라운드 호출은 동시 실행 한도의 background_share 까지만 사용할 수 있어
+    대화형 호출(/news/analyze 등)이 항상 여유분을 가진다.
+    """
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 32,
+        background_share: float = 0.7
+    ):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.concurrency = AdaptiveConcurrency(initial=max(1, max_concurrency // 4), max_limit=max_concurrency)
+        self.background_share = background_share
+        self.waiting = {INTERACTIVE: 0, BACKGROUND: 0}
+        self.wait_time = {INTERACTIVE: 0.0, BACKGROUND: 0.0}
+        self.calls = {INTERACTIVE: 0, BACKGROUND: 0}
+        self.overloads = 0
+        
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0, priority: Optional[str] = None):
+        """한도 안에서 호출 1건 실행"""
+        priority = priority or request_priority.get()
+        share = self.background_share if priority == BACKGROUND else 1.0
+        
+        started = time.monotonic()
+        self.waiting[priority] += 1
+        try:
+            await self.concurrency.acquire(share)
+            try:
+                await self.requests.acquire()
+                if self.tokens is not None and tokens:
+                    await self.tokens.acquire(tokens)
+            except BaseException:
+                await self.concurrency.release(0.0, False)
+                raise
+        finally:
+            self.waiting[priority] -= 1
+        self.wait_time[priority] += time.monotonic() - started
+        self.calls[priority] += 1
+        
+        called = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except BaseException as e:
+            overloaded = is_overload(e)
+            self.overloads += int(overloaded)
+            raise
+        finally:
+            await self.concurrency.release(time.monotonic() - called, overloaded)
+            
+    def record_overload(self):
+        """재시도로 흡수된 과부하 응답도 동시성 한도에 반영"""
+        self.overloads += 1
+        self.concurrency.on_overload()
+        
+    def stats(self) -> Dict:
+        return {
+            "name": self.name,
+            "limit": round(self.concurrency.limit, 2),
+            "in_flight": self.concurrency.in_flight,
+            "queue_depth": dict(self.waiting),
+            "avg_wait_seconds": {
+                priority: round(self.wait_time[priority] / self.calls[priority], 4) if self.calls[priority] else 0.0
+                for priority in self.calls
+            },
+            "calls": dict(self.calls),
+            "overloads": self.overloads
+        }
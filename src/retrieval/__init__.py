@@ -0,0 +1 @@
+# retrieval package 
\ No newline at end of file
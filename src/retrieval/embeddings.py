@@ -0,0 +1,44 @@
+from typing import Callable, List
+import hashlib
+import re
+
+import numpy as np
+
+# 임베딩 함수 규약: 텍스트 목록 -> (n, dim) float32 배열 (동기 또는 비동기)
+EmbeddingFunction = Callable[[List[str]], np.ndarray]
+
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-zA-Z0-9]+")
+
+class HashingEmbedding:
+    """오프라인 로컬 임베딩 (토큰/한글 음절 bigram 특징 해싱)"""
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def _features(self, text: str) -> List[str]:
+        features = []
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            features.append(token)
+            # 한국어는 조사/어미 변화가 많아 음절 bigram을 함께 사용
+            if "가" <= token[0] <= "힣":
+                features.extend(token[i:i + 2] for i in range(len(token) - 1))
+        return features
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text or ""):
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], "little") % self.dim
+                sign = 1.0 if digest[4] & 1 else -1.0
+                vectors[row, bucket] += sign
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+class LangChainEmbedding:
+    """LangChain Embeddings 객체 어댑터 (예: OpenAIEmbeddings)"""
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+
+    async def __call__(self, texts: List[str]) -> np.ndarray:
+        vectors = await self.embeddings.aembed_documents(texts)
+        return np.asarray(vectors, dtype=np.float32)
@@ -0,0 +1,81 @@
+from typing import Dict, List, Optional
+import inspect
+
+import numpy as np
+
+from .embeddings import EmbeddingFunction, HashingEmbedding
+from .vector_index import VectorIndex
+
+class SummaryRetriever:
+    """저장된 요약을 임베딩해 벡터 인덱스로 검색하는 리트리버"""
+    def __init__(
+        self,
+        storage,
+        embed: Optional[EmbeddingFunction] = None,
+        dim: Optional[int] = None,
+        index_path: Optional[str] = None,
+        autosave_every: int = 1000
+    ):
+        self.storage = storage
+        self.embed = embed or HashingEmbedding()
+        self.index = VectorIndex(dim or getattr(self.embed, "dim"), index_path)
+        self.autosave_every = autosave_every
+        self._unsaved = 0
+
+        # save_summary 시점에 증분 반영
+        storage.summary_listeners.append(self.on_summaries_saved)
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        vectors = self.embed(texts)
+        if inspect.isawaitable(vectors):
+            vectors = await vectors
+        return vectors
+
+    async def add(self, docs: List[Dict]):
+        """요약 문서 임베딩 후 인덱스 반영 (headline_id 기준)"""
+        docs = [doc for doc in docs if doc.get("headline_id") is not None and doc.get("summary")]
+        if not docs:
+            return
+        vectors = await self._embed([doc["summary"] for doc in docs])
+        self.index.add([str(doc["headline_id"]) for doc in docs], vectors)
+
+        self._unsaved += len(docs)
+        if self._unsaved >= self.autosave_every:
+            self.save()
+
+    async def on_summaries_saved(self, docs: List[Dict]):
+        await self.add(docs)
+
+    async def sync(self, days: int = 30, batch_size: int = 256):
+        """인덱스에 없는 요약만 골라 증분 구축 (재시작 시 호출)"""
+        batch = []
+        async for doc in self.storage.iter_summaries(days, fields=["headline_id", "summary"]):
+            if doc.get("headline_id") is None or str(doc["headline_id"]) in self.index:
+                continue
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                await self.add(batch)
+                batch = []
+        await self.add(batch)
+
+    async def search(self, query: str, k: int = 5, days: Optional[int] = None) -> List[Dict]:
+        """질의와 유사한 요약 문서 (유사도 순)"""
+        vector = (await self._embed([query]))[0]
+        hits = self.index.search(vector, k)
+        if not hits:
+            return []
+
+        docs = await self.storage.get_summaries_by_headline_ids([doc_id for doc_id, _ in hits], days)
+        by_id = {str(doc["headline_id"]): doc for doc in docs}
+
+        # 만료(TTL)된 요약은 인덱스에서도 제거
+        if days is None:
+            self.index.remove([doc_id for doc_id, _ in hits if doc_id not in by_id])
+        return [
+            {**by_id[doc_id], "score": score}
+            for doc_id, score in hits if doc_id in by_id
+        ]
+
+    def save(self):
+        self.index.save()
+        self._unsaved = 0
@@ -0,0 +1,378 @@
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set, Tuple
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+# 현재 세그먼트 디렉터리 이름을 담는 파일 (저장 시 원자적으로 교체)
+POINTER = "CURRENT"
+GENERATION_PREFIX = "gen-"
+
+# 델타/메모리 기본 세그먼트 버퍼의 최소 행 수 (이후 두 배씩 증가)
+MIN_CAPACITY = 1024
+
+@contextmanager
+def _exclusive_lock(path: str):
+    """프로세스 간 배타 잠금 (같은 경로를 쓰는 워커 중 한 번에 하나만 저장)"""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+def _grow(buffer: np.ndarray, size: int) -> np.ndarray:
+    """size행 이상 담을 수 있는 버퍼 (부족하면 용량을 두 배로 늘리고 기존 행 복사)"""
+    if size <= len(buffer):
+        return buffer
+    grown = np.zeros((max(size, 2 * len(buffer), MIN_CAPACITY), *buffer.shape[1:]), dtype=buffer.dtype)
+    grown[:len(buffer)] = buffer
+    return grown
+
+class VectorIndex:
+    """코사인 유사도 벡터 인덱스
+
+    기본 세그먼트와 메모리 델타 세그먼트로 구성된다. 추가/갱신은 미리 할당한 델타 버퍼에 쌓이고,
+    save() 시 기본 세그먼트로 병합된다. 기본 세그먼트가 ivf_threshold 이상이면 IVF(역 리스트) 근사 검색을 사용한다.
+
+    path가 없으면 기본 세그먼트도 메모리 버퍼이며, save()는 델타를 그 뒤에 붙이고 새 벡터만 IVF 리스트에 할당한다.
+
+    path가 있으면 기본 세그먼트는 디스크 memmap(읽기 전용)이다. 저장할 때마다 path 아래 새 세대 디렉터리(gen-*)에
+    파일을 모두 쓴 뒤 CURRENT 파일을 원자적으로 바꾸므로, 같은 path를 공유하는 여러 워커가 벡터와 id 목록이 어긋난
+    상태를 읽지 않는다. 저장은 잠금 파일로 한 번에 한 워커만 하며, 다른 워커가 먼저 저장한 세그먼트 위에 자기 델타를
+    병합한다. 델타는 저장 전까지 그 워커 프로세스에서만 검색되고, 다른 워커는 검색 시 CURRENT가 바뀌었으면 새 세그먼트를 연다.
+    """
+    def __init__(self, dim: int, path: Optional[str] = None, ivf_threshold: int = 50_000, nprobe: int = 8):
+        self.dim = dim
+        self.path = path
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+
+        # 기본 세그먼트 (메모리 모드에서는 _base가 _base_buffer 앞부분의 뷰)
+        self._base = np.zeros((0, dim), dtype=np.float32)
+        self._base_buffer = self._base
+        self._base_ids: List[str] = []
+        self._alive = np.zeros(0, dtype=bool)
+        self._centroids: Optional[np.ndarray] = None
+        self._assignment = np.zeros(0, dtype=np.int32)
+        self._lists: List[np.ndarray] = []
+        self._trained_size = 0
+
+        # 델타 세그먼트 (앞쪽 len(_delta_ids)행만 사용, 삭제된 행은 _delta_alive가 False)
+        self._reset_delta()
+
+        # 마지막 저장 이후 삭제된 id (다른 워커가 저장한 세그먼트 위에 병합할 때 다시 제외)
+        self._removed: Set[str] = set()
+
+        # id -> ("base" | "delta", 위치)
+        self._positions: Dict[str, Tuple[str, int]] = {}
+
+        # 열려 있는 세대 디렉터리와 CURRENT 파일 변경 시각
+        self._generation: Optional[str] = None
+        self._pointer_mtime: Optional[int] = None
+
+        if path and (os.path.exists(os.path.join(path, POINTER)) or os.path.exists(os.path.join(path, "ids.json"))):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._positions
+
+    def _reset_delta(self):
+        self._delta = np.zeros((0, self.dim), dtype=np.float32)
+        self._delta_alive = np.zeros(0, dtype=bool)
+        self._delta_ids: List[Optional[str]] = []
+
+    def add(self, ids: List[str], vectors: np.ndarray):
+        """벡터 추가 (같은 id는 갱신)"""
+        vectors = _normalize(vectors).reshape(len(ids), self.dim)
+        for doc_id, vector in zip(ids, vectors):
+            segment, position = self._positions.get(doc_id, (None, None))
+            self._removed.discard(doc_id)
+            if segment == "base":
+                self._alive[position] = False
+            elif segment == "delta":
+                self._delta[position] = vector
+                continue
+            position = len(self._delta_ids)
+            self._delta = _grow(self._delta, position + 1)
+            self._delta_alive = _grow(self._delta_alive, position + 1)
+            self._delta[position] = vector
+            self._delta_alive[position] = True
+            self._delta_ids.append(doc_id)
+            self._positions[doc_id] = ("delta", position)
+
+    def remove(self, ids: List[str]):
+        """벡터 삭제 (델타는 병합 시 정리)"""
+        for doc_id in ids:
+            segment, position = self._positions.pop(doc_id, (None, None))
+            if segment is not None:
+                self._removed.add(doc_id)
+            if segment == "base":
+                self._alive[position] = False
+            elif segment == "delta":
+                self._delta_alive[position] = False
+                self._delta_ids[position] = None
+
+    def search(self, query: np.ndarray, k: int = 5) -> List[Tuple[str, float]]:
+        """질의 벡터와 가장 가까운 k개 (id, 점수)"""
+        self.refresh()
+        query = _normalize(query).reshape(self.dim)
+        candidates: List[Tuple[str, float]] = []
+
+        # 기본 세그먼트 (IVF 또는 전수 검색)
+        if len(self._base_ids):
+            rows = self._probe(query) if self._centroids is not None else None
+            matrix = self._base if rows is None else self._base[rows]
+            scores = matrix @ query
+            alive = self._alive if rows is None else self._alive[rows]
+            scores = np.where(alive, scores, -np.inf)
+            for index in self._top_k(scores, k):
+                row = index if rows is None else rows[index]
+                if np.isfinite(scores[index]):
+                    candidates.append((self._base_ids[row], float(scores[index])))
+
+        # 델타 세그먼트 (버퍼 뷰에 대한 전수 검색, 복사 없음)
+        count = len(self._delta_ids)
+        if count:
+            scores = np.where(self._delta_alive[:count], self._delta[:count] @ query, -np.inf)
+            for index in self._top_k(scores, k):
+                if np.isfinite(scores[index]):
+                    candidates.append((self._delta_ids[index], float(scores[index])))
+
+        candidates.sort(key=lambda item: -item[1])
+        return candidates[:k]
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        if len(scores) <= k:
+            return np.argsort(-scores)
+        top = np.argpartition(-scores, k)[:k]
+        return top[np.argsort(-scores[top])]
+
+    def _probe(self, query: np.ndarray) -> np.ndarray:
+        """질의와 가까운 nprobe개 리스트의 행 번호"""
+        nearest = self._top_k(self._centroids @ query, self.nprobe)
+        return np.concatenate([self._lists[i] for i in nearest])
+
+    @staticmethod
+    def _train_centroids(vectors: np.ndarray, iterations: int = 10, seed: int = 0) -> np.ndarray:
+        """표본 k-means로 IVF 중심점 학습"""
+        n_lists = max(1, int(np.sqrt(len(vectors))))
+        rng = np.random.default_rng(seed)
+        sample = np.asarray(vectors[np.sort(rng.choice(len(vectors), size=min(len(vectors), n_lists * 64), replace=False))])
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for i in range(n_lists):
+                members = sample[assignment == i]
+                if len(members):
+                    centroids[i] = members.mean(axis=0)
+            centroids = _normalize(centroids)
+        return centroids
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray, batch_size: int = 65536) -> np.ndarray:
+        """가장 가까운 중심점 번호 (메모리 제한을 위해 배치 단위)"""
+        if not len(vectors):
+            return np.zeros(0, dtype=np.int32)
+        return np.concatenate([
+            np.argmax(np.asarray(vectors[start:start + batch_size]) @ centroids.T, axis=1)
+            for start in range(0, len(vectors), batch_size)
+        ]).astype(np.int32)
+
+    def _build_ivf(self, vectors: np.ndarray, kept: Optional[np.ndarray]) -> Tuple[Optional[np.ndarray], np.ndarray, int]:
+        """병합된 세그먼트의 IVF (중심점, 할당, 학습 크기)
+
+        크기가 학습 시점의 2배를 넘으면 재학습하고, 아니면 기존 할당(kept, 앞쪽 행)을 유지한 채 새 벡터만 할당한다.
+        ivf_threshold 미만이면 중심점은 None이다.
+        """
+        if len(vectors) < self.ivf_threshold:
+            return None, np.zeros(0, dtype=np.int32), 0
+        if self._centroids is None or kept is None or len(vectors) > 2 * self._trained_size:
+            centroids = self._train_centroids(vectors)
+            return centroids, self._assign(vectors, centroids), len(vectors)
+        assignment = np.concatenate([kept, self._assign(vectors[len(kept):], self._centroids)])
+        return self._centroids, assignment, self._trained_size
+
+    def _set_ivf(self, centroids: Optional[np.ndarray], assignment: np.ndarray, trained_size: int):
+        self._centroids, self._assignment, self._trained_size = centroids, assignment, trained_size
+        self._lists = []
+        if centroids is not None:
+            order = np.argsort(assignment, kind="stable")
+            counts = np.bincount(assignment, minlength=len(centroids))
+            self._lists = np.split(order, np.cumsum(counts)[:-1])
+
+    def _read_pointer(self) -> Tuple[Optional[int], Optional[str]]:
+        """CURRENT 파일의 (변경 시각, 세대 디렉터리 이름), 없으면 (None, None)"""
+        pointer = os.path.join(self.path, POINTER)
+        try:
+            mtime = os.stat(pointer).st_mtime_ns
+            with open(pointer, encoding="utf-8") as f:
+                return mtime, f.read().strip()
+        except FileNotFoundError:
+            return None, None
+
+    def refresh(self, force: bool = False):
+        """다른 워커가 새 세그먼트를 저장했으면 다시 열기 (델타와 삭제 표시는 유지)"""
+        if not self.path:
+            return
+        pointer = os.path.join(self.path, POINTER)
+        if not force:
+            try:
+                if os.stat(pointer).st_mtime_ns == self._pointer_mtime:
+                    return
+            except FileNotFoundError:
+                return
+        mtime, generation = self._read_pointer()
+        if generation is not None and generation != self._generation:
+            self._open(generation)
+        self._pointer_mtime = mtime
+
+    def save(self):
+        """델타를 기본 세그먼트와 병합 (path가 있으면 최신 디스크 세그먼트와 병합해 새 세대로 저장하고 memmap으로 다시 연다)"""
+        if not self.path:
+            self._merge_in_memory()
+            return
+        os.makedirs(self.path, exist_ok=True)
+
+        with _exclusive_lock(os.path.join(self.path, "LOCK")):
+            # 다른 워커가 먼저 저장했으면 그 세그먼트 위에 이 워커의 델타를 병합
+            self.refresh(force=True)
+            previous = self._generation
+            generation = f"{GENERATION_PREFIX}{time.time_ns()}-{os.getpid()}"
+            directory = os.path.join(self.path, generation)
+            os.makedirs(directory)
+
+            live_base = np.flatnonzero(self._alive)
+            live_delta = np.flatnonzero(self._delta_alive[:len(self._delta_ids)])
+            ids = [self._base_ids[i] for i in live_base] + [self._delta_ids[i] for i in live_delta]
+
+            merged = np.lib.format.open_memmap(
+                os.path.join(directory, "vectors.npy"), mode="w+", dtype=np.float32, shape=(len(ids), self.dim)
+            )
+            merged[:len(live_base)] = self._base[live_base]
+            merged[len(live_base):] = self._delta[live_delta]
+            merged.flush()
+
+            kept = self._assignment[live_base] if self._centroids is not None else None
+            centroids, assignment, trained_size = self._build_ivf(merged, kept)
+            if centroids is not None:
+                np.save(os.path.join(directory, "centroids.npy"), centroids)
+                np.save(os.path.join(directory, "assignment.npy"), assignment)
+            del merged
+
+            with open(os.path.join(directory, "ids.json"), "w", encoding="utf-8") as f:
+                json.dump(ids, f)
+            with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({"trained_size": trained_size}, f)
+
+            # 세대 디렉터리를 다 쓴 뒤 CURRENT만 원자적으로 교체
+            tmp_pointer = os.path.join(self.path, f"{POINTER}.{os.getpid()}.tmp")
+            with open(tmp_pointer, "w", encoding="utf-8") as f:
+                f.write(generation)
+            os.replace(tmp_pointer, os.path.join(self.path, POINTER))
+
+            self._reset_delta()
+            self._removed = set()
+            self.refresh(force=True)
+            self._cleanup({generation, previous})
+
+    def _merge_in_memory(self):
+        """델타를 메모리 기본 세그먼트 뒤에 붙이기 (삭제된 행이 절반을 넘으면 먼저 정리)"""
+        live_delta = np.flatnonzero(self._delta_alive[:len(self._delta_ids)])
+        compact = np.count_nonzero(self._alive) * 2 < len(self._alive)
+        if not len(live_delta) and not compact:
+            self._reset_delta()
+            return
+        if compact:
+            live_base = np.flatnonzero(self._alive)
+            kept = self._assignment[live_base] if self._centroids is not None else None
+            self._base_buffer = _grow(np.zeros((0, self.dim), dtype=np.float32), len(live_base) + len(live_delta))
+            self._base_buffer[:len(live_base)] = self._base[live_base]
+            self._base_ids = [self._base_ids[i] for i in live_base]
+            alive = np.ones(len(live_base), dtype=bool)
+        else:
+            kept = self._assignment if self._centroids is not None else None
+            self._base_buffer = _grow(self._base_buffer, len(self._base_ids) + len(live_delta))
+            alive = self._alive
+
+        start = len(self._base_ids)
+        self._base_buffer[start:start + len(live_delta)] = self._delta[live_delta]
+        self._base_ids.extend(self._delta_ids[i] for i in live_delta)
+        self._base = self._base_buffer[:len(self._base_ids)]
+        self._alive = np.concatenate([alive, np.ones(len(live_delta), dtype=bool)])
+        rows = range(len(self._base_ids)) if compact else range(start, len(self._base_ids))
+        self._positions.update((self._base_ids[i], ("base", i)) for i in rows)
+
+        self._set_ivf(*self._build_ivf(self._base, kept))
+        self._reset_delta()
+        self._removed = set()
+
+    def _cleanup(self, keep: Set[Optional[str]]):
+        """현재/직전 세대를 제외한 세그먼트 삭제 (직전 세대는 다른 워커가 아직 열고 있을 수 있음)"""
+        for name in os.listdir(self.path):
+            if name.startswith(GENERATION_PREFIX) and name not in keep:
+                shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
+
+    def load(self):
+        """디스크 세그먼트를 memmap으로 열기 (CURRENT가 없으면 세대 도입 이전의 path 바로 아래 파일)"""
+        self._reset_delta()
+        self._removed = set()
+        mtime, generation = self._read_pointer()
+        self._open(generation or "")
+        self._pointer_mtime = mtime
+
+    def _open(self, generation: str):
+        """세대 디렉터리의 세그먼트 열기 (델타에 있거나 삭제된 id는 기본 세그먼트에서 제외)"""
+        directory = os.path.join(self.path, generation)
+        with open(os.path.join(directory, "ids.json"), encoding="utf-8") as f:
+            self._base_ids = json.load(f)
+        if self._base_ids:
+            self._base = np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r")
+        else:
+            self._base = np.zeros((0, self.dim), dtype=np.float32)
+        self._generation = generation or None
+
+        delta_ids = {doc_id for doc_id in self._delta_ids if doc_id is not None}
+        self._alive = np.fromiter(
+            (doc_id not in self._removed and doc_id not in delta_ids for doc_id in self._base_ids),
+            dtype=bool, count=len(self._base_ids)
+        )
+        self._positions = {doc_id: ("base", i) for i, doc_id in enumerate(self._base_ids) if self._alive[i]}
+        self._positions.update({doc_id: ("delta", i) for i, doc_id in enumerate(self._delta_ids) if doc_id is not None})
+
+        trained_size = 0
+        meta_path = os.path.join(directory, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                trained_size = json.load(f).get("trained_size", 0)
+        if trained_size:
+            self._set_ivf(
+                np.load(os.path.join(directory, "centroids.npy")),
+                np.load(os.path.join(directory, "assignment.npy")),
+                trained_size
+            )
+        else:
+            self._set_ivf(None, np.zeros(0, dtype=np.int32), 0)
@@ -0,0 +1,24 @@
+from typing import Optional
+import os
+
+# 사용할 수 있는 저장소 백엔드 (NEWS_STORAGE_BACKEND)
+BACKENDS = ("mongo", "sqlite")
+
+def create_storage(backend: Optional[str] = None):
+    """설정된 백엔드의 뉴스 저장소 생성
+
+    두 백엔드는 같은 메서드(헤드라인/요약 저장·조회·검색, 작업 큐/체크포인트/캐시 저장소)를 제공한다.
+    - mongo  : MONGODB_URI, NEWS_DB_NAME
+    - sqlite : NEWS_SQLITE_PATH (단일 노드/엣지 배포용 내장 저장소)
+    """
+    backend = (backend or os.getenv("NEWS_STORAGE_BACKEND", "mongo")).lower()
+    if backend == "mongo":
+        from .news_storage import NewsStorage
+        return NewsStorage()
+    if backend == "sqlite":
+        from .sqlite_storage import SQLiteNewsStorage
+        return SQLiteNewsStorage(
+            os.getenv("NEWS_SQLITE_PATH", "news.db"),
+            read_pool_size=int(os.getenv("NEWS_SQLITE_READERS", 4))
+        )
+    raise ValueError(f"지원하지 않는 저장소 백엔드입니다: {backend} (사용 가능: {', '.join(BACKENDS)})")
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+class WorkflowCheckpointStore:
+    """수집 워크플로우 실행 상태 저장소 (기사 단위 체크포인트)
+    
+    문서 구조:
+        {_id: run_id, query, status, items: [...], articles: {"0": {headline_id, summary, analysis, saved}}}
+    """
+    def __init__(self, collection, ttl_seconds: int = 7 * 24 * 60 * 60):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        self._ready = False
+        
+    async def _ensure_index(self):
+        if not self._ready:
+            await self.collection.create_index("updated_at", expireAfterSeconds=self.ttl_seconds)
+            self._ready = True
+            
+    async def load(self, run_id: str) -> Optional[Dict]:
+        await self._ensure_index()
+        return await self.collection.find_one({"_id": run_id})
+        
+    async def start(self, run_id: str, query: str):
+        await self._ensure_index()
+        await self.collection.update_one(
+            {"_id": run_id},
+            {
+                "$set": {"updated_at": datetime.now()},
+                "$setOnInsert": {"query": query, "status": "running", "items": None, "articles": {}}
+            },
+            upsert=True
+        )
+        
+    async def save_items(self, run_id: str, items: List[Dict]):
+        """검색 결과 저장 (재시작 시 Tavily 재호출 방지)"""
+        await self.collection.update_one(
+            {"_id": run_id},
+            {"$set": {"items": items, "updated_at": datetime.now()}}
+        )
+        
+    async def update_articles(self, run_id: str, updates: Dict[str, Dict]):
+        """기사별 진행 상태 갱신 ({기사 키: {필드: 값}})"""
+        fields = {
+            f"articles.{key}.{field}": value
+            for key, values in updates.items()
+            for field, value in values.items()
+        }
+        if not fields:
+            return
+        fields["updated_at"] = datetime.now()
+        await self.collection.update_one({"_id": run_id}, {"$set": fields})
+        
+    async def finish(self, run_id: str, status: str = "done"):
+        await self.collection.update_one(
+            {"_id": run_id},
+            {"$set": {"status": status, "updated_at": datetime.now()}}
+        )
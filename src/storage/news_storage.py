@@ -1,61 +1,397 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel, ReturnDocument, UpdateOne, InsertOne
+from bson import ObjectId
+from bson.errors import InvalidId
+import base64
+import json
 import os
+import re
+
+from ..analytics.trends import ALL_SOURCES, count_increments, counter_expiry
+from ..cache.llm_cache import MongoCacheTier
+from ..metrics.telemetry import timed
+from .checkpoints import WorkflowCheckpointStore
+from ..text.dedup import band_keys, decode
+
+# 키워드 통계의 전체 문서 수 키
+DOC_COUNT_KEY = "__doc_count__"
+
+# 키셋 페이지네이션 정렬 기준 (timestamp, _id 내림차순)
+KEYSET_SORT = [("timestamp", DESCENDING), ("_id", DESCENDING)]
+
+# 요약 보관 기간 (요약 컬렉션 TTL, 헤드라인에 복사한 요약도 같은 기간 후 제거)
+SUMMARY_TTL_DAYS = 30
+
+# 검색 결과 필드 (헤드라인 + 헤드라인에 복사된 최신 요약/분석)
+SEARCH_FIELDS = {"title": 1, "url": 1, "source": 1, "keywords": 1, "timestamp": 1, "summary": 1, "analysis": 1}
+
+# 월별 요약 보관본 문서 하나에 담는 최대 요약 수
+ARCHIVE_BUCKET_SIZE = 500
+
+def encode_cursor(doc: Dict) -> str:
+    """마지막 문서의 (timestamp, _id)를 연속 토큰으로 인코딩"""
+    payload = json.dumps({"t": doc["timestamp"].isoformat(), "i": str(doc["_id"])})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def parse_cursor(token: str) -> Tuple[datetime, str]:
+    """연속 토큰을 (timestamp, _id 문자열)로 복원"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        return datetime.fromisoformat(payload["t"]), str(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("잘못된 cursor 값입니다.") from e
+
+def decode_cursor(token: str) -> Dict:
+    """연속 토큰을 키셋 조건으로 변환"""
+    timestamp, last_id = parse_cursor(token)
+    try:
+        last_id = ObjectId(last_id)
+    except (InvalidId, TypeError) as e:
+        raise ValueError("잘못된 cursor 값입니다.") from e
+    return {"$or": [
+        {"timestamp": {"$lt": timestamp}},
+        {"timestamp": timestamp, "_id": {"$lt": last_id}}
+    ]}
+
+# 조회 응답에서 항상 제외하는 내부 필드 (근접 중복 탐지용 서명)
+INTERNAL_FIELDS = ("minhash", "mh_bands")
+
+def make_projection(fields: Optional[List[str]]) -> Dict:
+    """필드 목록을 projection으로 변환 (`-content` 처럼 앞에 -를 붙이면 제외)
+    
+    키셋 토큰 생성을 위해 timestamp는 항상 포함한다 (`-timestamp`는 무시).
+    """
+    excluded = [field[1:] for field in fields or [] if field.startswith("-")]
+    if not fields or excluded:
+        return {field: 0 for field in [*excluded, *INTERNAL_FIELDS] if field != "timestamp"}
+    return {**{field: 1 for field in fields if field not in INTERNAL_FIELDS}, "timestamp": 1}
 
 class NewsStorage:
-    def __init__(self):
-        self.client = AsyncIOMotorClient('mongodb://localhost:27017')
-        self.db = self.client.news_db
+    """MongoDB 뉴스 저장소 (NEWS_STORAGE_BACKEND=mongo, 기본값)"""
+    def __init__(self, uri: Optional[str] = None, db_name: Optional[str] = None):
+        self.client = AsyncIOMotorClient(uri or os.getenv("MONGODB_URI", 'mongodb://localhost:27017'))
+        self.db = self.client[db_name or os.getenv("NEWS_DB_NAME", "news_db")]
         self.headlines = self.db.headlines  # 1년치 헤드라인
         self.summaries = self.db.summaries  # 1개월 본문 요약
-        self._init_storage()
-        
-    async def _init_storage(self):
-        """데이터베이스 초기화"""
-        # 인덱스 생성
-        await self.headlines.create_index([("timestamp", DESCENDING)])
-        await self.headlines.create_index([("keywords", ASCENDING)])
-        await self.summaries.create_index([("timestamp", DESCENDING)])
-        await self.summaries.create_index([("headline_id", ASCENDING)])
-        
-        # TTL 인덱스 생성 (자동 문서 삭제)
-        await self.headlines.create_index(
-            [("timestamp", ASCENDING)],
-            expireAfterSeconds=365 * 24 * 60 * 60  # 1년
-        )
-        await self.summaries.create_index(
-            [("timestamp", ASCENDING)],
-            expireAfterSeconds=30 * 24 * 60 * 60   # 1개월
-        )
+        self.summary_archive = self.db.summary_archive  # 월별 요약 보관본 (본문 제외)
+        self.term_stats = self.db.term_stats  # 키워드 문서 빈도(DF) 통계
+        self.keyword_trends = self.db.keyword_trends  # 구간(일/주/월)·출처별 키워드 집계
+        
+        # 요약 저장 후 호출되는 리스너 (예: 벡터 인덱스 증분 반영)
+        self.summary_listeners: List[Callable[[List[Dict]], Awaitable]] = []
+        self._initialized = False
+        
+    @timed("storage.init")
+    async def init(self):
+        """데이터베이스 초기화 (없는 인덱스만 생성, 여러 번 호출해도 한 번만 수행)"""
+        if self._initialized:
+            return
+        await self._ensure_indexes(self.headlines, self._headline_indexes())
+        await self._ensure_indexes(self.summaries, self._summary_indexes())
+        await self._ensure_indexes(self.summary_archive, [IndexModel([("month", ASCENDING)])])
+        await self._ensure_indexes(self.keyword_trends, self._trend_indexes())
+        self._initialized = True
+        
+    def close(self):
+        self.client.close()
+        
+    def job_store(self):
+        """수집 작업 큐 저장소"""
+        from ..jobs.queue import MongoJobStore
+        return MongoJobStore(self.db)
+        
+    def checkpoint_store(self) -> WorkflowCheckpointStore:
+        """수집 워크플로우 체크포인트 저장소"""
+        return WorkflowCheckpointStore(self.db.workflow_runs)
+        
+    def cache_tier(self, namespace: str, ttl_seconds: int) -> MongoCacheTier:
+        """LLM 결과 등의 영구 캐시 계층 (<namespace>_cache 컬렉션)"""
+        return MongoCacheTier(self.db[f"{namespace}_cache"], ttl_seconds=ttl_seconds)
+        
+    async def purge_expired(self) -> int:
+        """보관 기간이 지난 문서 삭제 (MongoDB는 TTL 인덱스가 처리)"""
+        return 0
+        
+    async def _ensure_indexes(self, collection, indexes: List[IndexModel]):
+        """이미 존재하는 인덱스는 건너뛰고 나머지만 한 번에 생성"""
+        existing = await collection.index_information()
+        missing = [index for index in indexes if index.document["name"] not in existing]
+        # 텍스트 인덱스는 컬렉션당 하나뿐이므로 정의가 바뀌면 이전 텍스트 인덱스를 먼저 삭제
+        if any("text" in index.document["key"].values() for index in missing):
+            for name, info in existing.items():
+                if any(kind == "text" for _, kind in info["key"]):
+                    await collection.drop_index(name)
+        if missing:
+            await collection.create_indexes(missing)
             
-    async def save_headline(self, headline: Dict):
-        """장기 저장소에 헤드라인 저장 (1년)"""
-        headline_doc = {
+    def _headline_indexes(self) -> List[IndexModel]:
+        """헤드라인 컬렉션 인덱스 정의"""
+        return [
+            IndexModel([("timestamp", DESCENDING)]),
+            IndexModel([("keywords", ASCENDING)]),
+            # 키셋 페이지네이션 정렬용 복합 인덱스
+            IndexModel(KEYSET_SORT),
+            # 제목/키워드/복사 요약 전문 검색 인덱스 (SQLite FTS와 같은 필드·가중치,
+            # 한국어 형태소 분석이 없으므로 언어 처리 없이 토큰 단위)
+            IndexModel(
+                [("title", TEXT), ("keywords", TEXT), ("summary", TEXT)],
+                weights={"title": 3, "keywords": 5, "summary": 1},
+                default_language="none",
+                name="headline_search"
+            ),
+            # 보관 기간이 지난 복사 요약 정리용 (요약이 있는 헤드라인만)
+            IndexModel([("summarized_at", ASCENDING)], sparse=True),
+            # 근접 중복 후보 조회 (LSH 밴드 + 최근 기간)
+            IndexModel([("mh_bands", ASCENDING), ("timestamp", DESCENDING)]),
+            # URL 기준 중복 방지 (URL이 없는 헤드라인은 제외)
+            IndexModel(
+                [("url", ASCENDING)],
+                unique=True,
+                partialFilterExpression={"url": {"$type": "string"}}
+            ),
+            # TTL 인덱스 (자동 문서 삭제)
+            IndexModel(
+                [("timestamp", ASCENDING)],
+                expireAfterSeconds=365 * 24 * 60 * 60  # 1년
+            )
+        ]
+        
+    def _summary_indexes(self) -> List[IndexModel]:
+        """요약 컬렉션 인덱스 정의"""
+        return [
+            IndexModel([("timestamp", DESCENDING)]),
+            IndexModel([("headline_id", ASCENDING)]),
+            IndexModel(KEYSET_SORT),
+            IndexModel(
+                [("timestamp", ASCENDING)],
+                expireAfterSeconds=SUMMARY_TTL_DAYS * 24 * 60 * 60   # 1개월
+            )
+        ]
+            
+    def _trend_indexes(self) -> List[IndexModel]:
+        """키워드 집계 컬렉션 인덱스 정의"""
+        return [
+            IndexModel([("window", ASCENDING), ("source", ASCENDING), ("term", ASCENDING)], unique=True),
+            # 구간별 상위 키워드 조회 (인덱스 순서대로 k개만 읽음)
+            IndexModel([("window", ASCENDING), ("source", ASCENDING), ("count", DESCENDING), ("term", ASCENDING)]),
+            IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
+        ]
+            
+    def _headline_doc(self, headline: Dict) -> Dict:
+        doc = {
             "timestamp": datetime.now(),
             "title": headline["title"],
             "url": headline.get("url"),
             "source": headline.get("source"),
             "keywords": headline.get("keywords", [])
         }
-        result = await self.headlines.insert_one(headline_doc)
-        return result.inserted_id
+        # 근접 중복 탐지용 MinHash 서명과 LSH 밴드 키
+        if headline.get("minhash") is not None:
+            doc["minhash"] = headline["minhash"]
+            doc["mh_bands"] = band_keys(decode(headline["minhash"]))
+        return doc
         
-    async def save_summary(self, summary: Dict):
-        """단기 저장소에 본문 요약 저장 (1개월)"""
-        summary_doc = {
+    def _summary_doc(self, summary: Dict) -> Dict:
+        return {
             "timestamp": datetime.now(),
             "headline_id": summary.get("headline_id"),
             "summary": summary["summary"],
             "content": summary.get("content"),
             "analysis": summary.get("analysis", {})
         }
-        result = await self.summaries.insert_one(summary_doc)
-        return result.inserted_id
+        
+    def _summary_upsert(self, summary_doc: Dict) -> Dict:
+        """headline_id 기준 요약 upsert 갱신 문서 (다시 저장된 요약은 보관 대상으로 되돌림)"""
+        return {"$set": summary_doc, "$unset": {"archived": ""}}
+        
+    def _summary_view(self, summary_doc: Dict) -> Dict:
+        """헤드라인 문서에 복사할 최신 요약/분석 (검색 시 조인 없이 조회)"""
+        return {"$set": {
+            "summary": summary_doc["summary"],
+            "analysis": summary_doc["analysis"],
+            "summarized_at": summary_doc["timestamp"]
+        }}
+        
+    def _headline_upsert(self, headline_doc: Dict) -> Dict:
+        """URL 기준 upsert 갱신 문서 (최초 수집 시점은 유지)"""
+        timestamp = headline_doc.pop("timestamp")
+        return {"$set": headline_doc, "$setOnInsert": {"timestamp": timestamp}}
+        
+    @timed("storage.save_headline")
+    async def save_headline(self, headline: Dict):
+        """장기 저장소에 헤드라인 저장 (1년)"""
+        ids = await self.save_headlines_bulk([headline])
+        return ids[0]
+        
+    async def _notify_summaries(self, docs: List[Dict]):
+        for listener in self.summary_listeners:
+            await listener(docs)
             
-    async def get_headlines(self, days: Optional[int] = None, keywords: Optional[str] = None) -> List[Dict]:
-        """헤드라인 조회"""
+    @timed("storage.save_summary")
+    async def save_summary(self, summary: Dict):
+        """단기 저장소에 본문 요약 저장 (1개월)"""
+        summary_doc = self._summary_doc(summary)
+        if summary_doc["headline_id"] is None:
+            result = await self.summaries.insert_one(summary_doc)
+            await self._notify_summaries([summary_doc])
+            return result.inserted_id
+            
+        doc = await self.summaries.find_one_and_update(
+            {"headline_id": summary_doc["headline_id"]},
+            self._summary_upsert(summary_doc),
+            upsert=True,
+            projection={"_id": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        await self.headlines.update_one({"_id": summary_doc["headline_id"]}, self._summary_view(summary_doc))
+        await self._notify_summaries([summary_doc])
+        return doc["_id"]
+        
+    @timed("storage.save_headlines_bulk")
+    async def save_headlines_bulk(self, headlines: List[Dict]) -> List:
+        """헤드라인 일괄 upsert (입력 순서대로 _id 반환)"""
+        if not headlines:
+            return []
+            
+        docs = [self._headline_doc(headline) for headline in headlines]
+        operations = []
+        for doc in docs:
+            if doc["url"]:
+                operations.append(UpdateOne({"url": doc["url"]}, self._headline_upsert(dict(doc)), upsert=True))
+            else:
+                operations.append(InsertOne(doc))
+        result = await self.headlines.bulk_write(operations, ordered=False)
+        
+        # 새로 저장된 헤드라인만 키워드 집계에 반영 (기존 URL 갱신은 제외)
+        inserted = [docs[index] for index in result.upserted_ids]
+        inserted.extend(doc for doc in docs if not doc["url"])
+        await self.add_keyword_counts(count_increments(inserted))
+        
+        # URL -> _id 매핑 (InsertOne 문서는 _id가 직접 채워짐)
+        urls = list({doc["url"] for doc in docs if doc["url"]})
+        ids = {}
+        if urls:
+            cursor = self.headlines.find({"url": {"$in": urls}}, {"_id": 1, "url": 1})
+            async for doc in cursor:
+                ids[doc["url"]] = doc["_id"]
+        return [ids.get(doc["url"]) if doc["url"] else doc["_id"] for doc in docs]
+        
+    @timed("storage.existing_urls")
+    async def existing_urls(self, urls: List[str]) -> Set[str]:
+        """이미 저장된 URL 조회"""
+        urls = [url for url in urls if url]
+        if not urls:
+            return set()
+        cursor = self.headlines.find({"url": {"$in": urls}}, {"_id": 0, "url": 1})
+        return {doc["url"] async for doc in cursor}
+        
+    @timed("storage.find_near_duplicates")
+    async def find_near_duplicates(self, signatures: List, days: int = 3) -> List[Dict]:
+        """LSH 밴드가 하나라도 겹치는 최근 대표 헤드라인 후보"""
+        bands = sorted({band for signature in signatures for band in band_keys(signature)})
+        if not bands:
+            return []
+        cutoff = datetime.now() - timedelta(days=days)
+        return await self.headlines.find(
+            {"mh_bands": {"$in": bands}, "timestamp": {"$gt": cutoff}, "canonical_id": {"$exists": False}},
+            {"_id": 1, "url": 1, "minhash": 1}
+        ).to_list(None)
+        
+    @timed("storage.link_duplicates")
+    async def link_duplicates(self, links: Dict):
+        """중복 헤드라인을 대표 헤드라인에 연결 (대표 문서에는 duplicates 목록 유지)"""
+        operations = []
+        for duplicate_id, canonical_id in links.items():
+            if duplicate_id == canonical_id:
+                continue
+            operations.append(UpdateOne({"_id": duplicate_id}, {"$set": {"canonical_id": canonical_id}}))
+            operations.append(UpdateOne({"_id": canonical_id}, {"$addToSet": {"duplicates": duplicate_id}}))
+        if operations:
+            await self.headlines.bulk_write(operations, ordered=False)
+            
+    @timed("storage.load_term_stats")
+    async def load_term_stats(self) -> Tuple[int, Dict[str, int]]:
+        """키워드 DF 통계 조회 (전체 문서 수, 용어별 DF)"""
+        doc_count, df = 0, {}
+        async for doc in self.term_stats.find({}):
+            if doc["_id"] == DOC_COUNT_KEY:
+                doc_count = doc["count"]
+            else:
+                df[doc["_id"]] = doc["count"]
+        return doc_count, df
+        
+    @timed("storage.update_term_stats")
+    async def update_term_stats(self, doc_count: int, df: Dict[str, int]):
+        """키워드 DF 통계 증분 반영"""
+        if not doc_count:
+            return
+        operations = [UpdateOne({"_id": DOC_COUNT_KEY}, {"$inc": {"count": doc_count}}, upsert=True)]
+        operations.extend(
+            UpdateOne({"_id": term}, {"$inc": {"count": count}}, upsert=True)
+            for term, count in df.items()
+        )
+        await self.term_stats.bulk_write(operations, ordered=False)
+        
+    @timed("storage.add_keyword_counts")
+    async def add_keyword_counts(self, increments: Dict[Tuple[str, str, str], int]):
+        """(구간 키, 출처, 키워드)별 집계 증분 반영"""
+        if not increments:
+            return
+        operations = [
+            UpdateOne(
+                {"window": window, "source": source, "term": term},
+                {"$inc": {"count": count}, "$setOnInsert": {"expires_at": counter_expiry(window)}},
+                upsert=True
+            )
+            for (window, source, term), count in increments.items()
+        ]
+        await self.keyword_trends.bulk_write(operations, ordered=False)
+        
+    @timed("storage.top_keywords")
+    async def top_keywords(self, window: str, source: str = ALL_SOURCES, k: int = 10) -> List[Tuple[str, int]]:
+        """구간의 상위 k개 키워드 (횟수 내림차순)"""
+        cursor = self.keyword_trends.find(
+            {"window": window, "source": source}, {"_id": 0, "term": 1, "count": 1}
+        ).sort([("count", DESCENDING), ("term", ASCENDING)]).limit(k)
+        return [(doc["term"], doc["count"]) async for doc in cursor]
+        
+    async def keyword_counts(self, window: str, source: str, terms: List[str]) -> Dict[str, int]:
+        """구간의 지정 키워드 집계"""
+        if not terms:
+            return {}
+        cursor = self.keyword_trends.find(
+            {"window": window, "source": source, "term": {"$in": terms}}, {"_id": 0, "term": 1, "count": 1}
+        )
+        return {doc["term"]: doc["count"] async for doc in cursor}
+        
+    async def reset_keyword_counts(self) -> int:
+        """키워드 집계 전체 삭제 (재집계 전)"""
+        result = await self.keyword_trends.delete_many({})
+        return result.deleted_count
+        
+    @timed("storage.save_summaries_bulk")
+    async def save_summaries_bulk(self, summaries: List[Dict]) -> int:
+        """요약 일괄 저장 (headline_id 기준 upsert)"""
+        if not summaries:
+            return 0
+            
+        operations, views = [], []
+        docs = [self._summary_doc(summary) for summary in summaries]
+        for doc in docs:
+            if doc["headline_id"] is None:
+                operations.append(InsertOne(doc))
+            else:
+                operations.append(UpdateOne({"headline_id": doc["headline_id"]}, self._summary_upsert(doc), upsert=True))
+                views.append(UpdateOne({"_id": doc["headline_id"]}, self._summary_view(doc)))
+        await self.summaries.bulk_write(operations, ordered=False)
+        if views:
+            await self.headlines.bulk_write(views, ordered=False)
+        await self._notify_summaries(docs)
+        return len(operations)
+            
+    def _headline_query(self, days: Optional[int] = None, keywords: Optional[str] = None) -> Dict:
         query = {}
         
         if days:
@@ -63,13 +399,11 @@ class NewsStorage:
             query["timestamp"] = {"$gt": cutoff}
             
         if keywords:
-            query["keywords"] = {"$regex": keywords, "$options": "i"}
-            
-        cursor = self.headlines.find(query).sort("timestamp", DESCENDING)
-        return await cursor.to_list(length=None)
-            
-    async def get_summaries(self, days: Optional[int] = None, headline_id: Optional[str] = None) -> List[Dict]:
-        """본문 요약 조회"""
+            search, _ = self._search_filter(keywords)
+            query.update(search)
+        return query
+        
+    def _summary_query(self, days: Optional[int] = None, headline_id: Optional[str] = None) -> Dict:
         query = {}
         
         if days:
@@ -77,56 +411,175 @@ class NewsStorage:
             query["timestamp"] = {"$gt": cutoff}
             
         if headline_id:
-            query["headline_id"] = headline_id
+            # 요약의 headline_id는 ObjectId로 저장됨
+            query["headline_id"] = ObjectId(headline_id) if ObjectId.is_valid(headline_id) else headline_id
+        return query
+        
+    async def _find_page(self, collection, query: Dict, limit: int, cursor: Optional[str], fields: Optional[List[str]]) -> Dict:
+        """키셋 방식 페이지 조회 (limit + 1건을 읽어 다음 페이지 존재 여부 판단)"""
+        if cursor:
+            query = {"$and": [query, decode_cursor(cursor)]}
+        docs = await collection.find(query, make_projection(fields)).sort(KEYSET_SORT).limit(limit + 1).to_list(length=limit + 1)
+        next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+        return {"items": docs[:limit], "next_cursor": next_cursor}
+        
+    @timed("storage.iterate")
+    async def _iterate(self, collection, query: Dict, fields: Optional[List[str]], batch_size: int = 500) -> AsyncIterator[Dict]:
+        """Motor 커서를 배치 단위로 순회"""
+        cursor = collection.find(query, make_projection(fields)).sort(KEYSET_SORT).batch_size(batch_size)
+        async for doc in cursor:
+            yield doc
             
-        cursor = self.summaries.find(query).sort("timestamp", DESCENDING)
+    @timed("storage.get_headlines")
+    async def get_headlines(self, days: Optional[int] = None, keywords: Optional[str] = None, fields: Optional[List[str]] = None) -> List[Dict]:
+        """헤드라인 조회"""
+        cursor = self.headlines.find(self._headline_query(days, keywords), make_projection(fields)).sort(KEYSET_SORT)
         return await cursor.to_list(length=None)
+        
+    @timed("storage.get_headlines_page")
+    async def get_headlines_page(self, days: Optional[int] = None, keywords: Optional[str] = None, limit: int = 50, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> Dict:
+        """헤드라인 페이지 조회"""
+        return await self._find_page(self.headlines, self._headline_query(days, keywords), limit, cursor, fields)
+        
+    def iter_headlines(self, days: Optional[int] = None, keywords: Optional[str] = None, fields: Optional[List[str]] = None) -> AsyncIterator[Dict]:
+        """헤드라인 스트리밍 조회"""
+        return self._iterate(self.headlines, self._headline_query(days, keywords), fields)
             
-    async def search_news(self, keyword: str, days: Optional[int] = None) -> List[Dict]:
-        """키워드로 뉴스 검색"""
-        pipeline = []
-        
-        # 매칭 조건
-        match = {
-            "$or": [
-                {"title": {"$regex": keyword, "$options": "i"}},
-                {"keywords": {"$regex": keyword, "$options": "i"}},
-            ]
-        }
+    @timed("storage.get_summaries")
+    async def get_summaries(self, days: Optional[int] = None, headline_id: Optional[str] = None, fields: Optional[List[str]] = None) -> List[Dict]:
+        """본문 요약 조회"""
+        cursor = self.summaries.find(self._summary_query(days, headline_id), make_projection(fields)).sort(KEYSET_SORT)
+        return await cursor.to_list(length=None)
+        
+    @timed("storage.get_summaries_page")
+    async def get_summaries_page(self, days: Optional[int] = None, headline_id: Optional[str] = None, limit: int = 50, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> Dict:
+        """본문 요약 페이지 조회"""
+        return await self._find_page(self.summaries, self._summary_query(days, headline_id), limit, cursor, fields)
+        
+    @timed("storage.get_summaries_by_headline_ids")
+    async def get_summaries_by_headline_ids(self, headline_ids: List, days: Optional[int] = None) -> List[Dict]:
+        """헤드라인 id 목록으로 요약 조회"""
+        query = self._summary_query(days)
+        query["headline_id"] = {"$in": [ObjectId(i) if ObjectId.is_valid(i) else i for i in headline_ids]}
+        return await self.summaries.find(query).to_list(length=None)
+        
+    def iter_summaries(self, days: Optional[int] = None, headline_id: Optional[str] = None, fields: Optional[List[str]] = None) -> AsyncIterator[Dict]:
+        """본문 요약 스트리밍 조회"""
+        return self._iterate(self.summaries, self._summary_query(days, headline_id), fields)
+            
+    def _search_filter(self, keyword: str):
+        """검색어를 인덱스 기반 조건으로 변환
+        
+        - `ai*`        : 키워드 접두어 검색 (keywords 인덱스의 앵커 정규식)
+        - `"인공 지능"` : 구문 검색 (텍스트 인덱스)
+        - `ai 반도체`   : 토큰 검색 (텍스트 인덱스, 관련도 점수 정렬)
+        """
+        keyword = keyword.strip()
+        if keyword.endswith("*") and not keyword.startswith('"') and " " not in keyword:
+            prefix = keyword.rstrip("*").lower()
+            return {"keywords": {"$regex": "^" + re.escape(prefix)}}, False
+        return {"$text": {"$search": keyword}}, True
+        
+    def _search_cursor(self, keyword: str, days: Optional[int] = None, limit: Optional[int] = None, cursor: Optional[str] = None):
+        """검색 커서 구성 (limit 지정 시 키셋 페이지 단위)
+        
+        요약/분석은 헤드라인 문서에 복사되어 있으므로 조인 없이 헤드라인 인덱스만 사용한다.
+        """
+        match, ranked = self._search_filter(keyword)
         
         if days:
             cutoff = datetime.now() - timedelta(days=days)
             match["timestamp"] = {"$gt": cutoff}
+        if cursor:
+            match = {"$and": [match, decode_cursor(cursor)]}
             
-        pipeline.append({"$match": match})
-        
-        # 요약 정보 조인
-        pipeline.extend([
-            {
-                "$lookup": {
-                    "from": "summaries",
-                    "localField": "_id",
-                    "foreignField": "headline_id",
-                    "as": "summary_info"
-                }
-            },
-            {
-                "$unwind": {
-                    "path": "$summary_info",
-                    "preserveNullAndEmptyArrays": True
-                }
-            },
-            {
-                "$project": {
-                    "title": 1,
-                    "url": 1,
-                    "source": 1,
-                    "keywords": 1,
-                    "timestamp": 1,
-                    "summary": "$summary_info.summary",
-                    "analysis": "$summary_info.analysis"
-                }
-            }
-        ])
-        
-        return await self.headlines.aggregate(pipeline).to_list(None) 
\ No newline at end of file
+        projection = dict(SEARCH_FIELDS)
+        if ranked:
+            projection["score"] = {"$meta": "textScore"}
+            
+        # 페이지 조회는 (timestamp, _id) 순, 전체 조회는 관련도 순 (접두어 검색은 최신순)
+        if limit is not None:
+            return self.headlines.find(match, projection).sort(KEYSET_SORT).limit(limit)
+        if ranked:
+            return self.headlines.find(match, projection).sort([("score", {"$meta": "textScore"}), ("timestamp", DESCENDING)])
+        return self.headlines.find(match, projection).sort("timestamp", DESCENDING)
+        
+    @timed("storage.search_news")
+    async def search_news(self, keyword: str, days: Optional[int] = None) -> List[Dict]:
+        """키워드로 뉴스 검색"""
+        return await self._search_cursor(keyword, days).to_list(None)
+        
+    @timed("storage.search_news_page")
+    async def search_news_page(self, keyword: str, days: Optional[int] = None, limit: int = 50, cursor: Optional[str] = None) -> Dict:
+        """키워드 검색 페이지 조회"""
+        docs = await self._search_cursor(keyword, days, limit + 1, cursor).to_list(None)
+        next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+        return {"items": docs[:limit], "next_cursor": next_cursor}
+        
+    @timed("storage.iter_search_news")
+    async def iter_search_news(self, keyword: str, days: Optional[int] = None) -> AsyncIterator[Dict]:
+        """키워드 검색 스트리밍 조회"""
+        async for doc in self._search_cursor(keyword, days).batch_size(500):
+            yield doc
+            
+    @timed("storage.expire_summary_view")
+    async def expire_summary_view(self) -> int:
+        """보관 기간이 지난 요약을 헤드라인 문서에서 제거 (요약 컬렉션 TTL과 같은 기준)"""
+        cutoff = datetime.now() - timedelta(days=SUMMARY_TTL_DAYS)
+        result = await self.headlines.update_many(
+            {"summarized_at": {"$lte": cutoff}},
+            {"$unset": {"summary": "", "analysis": "", "summarized_at": ""}}
+        )
+        return result.modified_count
+        
+    @timed("storage.archive_summaries")
+    async def archive_summaries(self, after_days: int = SUMMARY_TTL_DAYS - 2) -> int:
+        """TTL 삭제 전의 오래된 요약을 월별 보관본으로 묶음 (본문 제외, 문서당 ARCHIVE_BUCKET_SIZE건)
+        
+        여러 워커가 동시에 실행해도 같은 요약이 두 번 보관되지 않도록 먼저 실행 토큰으로 표시한 뒤 옮긴다.
+        옮기다 실패하면 이번 실행의 보관본을 지우고 표시를 되돌려 다음 실행에서 다시 보관한다.
+        """
+        cutoff = datetime.now() - timedelta(days=after_days)
+        token = ObjectId()
+        await self.summaries.update_many(
+            {"timestamp": {"$lte": cutoff}, "archived": {"$exists": False}},
+            {"$set": {"archived": token}}
+        )
+        try:
+            return await self._archive_claimed(token)
+        except Exception:
+            await self.summary_archive.delete_many({"token": token})
+            await self.summaries.update_many({"archived": token}, {"$unset": {"archived": ""}})
+            raise
+            
+    async def _archive_claimed(self, token: ObjectId) -> int:
+        months: Dict[str, List[Dict]] = {}
+        cursor = self.summaries.find(
+            {"archived": token},
+            {"headline_id": 1, "timestamp": 1, "summary": 1, "analysis": 1}
+        ).sort("timestamp", ASCENDING)
+        async for doc in cursor:
+            months.setdefault(doc["timestamp"].strftime("%Y-%m"), []).append({
+                "headline_id": doc.get("headline_id"),
+                "timestamp": doc["timestamp"],
+                "summary": doc["summary"],
+                "analysis": doc.get("analysis", {})
+            })
+            
+        buckets = [
+            {"month": month, "count": len(items[i:i + ARCHIVE_BUCKET_SIZE]), "items": items[i:i + ARCHIVE_BUCKET_SIZE], "archived_at": datetime.now(), "token": token}
+            for month, items in months.items()
+            for i in range(0, len(items), ARCHIVE_BUCKET_SIZE)
+        ]
+        if buckets:
+            await self.summary_archive.insert_many(buckets, ordered=False)
+        return sum(bucket["count"] for bucket in buckets)
+        
+    @timed("storage.get_archive")
+    async def get_archive(self, month: str) -> List[Dict]:
+        """월별 요약 보관본 조회 (month: YYYY-MM)"""
+        items = []
+        async for bucket in self.summary_archive.find({"month": month}):
+            items.extend(bucket["items"])
+        items.sort(key=lambda item: item["timestamp"], reverse=True)
+        return items
\ No newline at end of file
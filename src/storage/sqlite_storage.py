@@ -0,0 +1,937 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+import asyncio
+import base64
+import json
+import os
+import sqlite3
+
+from bson import ObjectId
+
+from ..analytics.trends import ALL_SOURCES, count_increments, counter_expiry
+from ..cache.shared_store import SQLiteCacheTier
+from ..metrics.telemetry import timed
+from ..text.dedup import band_keys, decode
+from .news_storage import (
+    ARCHIVE_BUCKET_SIZE, DOC_COUNT_KEY, INTERNAL_FIELDS, SUMMARY_TTL_DAYS, encode_cursor, parse_cursor
+)
+
+# 헤드라인/작업/체크포인트 보관 기간 (MongoDB TTL 인덱스와 같은 기준)
+HEADLINE_TTL_DAYS = 365
+JOB_TTL_DAYS = 7
+
+# 제목/키워드/요약 검색 가중치 (bm25 열 순서)
+FTS_WEIGHTS = (3.0, 5.0, 1.0)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS headlines (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    timestamp TEXT NOT NULL,
+    title TEXT,
+    url TEXT UNIQUE,
+    source TEXT,
+    keywords TEXT NOT NULL DEFAULT '[]',
+    minhash BLOB,
+    canonical_id TEXT,
+    duplicates TEXT,
+    summary TEXT,
+    analysis TEXT,
+    summarized_at TEXT
+);
+CREATE INDEX IF NOT EXISTS headlines_keyset ON headlines (timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS headlines_summarized_at ON headlines (summarized_at) WHERE summarized_at IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS headline_bands (
+    band INTEGER NOT NULL,
+    headline_id TEXT NOT NULL,
+    PRIMARY KEY (band, headline_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS headline_bands_headline ON headline_bands (headline_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS headlines_fts USING fts5(
+    title, keywords, summary,
+    content='headlines', content_rowid='seq', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS headlines_fts_insert AFTER INSERT ON headlines BEGIN
+    INSERT INTO headlines_fts (rowid, title, keywords, summary) VALUES (new.seq, new.title, new.keywords, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS headlines_fts_delete AFTER DELETE ON headlines BEGIN
+    INSERT INTO headlines_fts (headlines_fts, rowid, title, keywords, summary) VALUES ('delete', old.seq, old.title, old.keywords, old.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS headlines_fts_update AFTER UPDATE OF title, keywords, summary ON headlines
+WHEN old.title IS NOT new.title OR old.keywords IS NOT new.keywords OR old.summary IS NOT new.summary BEGIN
+    INSERT INTO headlines_fts (headlines_fts, rowid, title, keywords, summary) VALUES ('delete', old.seq, old.title, old.keywords, old.summary);
+    INSERT INTO headlines_fts (rowid, title, keywords, summary) VALUES (new.seq, new.title, new.keywords, new.summary);
+END;
+
+CREATE TABLE IF NOT EXISTS summaries (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    timestamp TEXT NOT NULL,
+    headline_id TEXT,
+    summary TEXT NOT NULL,
+    content TEXT,
+    analysis TEXT NOT NULL DEFAULT '{}',
+    archived TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS summaries_headline ON summaries (headline_id) WHERE headline_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS summaries_keyset ON summaries (timestamp DESC, id DESC);
+
+CREATE TABLE IF NOT EXISTS summary_archive (
+    seq INTEGER PRIMARY KEY,
+    month TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    items TEXT NOT NULL,
+    archived_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS summary_archive_month ON summary_archive (month);
+
+CREATE TABLE IF NOT EXISTS term_stats (
+    term TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS keyword_trends (
+    window TEXT NOT NULL,
+    source TEXT NOT NULL,
+    term TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    expires_at TEXT NOT NULL,
+    PRIMARY KEY (window, source, term)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS keyword_trends_top ON keyword_trends (window, source, count DESC, term);
+CREATE INDEX IF NOT EXISTS keyword_trends_expires_at ON keyword_trends (expires_at);
+
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    worker TEXT,
+    started_at TEXT,
+    lease_until TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    finished_at TEXT,
+    outcome TEXT,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ingest_jobs_claim ON ingest_jobs (status, priority, created_at);
+CREATE INDEX IF NOT EXISTS ingest_jobs_finished_at ON ingest_jobs (finished_at) WHERE finished_at IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS saved_queries (
+    id TEXT PRIMARY KEY,
+    next_run_at TEXT NOT NULL,
+    interval_seconds REAL NOT NULL,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS saved_queries_next_run_at ON saved_queries (next_run_at);
+
+CREATE TABLE IF NOT EXISTS workflow_runs (
+    id TEXT PRIMARY KEY,
+    updated_at TEXT NOT NULL,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS workflow_runs_updated_at ON workflow_runs (updated_at);
+"""
+
+def _iso(value: datetime) -> str:
+    """정렬 가능한 고정 형식 시각 문자열"""
+    return value.isoformat(timespec="microseconds")
+
+def _datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+def _new_id() -> str:
+    return str(ObjectId())
+
+def _encode(value):
+    """JSON 문서의 datetime/bytes/ObjectId 직렬화"""
+    if isinstance(value, datetime):
+        return {"$date": _iso(value)}
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode()}
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(value).__name__}")
+
+def _decode(obj: Dict):
+    if len(obj) == 1:
+        if "$date" in obj:
+            return datetime.fromisoformat(obj["$date"])
+        if "$bytes" in obj:
+            return base64.b64decode(obj["$bytes"])
+    return obj
+
+dumps = partial(json.dumps, default=_encode, ensure_ascii=False)
+loads = partial(json.loads, object_hook=_decode)
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+def fts_query(keyword: str) -> Tuple[Optional[str], bool]:
+    """검색어를 FTS5 질의로 변환 (news_storage._search_filter와 같은 문법)
+
+    - `ai*`        : 키워드 열 접두어 검색 (최신순)
+    - `"인공 지능"` : 구문 검색
+    - `ai 반도체`   : 토큰 OR 검색 (bm25 관련도 순)
+    """
+    keyword = keyword.strip()
+    if keyword.endswith("*") and not keyword.startswith('"') and " " not in keyword:
+        prefix = keyword.rstrip("*").lower()
+        return (f"keywords : {_quote(prefix)} *" if prefix else None), False
+    if keyword.startswith('"') and keyword.endswith('"') and len(keyword) > 1:
+        phrase = keyword.strip('"').strip()
+        if not phrase:
+            raise ValueError("검색어를 입력해주세요.")
+        return _quote(phrase), True
+    terms = [term for term in keyword.replace('"', " ").split() if term]
+    if not terms:
+        raise ValueError("검색어를 입력해주세요.")
+    return " OR ".join(_quote(term) for term in terms), True
+
+def project(doc: Dict, fields: Optional[List[str]]) -> Dict:
+    """news_storage.make_projection과 같은 규칙의 필드 선택"""
+    excluded = [field[1:] for field in fields or [] if field.startswith("-")]
+    if not fields or excluded:
+        for field in [*excluded, *INTERNAL_FIELDS]:
+            if field != "timestamp":
+                doc.pop(field, None)
+        return doc
+    keep = {"_id", "timestamp", *fields} - set(INTERNAL_FIELDS)
+    return {key: value for key, value in doc.items() if key in keep}
+
+def _headline(row: sqlite3.Row) -> Dict:
+    keys = row.keys()
+    doc = {
+        "_id": row["id"],
+        "timestamp": _datetime(row["timestamp"]),
+        "title": row["title"],
+        "url": row["url"],
+        "source": row["source"],
+        "keywords": json.loads(row["keywords"])
+    }
+    # 값이 있을 때만 존재하는 필드 (MongoDB 문서와 같은 모양)
+    if "minhash" in keys and row["minhash"] is not None:
+        doc["minhash"] = row["minhash"]
+    if "canonical_id" in keys and row["canonical_id"] is not None:
+        doc["canonical_id"] = row["canonical_id"]
+    if "duplicates" in keys and row["duplicates"] is not None:
+        doc["duplicates"] = json.loads(row["duplicates"])
+    if row["summary"] is not None:
+        doc["summary"] = row["summary"]
+        doc["analysis"] = json.loads(row["analysis"] or "{}")
+    if "summarized_at" in keys and row["summarized_at"] is not None:
+        doc["summarized_at"] = _datetime(row["summarized_at"])
+    if "score" in keys:
+        doc["score"] = row["score"]
+    return doc
+
+def _summary(row: sqlite3.Row) -> Dict:
+    return {
+        "_id": row["id"],
+        "timestamp": _datetime(row["timestamp"]),
+        "headline_id": row["headline_id"],
+        "summary": row["summary"],
+        "content": row["content"],
+        "analysis": json.loads(row["analysis"])
+    }
+
+class SQLiteNewsStorage:
+    """SQLite 내장 뉴스 저장소 (NEWS_STORAGE_BACKEND=sqlite, NewsStorage와 같은 인터페이스)
+
+    WAL 모드 파일 하나에 헤드라인/요약/작업 큐/체크포인트/캐시를 모두 둔다.
+    쓰기는 전용 스레드 하나에서 모아서(그룹 커밋) 한 트랜잭션으로 기록하고,
+    읽기는 읽기 전용 연결 풀에서 스레드로 실행해 이벤트 루프를 막지 않는다.
+    TTL 인덱스 대신 purge_expired()가 보관 기간이 지난 문서를 지운다.
+    """
+    def __init__(self, path: str = "news.db", read_pool_size: int = 4):
+        self.path = path
+        self.read_pool_size = read_pool_size
+
+        # 요약 저장 후 호출되는 리스너 (예: 벡터 인덱스 증분 반영)
+        self.summary_listeners: List[Callable[[List[Dict]], Awaitable]] = []
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._readers: Optional[asyncio.Queue] = None
+        self._reader_conns: List[sqlite3.Connection] = []
+        self._pending: List[Tuple[Callable, asyncio.Future]] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._initialized = False
+
+    def _connect(self, readonly: bool = False) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if readonly:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def _open_writer(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._writer_conn = self._connect()
+        self._writer_conn.executescript(SCHEMA)
+
+    @timed("storage.init")
+    async def init(self):
+        """스키마 생성 및 쓰기 스레드/읽기 연결 풀 준비 (여러 번 호출해도 한 번만 수행)"""
+        if self._initialized:
+            return
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self._initialized:
+                return
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+            await asyncio.get_running_loop().run_in_executor(self._writer, self._open_writer)
+            self._readers = asyncio.Queue()
+            for _ in range(self.read_pool_size):
+                conn = await asyncio.to_thread(self._connect, True)
+                self._reader_conns.append(conn)
+                self._readers.put_nowait(conn)
+            self._initialized = True
+
+    def close(self):
+        for conn in self._reader_conns:
+            conn.close()
+        self._reader_conns = []
+        if self._writer is not None:
+            if self._writer_conn is not None:
+                self._writer.submit(self._writer_conn.close).result()
+            self._writer.shutdown()
+        self._writer = self._writer_conn = self._readers = None
+        self._initialized = False
+
+    def job_store(self) -> "SQLiteJobStore":
+        """수집 작업 큐 저장소"""
+        return SQLiteJobStore(self)
+
+    def checkpoint_store(self) -> "SQLiteCheckpointStore":
+        """수집 워크플로우 체크포인트 저장소"""
+        return SQLiteCheckpointStore(self)
+
+    def cache_tier(self, namespace: str, ttl_seconds: int) -> SQLiteCacheTier:
+        """LLM 결과 등의 영구 캐시 계층 (같은 데이터베이스 파일의 cache 테이블)"""
+        return SQLiteCacheTier(self.path, namespace, ttl_seconds=ttl_seconds)
+
+    def _apply(self, operations: List[Callable[[sqlite3.Connection], Any]]) -> List[Tuple[Optional[BaseException], Any]]:
+        """쓰기 스레드에서 모인 작업을 한 트랜잭션으로 실행 (작업별 savepoint로 실패 격리)"""
+        conn = self._writer_conn
+        results = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for operation in operations:
+                conn.execute("SAVEPOINT op")
+                try:
+                    results.append((None, operation(conn)))
+                    conn.execute("RELEASE op")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO op")
+                    conn.execute("RELEASE op")
+                    results.append((e, None))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return results
+
+    async def _flush(self):
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                results = await loop.run_in_executor(self._writer, self._apply, [operation for operation, _ in batch])
+            except Exception as e:
+                results = [(e, None)] * len(batch)
+            for (_, future), (error, value) in zip(batch, results):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(value)
+
+    async def _write(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        """쓰기 작업 예약 (진행 중인 커밋이 끝나면 그동안 모인 작업을 한 번에 기록)"""
+        await self.init()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((operation, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush())
+        return await future
+
+    async def _read(self, query: Callable[[sqlite3.Connection], Any]) -> Any:
+        await self.init()
+        conn = await self._readers.get()
+        try:
+            return await asyncio.to_thread(query, conn)
+        finally:
+            self._readers.put_nowait(conn)
+
+    async def _fetch(self, sql: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        return await self._read(lambda conn: conn.execute(sql, params).fetchall())
+
+    @timed("storage.iterate")
+    async def _iterate(self, sql: str, params: Tuple, convert: Callable[[sqlite3.Row], Dict]) -> AsyncIterator[Dict]:
+        """결과를 먼저 읽고 읽기 연결을 반납한 뒤 순회 (느린 소비자가 연결 풀을 붙잡지 않도록)"""
+        for row in await self._fetch(sql, params):
+            yield convert(row)
+
+    async def _notify_summaries(self, docs: List[Dict]):
+        for listener in self.summary_listeners:
+            await listener(docs)
+
+    def _headline_doc(self, headline: Dict) -> Dict:
+        return {
+            "timestamp": datetime.now(),
+            "title": headline["title"],
+            "url": headline.get("url"),
+            "source": headline.get("source"),
+            "keywords": headline.get("keywords", []),
+            "minhash": headline.get("minhash")
+        }
+
+    def _summary_doc(self, summary: Dict) -> Dict:
+        headline_id = summary.get("headline_id")
+        return {
+            "timestamp": datetime.now(),
+            "headline_id": str(headline_id) if headline_id is not None else None,
+            "summary": summary["summary"],
+            "content": summary.get("content"),
+            "analysis": summary.get("analysis", {})
+        }
+
+    def _upsert_headlines(self, docs: List[Dict], conn: sqlite3.Connection) -> List[str]:
+        """URL 기준 upsert (최초 수집 시점은 유지), 입력 순서대로 id 반환
+
+        새로 저장된 헤드라인의 키워드 집계도 같은 트랜잭션에서 반영한다.
+        """
+        ids, inserted = [], []
+        for doc in docs:
+            new_id = _new_id()
+            row = conn.execute(
+                "INSERT INTO headlines (id, timestamp, title, url, source, keywords, minhash) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET title = excluded.title, source = excluded.source, "
+                "keywords = excluded.keywords, minhash = COALESCE(excluded.minhash, headlines.minhash) "
+                "RETURNING id",
+                (new_id, _iso(doc["timestamp"]), doc["title"], doc["url"], doc["source"],
+                 json.dumps(doc["keywords"], ensure_ascii=False), doc["minhash"])
+            ).fetchone()
+            ids.append(row["id"])
+            if row["id"] == new_id:
+                inserted.append(doc)
+            # 근접 중복 탐지용 LSH 밴드 키
+            if doc["minhash"] is not None:
+                conn.execute("DELETE FROM headline_bands WHERE headline_id = ?", (row["id"],))
+                conn.executemany(
+                    "INSERT INTO headline_bands (band, headline_id) VALUES (?, ?)",
+                    [(band, row["id"]) for band in band_keys(decode(doc["minhash"]))]
+                )
+        self._add_keyword_counts(count_increments(inserted), conn)
+        return ids
+
+    @timed("storage.save_headline")
+    async def save_headline(self, headline: Dict):
+        """헤드라인 저장 (1년)"""
+        ids = await self._write(partial(self._upsert_headlines, [self._headline_doc(headline)]))
+        return ids[0]
+
+    @timed("storage.save_headlines_bulk")
+    async def save_headlines_bulk(self, headlines: List[Dict]) -> List:
+        """헤드라인 일괄 upsert (입력 순서대로 id 반환)"""
+        if not headlines:
+            return []
+        return await self._write(partial(self._upsert_headlines, [self._headline_doc(headline) for headline in headlines]))
+
+    def _upsert_summaries(self, docs: List[Dict], conn: sqlite3.Connection) -> List[str]:
+        """headline_id 기준 요약 upsert 후 헤드라인에 최신 요약/분석 복사"""
+        ids = []
+        for doc in docs:
+            timestamp, analysis = _iso(doc["timestamp"]), json.dumps(doc["analysis"], ensure_ascii=False)
+            row = conn.execute(
+                "INSERT INTO summaries (id, timestamp, headline_id, summary, content, analysis) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (headline_id) WHERE headline_id IS NOT NULL DO UPDATE SET timestamp = excluded.timestamp, "
+                "summary = excluded.summary, content = excluded.content, analysis = excluded.analysis, archived = NULL "
+                "RETURNING id",
+                (_new_id(), timestamp, doc["headline_id"], doc["summary"], doc["content"], analysis)
+            ).fetchone()
+            ids.append(row["id"])
+            if doc["headline_id"] is not None:
+                conn.execute(
+                    "UPDATE headlines SET summary = ?, analysis = ?, summarized_at = ? WHERE id = ?",
+                    (doc["summary"], analysis, timestamp, doc["headline_id"])
+                )
+        return ids
+
+    @timed("storage.save_summary")
+    async def save_summary(self, summary: Dict):
+        """본문 요약 저장 (1개월)"""
+        summary_doc = self._summary_doc(summary)
+        ids = await self._write(partial(self._upsert_summaries, [summary_doc]))
+        await self._notify_summaries([summary_doc])
+        return ids[0]
+
+    @timed("storage.save_summaries_bulk")
+    async def save_summaries_bulk(self, summaries: List[Dict]) -> int:
+        """요약 일괄 저장 (headline_id 기준 upsert)"""
+        if not summaries:
+            return 0
+        docs = [self._summary_doc(summary) for summary in summaries]
+        await self._write(partial(self._upsert_summaries, docs))
+        await self._notify_summaries(docs)
+        return len(docs)
+
+    @timed("storage.existing_urls")
+    async def existing_urls(self, urls: List[str]) -> Set[str]:
+        """이미 저장된 URL 조회"""
+        urls = [url for url in urls if url]
+        if not urls:
+            return set()
+        rows = await self._fetch("SELECT url FROM headlines WHERE url IN (SELECT value FROM json_each(?))", (json.dumps(urls),))
+        return {row["url"] for row in rows}
+
+    @timed("storage.find_near_duplicates")
+    async def find_near_duplicates(self, signatures: List, days: int = 3) -> List[Dict]:
+        """LSH 밴드가 하나라도 겹치는 최근 대표 헤드라인 후보"""
+        bands = sorted({band for signature in signatures for band in band_keys(signature)})
+        if not bands:
+            return []
+        cutoff = _iso(datetime.now() - timedelta(days=days))
+        rows = await self._fetch(
+            "SELECT id, url, minhash FROM headlines WHERE id IN ("
+            "SELECT headline_id FROM headline_bands WHERE band IN (SELECT value FROM json_each(?))) "
+            "AND timestamp > ? AND canonical_id IS NULL AND minhash IS NOT NULL",
+            (json.dumps(bands), cutoff)
+        )
+        return [{"_id": row["id"], "url": row["url"], "minhash": row["minhash"]} for row in rows]
+
+    @timed("storage.link_duplicates")
+    async def link_duplicates(self, links: Dict):
+        """중복 헤드라인을 대표 헤드라인에 연결 (대표 문서에는 duplicates 목록 유지)"""
+        pairs = [(str(duplicate_id), str(canonical_id)) for duplicate_id, canonical_id in links.items() if duplicate_id != canonical_id]
+        if not pairs:
+            return
+
+        def link(conn: sqlite3.Connection):
+            conn.executemany("UPDATE headlines SET canonical_id = ? WHERE id = ?", [(canonical, duplicate) for duplicate, canonical in pairs])
+            conn.executemany(
+                "UPDATE headlines SET duplicates = (SELECT json_group_array(value) FROM ("
+                "SELECT value FROM json_each(COALESCE(headlines.duplicates, '[]')) UNION SELECT ?)) WHERE id = ?",
+                pairs
+            )
+        await self._write(link)
+
+    @timed("storage.load_term_stats")
+    async def load_term_stats(self) -> Tuple[int, Dict[str, int]]:
+        """키워드 DF 통계 조회 (전체 문서 수, 용어별 DF)"""
+        doc_count, df = 0, {}
+        for row in await self._fetch("SELECT term, count FROM term_stats"):
+            if row["term"] == DOC_COUNT_KEY:
+                doc_count = row["count"]
+            else:
+                df[row["term"]] = row["count"]
+        return doc_count, df
+
+    @timed("storage.update_term_stats")
+    async def update_term_stats(self, doc_count: int, df: Dict[str, int]):
+        """키워드 DF 통계 증분 반영"""
+        if not doc_count:
+            return
+        rows = [(DOC_COUNT_KEY, doc_count), *df.items()]
+        await self._write(lambda conn: conn.executemany(
+            "INSERT INTO term_stats (term, count) VALUES (?, ?) ON CONFLICT (term) DO UPDATE SET count = count + excluded.count",
+            rows
+        ))
+
+    def _add_keyword_counts(self, increments: Dict[Tuple[str, str, str], int], conn: sqlite3.Connection):
+        conn.executemany(
+            "INSERT INTO keyword_trends (window, source, term, count, expires_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (window, source, term) DO UPDATE SET count = count + excluded.count",
+            [(window, source, term, count, _iso(counter_expiry(window))) for (window, source, term), count in increments.items()]
+        )
+
+    @timed("storage.add_keyword_counts")
+    async def add_keyword_counts(self, increments: Dict[Tuple[str, str, str], int]):
+        """(구간 키, 출처, 키워드)별 집계 증분 반영"""
+        if increments:
+            await self._write(partial(self._add_keyword_counts, increments))
+
+    @timed("storage.top_keywords")
+    async def top_keywords(self, window: str, source: str = ALL_SOURCES, k: int = 10) -> List[Tuple[str, int]]:
+        """구간의 상위 k개 키워드 (횟수 내림차순)"""
+        rows = await self._fetch(
+            "SELECT term, count FROM keyword_trends WHERE window = ? AND source = ? ORDER BY count DESC, term LIMIT ?",
+            (window, source, k)
+        )
+        return [(row["term"], row["count"]) for row in rows]
+
+    async def keyword_counts(self, window: str, source: str, terms: List[str]) -> Dict[str, int]:
+        """구간의 지정 키워드 집계"""
+        if not terms:
+            return {}
+        rows = await self._fetch(
+            f"SELECT term, count FROM keyword_trends WHERE window = ? AND source = ? AND term IN ({', '.join('?' * len(terms))})",
+            (window, source, *terms)
+        )
+        return {row["term"]: row["count"] for row in rows}
+
+    async def reset_keyword_counts(self) -> int:
+        """키워드 집계 전체 삭제 (재집계 전)"""
+        return await self._write(lambda conn: conn.execute("DELETE FROM keyword_trends").rowcount)
+
+    def _where(self, clauses: List[str]) -> str:
+        return " WHERE " + " AND ".join(clauses) if clauses else ""
+
+    def _headline_filter(self, days: Optional[int] = None, keywords: Optional[str] = None) -> Tuple[List[str], List]:
+        clauses, params = [], []
+        if days:
+            clauses.append("timestamp > ?")
+            params.append(_iso(datetime.now() - timedelta(days=days)))
+        if keywords:
+            match, _ = fts_query(keywords)
+            if match is not None:
+                clauses.append("seq IN (SELECT rowid FROM headlines_fts WHERE headlines_fts MATCH ?)")
+                params.append(match)
+        return clauses, params
+
+    def _summary_filter(self, days: Optional[int] = None, headline_id: Optional[str] = None) -> Tuple[List[str], List]:
+        clauses, params = [], []
+        if days:
+            clauses.append("timestamp > ?")
+            params.append(_iso(datetime.now() - timedelta(days=days)))
+        if headline_id:
+            clauses.append("headline_id = ?")
+            params.append(str(headline_id))
+        return clauses, params
+
+    def _keyset(self, clauses: List[str], params: List, cursor: Optional[str], prefix: str = ""):
+        if cursor:
+            timestamp, last_id = parse_cursor(cursor)
+            clauses.append(f"({prefix}timestamp, {prefix}id) < (?, ?)")
+            params.extend([_iso(timestamp), last_id])
+
+    async def _find_page(self, table: str, convert, clauses: List[str], params: List, limit: int, cursor: Optional[str], fields: Optional[List[str]]) -> Dict:
+        """키셋 방식 페이지 조회 (limit + 1건을 읽어 다음 페이지 존재 여부 판단)"""
+        self._keyset(clauses, params, cursor)
+        rows = await self._fetch(
+            f"SELECT * FROM {table}{self._where(clauses)} ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (*params, limit + 1)
+        )
+        docs = [project(convert(row), fields) for row in rows]
+        next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+        return {"items": docs[:limit], "next_cursor": next_cursor}
+
+    @timed("storage.get_headlines")
+    async def get_headlines(self, days: Optional[int] = None, keywords: Optional[str] = None, fields: Optional[List[str]] = None) -> List[Dict]:
+        """헤드라인 조회"""
+        clauses, params = self._headline_filter(days, keywords)
+        rows = await self._fetch(f"SELECT * FROM headlines{self._where(clauses)} ORDER BY timestamp DESC, id DESC", tuple(params))
+        return [project(_headline(row), fields) for row in rows]
+
+    @timed("storage.get_headlines_page")
+    async def get_headlines_page(self, days: Optional[int] = None, keywords: Optional[str] = None, limit: int = 50, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> Dict:
+        """헤드라인 페이지 조회"""
+        clauses, params = self._headline_filter(days, keywords)
+        return await self._find_page("headlines", _headline, clauses, params, limit, cursor, fields)
+
+    async def iter_headlines(self, days: Optional[int] = None, keywords: Optional[str] = None, fields: Optional[List[str]] = None) -> AsyncIterator[Dict]:
+        """헤드라인 스트리밍 조회"""
+        clauses, params = self._headline_filter(days, keywords)
+        sql = f"SELECT * FROM headlines{self._where(clauses)} ORDER BY timestamp DESC, id DESC"
+        async for doc in self._iterate(sql, tuple(params), _headline):
+            yield project(doc, fields)
+
+    @timed("storage.get_summaries")
+    async def get_summaries(self, days: Optional[int] = None, headline_id: Optional[str] = None, fields: Optional[List[str]] = None) -> List[Dict]:
+        """본문 요약 조회"""
+        clauses, params = self._summary_filter(days, headline_id)
+        rows = await self._fetch(f"SELECT * FROM summaries{self._where(clauses)} ORDER BY timestamp DESC, id DESC", tuple(params))
+        return [project(_summary(row), fields) for row in rows]
+
+    @timed("storage.get_summaries_page")
+    async def get_summaries_page(self, days: Optional[int] = None, headline_id: Optional[str] = None, limit: int = 50, cursor: Optional[str] = None, fields: Optional[List[str]] = None) -> Dict:
+        """본문 요약 페이지 조회"""
+        clauses, params = self._summary_filter(days, headline_id)
+        return await self._find_page("summaries", _summary, clauses, params, limit, cursor, fields)
+
+    @timed("storage.get_summaries_by_headline_ids")
+    async def get_summaries_by_headline_ids(self, headline_ids: List, days: Optional[int] = None) -> List[Dict]:
+        """헤드라인 id 목록으로 요약 조회"""
+        clauses, params = self._summary_filter(days)
+        clauses.append("headline_id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps([str(i) for i in headline_ids]))
+        rows = await self._fetch(f"SELECT * FROM summaries{self._where(clauses)}", tuple(params))
+        return [_summary(row) for row in rows]
+
+    async def iter_summaries(self, days: Optional[int] = None, headline_id: Optional[str] = None, fields: Optional[List[str]] = None) -> AsyncIterator[Dict]:
+        """본문 요약 스트리밍 조회"""
+        clauses, params = self._summary_filter(days, headline_id)
+        sql = f"SELECT * FROM summaries{self._where(clauses)} ORDER BY timestamp DESC, id DESC"
+        async for doc in self._iterate(sql, tuple(params), _summary):
+            yield project(doc, fields)
+
+    def _search_sql(self, keyword: str, days: Optional[int] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[str, Tuple]:
+        """검색 질의 구성 (limit 지정 시 키셋 페이지 단위)
+
+        요약/분석은 헤드라인 행에 복사되어 있으므로 FTS 색인과 헤드라인만 조회한다.
+        """
+        match, ranked = fts_query(keyword)
+        columns = "h.id, h.timestamp, h.title, h.url, h.source, h.keywords, h.summary, h.analysis"
+        clauses, params = [], []
+        if match is not None:
+            clauses.append("headlines_fts MATCH ?")
+            params.append(match)
+            source = "headlines_fts JOIN headlines h ON h.seq = headlines_fts.rowid"
+            if ranked:
+                weights = ", ".join(map(str, FTS_WEIGHTS))
+                columns += f", -bm25(headlines_fts, {weights}) AS score"
+        else:
+            source = "headlines h"
+        if days:
+            clauses.append("h.timestamp > ?")
+            params.append(_iso(datetime.now() - timedelta(days=days)))
+        self._keyset(clauses, params, cursor, prefix="h.")
+
+        # 페이지 조회는 (timestamp, id) 순, 전체 조회는 관련도 순 (접두어 검색은 최신순)
+        if limit is not None:
+            order = " ORDER BY h.timestamp DESC, h.id DESC LIMIT ?"
+            params.append(limit)
+        elif ranked:
+            order = " ORDER BY score DESC, h.timestamp DESC"
+        else:
+            order = " ORDER BY h.timestamp DESC"
+        return f"SELECT {columns} FROM {source}{self._where(clauses)}{order}", tuple(params)
+
+    @timed("storage.search_news")
+    async def search_news(self, keyword: str, days: Optional[int] = None) -> List[Dict]:
+        """키워드로 뉴스 검색"""
+        return [_headline(row) for row in await self._fetch(*self._search_sql(keyword, days))]
+
+    @timed("storage.search_news_page")
+    async def search_news_page(self, keyword: str, days: Optional[int] = None, limit: int = 50, cursor: Optional[str] = None) -> Dict:
+        """키워드 검색 페이지 조회"""
+        docs = [_headline(row) for row in await self._fetch(*self._search_sql(keyword, days, limit + 1, cursor))]
+        next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+        return {"items": docs[:limit], "next_cursor": next_cursor}
+
+    @timed("storage.iter_search_news")
+    async def iter_search_news(self, keyword: str, days: Optional[int] = None) -> AsyncIterator[Dict]:
+        """키워드 검색 스트리밍 조회"""
+        async for doc in self._iterate(*self._search_sql(keyword, days), _headline):
+            yield doc
+
+    @timed("storage.expire_summary_view")
+    async def expire_summary_view(self) -> int:
+        """보관 기간이 지난 요약을 헤드라인 행에서 제거"""
+        cutoff = _iso(datetime.now() - timedelta(days=SUMMARY_TTL_DAYS))
+        return await self._write(lambda conn: conn.execute(
+            "UPDATE headlines SET summary = NULL, analysis = NULL, summarized_at = NULL WHERE summarized_at <= ?",
+            (cutoff,)
+        ).rowcount)
+
+    @timed("storage.archive_summaries")
+    async def archive_summaries(self, after_days: int = SUMMARY_TTL_DAYS - 2) -> int:
+        """삭제 전의 오래된 요약을 월별 보관본으로 묶음 (본문 제외, 문서당 ARCHIVE_BUCKET_SIZE건)
+
+        표시와 보관본 기록이 한 트랜잭션이므로 여러 프로세스가 동시에 실행해도 두 번 보관되지 않는다.
+        """
+        cutoff = _iso(datetime.now() - timedelta(days=after_days))
+        token = _new_id()
+
+        def archive(conn: sqlite3.Connection) -> int:
+            rows = conn.execute(
+                "UPDATE summaries SET archived = ? WHERE timestamp <= ? AND archived IS NULL "
+                "RETURNING headline_id, timestamp, summary, analysis",
+                (token, cutoff)
+            ).fetchall()
+            months: Dict[str, List[Dict]] = {}
+            for row in sorted(rows, key=lambda row: row["timestamp"]):
+                months.setdefault(row["timestamp"][:7], []).append({
+                    "headline_id": row["headline_id"],
+                    "timestamp": _datetime(row["timestamp"]),
+                    "summary": row["summary"],
+                    "analysis": json.loads(row["analysis"])
+                })
+            archived_at = _iso(datetime.now())
+            conn.executemany(
+                "INSERT INTO summary_archive (month, count, items, archived_at) VALUES (?, ?, ?, ?)",
+                [
+                    (month, len(items[i:i + ARCHIVE_BUCKET_SIZE]), dumps(items[i:i + ARCHIVE_BUCKET_SIZE]), archived_at)
+                    for month, items in months.items()
+                    for i in range(0, len(items), ARCHIVE_BUCKET_SIZE)
+                ]
+            )
+            return len(rows)
+        return await self._write(archive)
+
+    @timed("storage.get_archive")
+    async def get_archive(self, month: str) -> List[Dict]:
+        """월별 요약 보관본 조회 (month: YYYY-MM)"""
+        items = []
+        for row in await self._fetch("SELECT items FROM summary_archive WHERE month = ?", (month,)):
+            items.extend(loads(row["items"]))
+        items.sort(key=lambda item: item["timestamp"], reverse=True)
+        return items
+
+    @timed("storage.purge_expired")
+    async def purge_expired(self) -> int:
+        """보관 기간이 지난 헤드라인(1년)/요약(1개월)/작업·체크포인트(7일)/키워드 집계 삭제"""
+        now = datetime.now()
+        headline_cutoff = _iso(now - timedelta(days=HEADLINE_TTL_DAYS))
+        summary_cutoff = _iso(now - timedelta(days=SUMMARY_TTL_DAYS))
+        job_cutoff = _iso(now - timedelta(days=JOB_TTL_DAYS))
+
+        def purge(conn: sqlite3.Connection) -> int:
+            conn.execute(
+                "DELETE FROM headline_bands WHERE headline_id IN (SELECT id FROM headlines WHERE timestamp < ?)",
+                (headline_cutoff,)
+            )
+            deleted = conn.execute("DELETE FROM headlines WHERE timestamp < ?", (headline_cutoff,)).rowcount
+            deleted += conn.execute("DELETE FROM summaries WHERE timestamp < ?", (summary_cutoff,)).rowcount
+            deleted += conn.execute("DELETE FROM ingest_jobs WHERE finished_at < ?", (job_cutoff,)).rowcount
+            deleted += conn.execute("DELETE FROM workflow_runs WHERE updated_at < ?", (job_cutoff,)).rowcount
+            deleted += conn.execute("DELETE FROM keyword_trends WHERE expires_at < ?", (_iso(now),)).rowcount
+            return deleted
+        return await self._write(purge)
+
+class SQLiteJobStore:
+    """수집 작업/저장 검색어의 SQLite 저장소 (MongoJobStore와 같은 인터페이스)"""
+    def __init__(self, storage: SQLiteNewsStorage):
+        self.storage = storage
+
+    async def init(self):
+        await self.storage.init()
+
+    def _job(self, row: sqlite3.Row) -> Dict:
+        job = loads(row["doc"])
+        job["status"] = row["status"]
+        job["attempts"] = row["attempts"]
+        for field in ("worker", "started_at", "lease_until", "finished_at"):
+            if row[field] is not None:
+                job[field] = _datetime(row[field]) if field != "worker" else row[field]
+        if row["outcome"]:
+            job.update(loads(row["outcome"]))
+        return job
+
+    async def insert(self, job: Dict):
+        await self.storage._write(lambda conn: conn.execute(
+            "INSERT INTO ingest_jobs (id, status, priority, created_at, doc) VALUES (?, ?, ?, ?, ?)",
+            (job["_id"], job["status"], job["priority"], _iso(job["created_at"]), dumps(job))
+        ))
+
+    async def get(self, job_id: str) -> Optional[Dict]:
+        rows = await self.storage._fetch("SELECT * FROM ingest_jobs WHERE id = ?", (job_id,))
+        return self._job(rows[0]) if rows else None
+
+    async def get_run(self, job_id: str) -> Optional[Dict]:
+        """작업의 워크플로우 체크포인트 (기사 목록/기사별 진행 상태)"""
+        return await self.storage.checkpoint_store().load(job_id)
+
+    async def claim(self, worker_id: str, lease_seconds: int) -> Optional[Dict]:
+        """대기 중이거나 lease가 만료된 작업을 우선순위 순으로 점유 (쓰기 트랜잭션 안에서 조회와 갱신)"""
+        now = datetime.now()
+        row = await self.storage._write(lambda conn: conn.execute(
+            "UPDATE ingest_jobs SET status = 'running', worker = ?, started_at = ?, lease_until = ?, attempts = attempts + 1 "
+            "WHERE id = (SELECT id FROM ingest_jobs WHERE status = 'queued' OR (status = 'running' AND lease_until < ?) "
+            "ORDER BY priority, created_at LIMIT 1) RETURNING *",
+            (worker_id, _iso(now), _iso(now + timedelta(seconds=lease_seconds)), _iso(now))
+        ).fetchone())
+        return self._job(row) if row else None
+
+    async def renew(self, job_id: str, worker_id: str, lease_seconds: int):
+        lease_until = _iso(datetime.now() + timedelta(seconds=lease_seconds))
+        await self.storage._write(lambda conn: conn.execute(
+            "UPDATE ingest_jobs SET lease_until = ? WHERE id = ? AND worker = ?", (lease_until, job_id, worker_id)
+        ))
+
+    async def release(self, job_id: str, worker_id: str):
+        """점유 해제 후 다시 대기 상태로 (종료로 중단된 것이므로 시도 횟수에서 제외)"""
+        await self.storage._write(lambda conn: conn.execute(
+            "UPDATE ingest_jobs SET status = 'queued', lease_until = NULL, worker = NULL, attempts = attempts - 1 "
+            "WHERE id = ? AND worker = ?",
+            (job_id, worker_id)
+        ))
+
+    async def finish(self, job_id: str, update: Dict):
+        outcome = {key: value for key, value in update.items() if key not in ("status", "finished_at")}
+        await self.storage._write(lambda conn: conn.execute(
+            "UPDATE ingest_jobs SET status = ?, finished_at = ?, outcome = ?, lease_until = NULL WHERE id = ?",
+            (update["status"], _iso(update["finished_at"]), dumps(outcome), job_id)
+        ))
+
+    async def add_saved_query(self, saved: Dict) -> str:
+        saved_id = _new_id()
+        await self.storage._write(lambda conn: conn.execute(
+            "INSERT INTO saved_queries (id, next_run_at, interval_seconds, doc) VALUES (?, ?, ?, ?)",
+            (saved_id, _iso(saved["next_run_at"]), saved["interval_seconds"], dumps({"_id": saved_id, **saved}))
+        ))
+        return saved_id
+
+    async def next_due_saved_query(self, now: datetime) -> Optional[Dict]:
+        """실행 시각이 된 저장 검색어 하나를 꺼내고 다음 실행 시각을 갱신"""
+        def advance(conn: sqlite3.Connection):
+            row = conn.execute(
+                "SELECT id, interval_seconds, doc FROM saved_queries WHERE next_run_at <= ? LIMIT 1", (_iso(now),)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE saved_queries SET next_run_at = ? WHERE id = ?",
+                (_iso(now + timedelta(seconds=row["interval_seconds"])), row["id"])
+            )
+            return loads(row["doc"])
+        return await self.storage._write(advance)
+
+class SQLiteCheckpointStore:
+    """수집 워크플로우 실행 상태의 SQLite 저장소 (WorkflowCheckpointStore와 같은 인터페이스)
+
+    실행 문서 전체를 JSON 한 행으로 두고, 갱신은 쓰기 스레드에서 읽기-수정-쓰기로 처리한다.
+    """
+    def __init__(self, storage: SQLiteNewsStorage):
+        self.storage = storage
+
+    def _update(self, run_id: str, change: Callable[[Dict], None], conn: sqlite3.Connection):
+        row = conn.execute("SELECT doc FROM workflow_runs WHERE id = ?", (run_id,)).fetchone()
+        if row is None:
+            return
+        doc = loads(row["doc"])
+        change(doc)
+        conn.execute(
+            "UPDATE workflow_runs SET doc = ?, updated_at = ? WHERE id = ?",
+            (dumps(doc), _iso(datetime.now()), run_id)
+        )
+
+    async def load(self, run_id: str) -> Optional[Dict]:
+        rows = await self.storage._fetch("SELECT doc FROM workflow_runs WHERE id = ?", (run_id,))
+        return loads(rows[0]["doc"]) if rows else None
+
+    async def start(self, run_id: str, query: str):
+        doc = {"_id": run_id, "query": query, "status": "running", "items": None, "articles": {}}
+        await self.storage._write(lambda conn: conn.execute(
+            "INSERT INTO workflow_runs (id, updated_at, doc) VALUES (?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET updated_at = excluded.updated_at",
+            (run_id, _iso(datetime.now()), dumps(doc))
+        ))
+
+    async def save_items(self, run_id: str, items: List[Dict]):
+        """검색 결과 저장 (재시작 시 Tavily 재호출 방지)"""
+        await self.storage._write(partial(self._update, run_id, lambda doc: doc.update(items=items)))
+
+    async def update_articles(self, run_id: str, updates: Dict[str, Dict]):
+        """기사별 진행 상태 갱신 ({기사 키: {필드: 값}})"""
+        if not any(updates.values()):
+            return
+
+        def change(doc: Dict):
+            for key, values in updates.items():
+                doc["articles"].setdefault(key, {}).update(values)
+        await self.storage._write(partial(self._update, run_id, change))
+
+    async def finish(self, run_id: str, status: str = "done"):
+        await self.storage._write(partial(self._update, run_id, lambda doc: doc.update(status=status)))
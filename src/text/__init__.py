@@ -0,0 +1 @@
+# text package 
\ No newline at end of file
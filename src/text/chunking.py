@@ -0,0 +1,134 @@
+from typing import Callable, List, Optional
+import re
+
+from ..ratelimit.limiter import estimate_tokens
+
+# 모델별 컨텍스트 길이 (토큰)
+MODEL_CONTEXT_TOKENS = {
+    "gpt-3.5-turbo": 16385,
+    "gpt-4o-mini": 128000,
+    "gpt-4o": 128000
+}
+DEFAULT_CONTEXT_TOKENS = 4096
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+# 문장 경계 (영문/한글 마침표류 뒤 공백, 또는 공백 없이 이어지는 한국어 평서문 종결 "다.")
+SENTENCE_BREAK = re.compile(r"(?<=[.!?。！？])[\"'”’)\]]*\s+|(?<=다\.)(?=[가-힣])")
+
+# 기자 이름 목록 + "기자" (이름 사이는 공백으로 구분해 긴 한글 줄에서 역추적이 폭증하지 않도록 함)
+REPORTER = r"[가-힣]{2,4}(?:\s+[가-힣]{2,4})*\s*기자"
+
+# 본문과 무관한 줄 (바이라인, 저작권 문구, 관련 기사/공유 링크 블록)
+BOILERPLATE_LINE = re.compile(
+    r"^\s*(?:"
+    rf"{REPORTER}\s*(?:\S+@\S+)?\s*$|[\w.+-]+@[\w-]+\.[\w.]+\s*$|"
+    r"ⓒ|©|copyright\b|all rights reserved|무단\s*전재|재배포\s*금지|저작권자|"
+    r"[▶▷☞]|관련\s*기사|\[?관련뉴스|더\s*보기|많이\s*본\s*뉴스|"
+    r"(?:related|recommended)(?:\s+(?:articles?|stories|coverage|content))?\s*:?\s*$|"
+    r"read more\b|see also\b|sign up\b|subscribe\b|share (?:this|on)\b|follow us\b|advertisement\s*$|"
+    r"(?:(?:by|reporting by|editing by|written by)\s+(?-i:[A-Z][\w.'-]*(?:\s+[A-Z][\w.'-]*)*)\s*[;,]?\s*)+$"
+    r")",
+    re.IGNORECASE
+)
+
+# 본문 첫 줄 앞의 통신사 바이라인 (예: "(서울=연합뉴스) 홍길동 기자 = ")
+BYLINE_PREFIX = re.compile(rf"^\s*(?:\([^)]*\)\s*)?{REPORTER}\s*=\s*")
+
+def chunk_budget(model_name: str, prompt_tokens: int, output_tokens: int, max_tokens: int) -> int:
+    """청크 하나에 쓸 수 있는 토큰 수 (컨텍스트 길이 - 프롬프트 - 출력, max_tokens 이하)"""
+    available = MODEL_CONTEXT_TOKENS.get(model_name, DEFAULT_CONTEXT_TOKENS) - prompt_tokens - output_tokens
+    return max(1, min(max_tokens, available))
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\W+", "", text).lower()
+
+def strip_boilerplate(text: str) -> str:
+    """바이라인/저작권/관련 링크 줄과 반복 문단 제거"""
+    paragraphs, seen = [], set()
+    for paragraph in PARAGRAPH_BREAK.split(text or ""):
+        lines = [
+            BYLINE_PREFIX.sub("", line) for line in paragraph.splitlines()
+            if line.strip() and not BOILERPLATE_LINE.match(line)
+        ]
+        key = _normalize(" ".join(lines))
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs)
+
+class TokenChunker:
+    """토큰 예산 기준 문단/문장 경계 분할기
+
+    문단을 예산까지 채우고, 넘치는 문단은 문장 단위로, 넘치는 문장은 글자 단위로 나눈다.
+    청크 사이에는 overlap_tokens 이하의 끝 문장만 겹치며, 내용이 같은 청크는 한 번만 남긴다.
+    """
+    def __init__(self, max_tokens: int, overlap_tokens: int = 0, count: Optional[Callable[[str], int]] = None):
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.count = count or estimate_tokens
+
+    def _sentences(self, paragraph: str) -> List[str]:
+        sentences = []
+        for sentence in SENTENCE_BREAK.split(paragraph):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if self.count(sentence) <= self.max_tokens:
+                sentences.append(sentence)
+                continue
+            # 문장 하나가 예산을 넘으면 토큰 비율에 맞춰 글자 단위로 자름
+            size = max(1, len(sentence) * self.max_tokens // self.count(sentence))
+            sentences.extend(sentence[i:i + size] for i in range(0, len(sentence), size))
+        return sentences
+
+    def _units(self, text: str) -> List[str]:
+        """예산 안에 들어가는 분할 단위 (문단, 긴 문단은 문장)"""
+        units = []
+        for paragraph in PARAGRAPH_BREAK.split(text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if self.count(paragraph) <= self.max_tokens:
+                units.append(paragraph)
+            else:
+                units.extend(self._sentences(paragraph))
+        return units
+
+    def _overlap(self, units: List[str]) -> List[str]:
+        """다음 청크 앞에 붙일 끝 문장들 (overlap_tokens 이내)"""
+        if self.overlap_tokens <= 0 or not units:
+            return []
+        tail, tokens = [], 0
+        for sentence in reversed(self._sentences(units[-1])):
+            tokens += self.count(sentence)
+            if tokens > self.overlap_tokens:
+                break
+            tail.insert(0, sentence)
+        return [" ".join(tail)] if tail else []
+
+    def split_text(self, text: str) -> List[str]:
+        chunks, current, tokens = [], [], 0
+        for unit in self._units(strip_boilerplate(text)):
+            # 구분자 몫으로 단위마다 1토큰을 더해 예산을 넘지 않게 함
+            unit_tokens = self.count(unit) + 1
+            if current and tokens + unit_tokens > self.max_tokens:
+                chunks.append("\n\n".join(current))
+                current = self._overlap(current)
+                tokens = sum(self.count(part) + 1 for part in current)
+                if tokens + unit_tokens > self.max_tokens:
+                    current, tokens = [], 0
+            current.append(unit)
+            tokens += unit_tokens
+        if current:
+            chunks.append("\n\n".join(current))
+
+        # 반복 청크 제거 (순서 유지)
+        unique, seen = [], set()
+        for chunk in chunks:
+            key = _normalize(chunk)
+            if key not in seen:
+                seen.add(key)
+                unique.append(chunk)
+        return unique
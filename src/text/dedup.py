@@ -0,0 +1,84 @@
+from typing import Dict, List, Optional, Set
+import hashlib
+
+import numpy as np
+
+from .keywords import tokenize
+
+# MinHash 서명 길이와 LSH 밴드 분할 (16밴드 x 4행: 유사도 약 0.5부터 후보가 됨)
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# 순열 대신 쓰는 곱셈-시프트 해시 계수 (모든 프로세스에서 같은 값)
+_rng = np.random.default_rng(20240601)
+_MULTIPLIERS = _rng.integers(1, 2 ** 63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_OFFSETS = _rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)
+
+def _hash64(value: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "big")
+
+def shingles(text: str, size: int = 2) -> Set[str]:
+    """연속 토큰 n-gram 집합 (토큰이 적으면 단일 토큰)"""
+    tokens = tokenize(text)
+    if len(tokens) < size:
+        return set(tokens)
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+def minhash(text: str) -> np.ndarray:
+    """토큰 n-gram 집합의 MinHash 서명 (uint32 x NUM_PERM)"""
+    items = shingles(text)
+    if not items:
+        return np.full(NUM_PERM, np.iinfo(np.uint32).max, dtype=np.uint32)
+    hashes = np.fromiter((_hash64(item.encode("utf-8")) for item in items), dtype=np.uint64, count=len(items))
+    values = (hashes[:, None] * _MULTIPLIERS + _OFFSETS) >> np.uint64(32)
+    return values.min(axis=0).astype(np.uint32)
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """서명 일치 비율 (n-gram 집합 자카드 유사도 추정치)"""
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+def band_keys(signature: np.ndarray) -> List[int]:
+    """LSH 밴드 키 (밴드 번호 + 밴드 해시, 인덱스 조회용 양의 int64)"""
+    mask = (1 << 56) - 1
+    return [
+        band << 56 | _hash64(signature[band * ROWS:(band + 1) * ROWS].tobytes()) & mask
+        for band in range(BANDS)
+    ]
+
+def encode(signature: np.ndarray) -> bytes:
+    return signature.astype("<u4").tobytes()
+
+def decode(value: bytes) -> np.ndarray:
+    return np.frombuffer(value, dtype="<u4")
+
+def cluster(signatures: List[np.ndarray], threshold: float = 0.6) -> List[int]:
+    """유사도 threshold 이상인 기사끼리 묶어 항목별 대표(가장 앞선) 순번 반환"""
+    parent = list(range(len(signatures)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(signatures)):
+        for j in range(i + 1, len(signatures)):
+            if similarity(signatures[i], signatures[j]) >= threshold:
+                root_i, root_j = find(i), find(j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+    return [find(i) for i in range(len(signatures))]
+
+def nearest(signature: np.ndarray, candidates: List[Dict], threshold: float = 0.6) -> Optional[Dict]:
+    """저장된 후보(minhash 필드) 중 유사도가 가장 높은 문서"""
+    best, best_score = None, threshold
+    for candidate in candidates:
+        score = similarity(signature, decode(candidate["minhash"]))
+        if score >= best_score:
+            best, best_score = candidate, score
+    return best
+
+def is_duplicate(item: Dict) -> bool:
+    """다른 기사(같은 배치 또는 저장된 헤드라인)의 중복으로 표시된 기사"""
+    return "duplicate_of" in item or "canonical_id" in item
@@ -0,0 +1,103 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+import math
+import re
+
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-zA-Z][a-zA-Z0-9\-]*[a-zA-Z0-9]")
+
+ENGLISH_STOPWORDS = {
+    "the", "and", "but", "for", "with", "that", "this", "from", "have", "has", "had",
+    "was", "were", "are", "been", "being", "will", "would", "could", "should", "said",
+    "says", "about", "after", "before", "into", "over", "than", "then", "there", "their",
+    "they", "them", "what", "when", "where", "which", "while", "who", "whom", "why",
+    "also", "more", "most", "some", "such", "only", "other", "its", "not", "can", "may",
+    "our", "out", "all", "any", "new", "one", "two", "you", "your", "his", "her", "she",
+    "him", "how", "just", "like", "very", "year", "years", "told", "according", "reuters"
+}
+
+KOREAN_STOPWORDS = {
+    "그리고", "하지만", "그러나", "또한", "이번", "지난", "대한", "위해", "통해", "따라",
+    "있다", "했다", "한다", "된다", "있는", "없는", "것으로", "이라고", "밝혔다", "말했다",
+    "기자", "뉴스", "오늘", "어제", "내일", "관련", "경우", "때문", "가운데", "이후"
+}
+
+# 한국어 조사/어미 (긴 것부터 제거)
+KOREAN_SUFFIXES = sorted([
+    "에서는", "으로는", "에게서", "이라는", "라는", "에서", "에게", "으로", "까지", "부터",
+    "보다", "처럼", "이라", "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과",
+    "도", "만"
+], key=len, reverse=True)
+
+# 서술어 어미 (키워드에서 제외)
+KOREAN_PREDICATE_ENDINGS = ("했다", "했다고", "한다", "한다고", "된다", "됐다", "있다", "없다", "였다", "이다", "하는", "했던", "하며", "하고")
+
+def tokenize(text: str) -> List[str]:
+    """한국어/영어 혼합 텍스트 토큰화 (불용어/조사 제거)"""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text or ""):
+        if "가" <= token[0] <= "힣":
+            for suffix in KOREAN_SUFFIXES:
+                if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+                    token = token[:-len(suffix)]
+                    break
+            if len(token) >= 2 and token not in KOREAN_STOPWORDS and not token.endswith(KOREAN_PREDICATE_ENDINGS):
+                tokens.append(token)
+        else:
+            token = token.lower()
+            if len(token) >= 3 and token not in ENGLISH_STOPWORDS:
+                tokens.append(token)
+    return tokens
+
+class KeywordExtractor:
+    """말뭉치 문서 빈도(DF)를 반영한 TF-IDF 키워드 추출기
+    
+    DF는 observe()로 누적되며, 저장소와의 동기화를 위해 변경분을 따로 모아 둔다.
+    같은 입력과 DF 상태에 대해 항상 같은 순서의 키워드를 반환한다.
+    """
+    def __init__(self, top_k: int = 10):
+        self.top_k = top_k
+        self.doc_count = 0
+        self.df: Counter = Counter()
+        self._pending_docs = 0
+        self._pending_df: Counter = Counter()
+        
+    def load(self, doc_count: int, df: Dict[str, int]):
+        """저장소의 DF 통계로 초기화"""
+        self.doc_count = doc_count
+        self.df = Counter(df)
+        
+    def observe(self, texts: Iterable[str]):
+        """새로 저장된 문서를 DF에 반영"""
+        for text in texts:
+            terms = set(tokenize(text))
+            self.doc_count += 1
+            self.df.update(terms)
+            self._pending_docs += 1
+            self._pending_df.update(terms)
+            
+    def drain(self) -> Tuple[int, Counter]:
+        """저장소에 반영할 DF 변경분을 꺼냄"""
+        pending = (self._pending_docs, self._pending_df)
+        self._pending_docs, self._pending_df = 0, Counter()
+        return pending
+        
+    def extract_batch(self, texts: List[str], top_k: int = None) -> List[List[str]]:
+        """검색 응답 전체를 한 번에 처리해 문서별 상위 키워드 반환"""
+        top_k = top_k or self.top_k
+        term_counts = [Counter(tokenize(text)) for text in texts]
+        
+        # 배치 안의 문서도 DF에 포함해 점수 계산 (영구 반영은 observe에서)
+        batch_df = Counter()
+        for counts in term_counts:
+            batch_df.update(counts.keys())
+        total = self.doc_count + len(texts)
+        
+        results = []
+        for counts in term_counts:
+            scored = []
+            for term, tf in counts.items():
+                idf = math.log((1 + total) / (1 + self.df[term] + batch_df[term])) + 1
+                scored.append((-(1 + math.log(tf)) * idf, term))
+            scored.sort()
+            results.append([term for _, term in scored[:top_k]])
+        return results
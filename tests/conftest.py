@@ -0,0 +1,62 @@
+"""저장소 백엔드 공통 픽스처
+
+storage 픽스처는 두 백엔드(mongo, sqlite)로 매개변수화된다.
+- mongo  : 기본은 메모리 MongoDB(mongomock-motor), TEST_MONGODB_URI를 지정하면 실제 서버의 임시 DB 사용
+- sqlite : tmp_path 아래 새 파일
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+import os
+import uuid
+
+import pytest
+
+from src.storage.news_storage import NewsStorage
+from src.storage.sqlite_storage import SQLiteNewsStorage, _iso
+
+TEST_MONGODB_URI = os.getenv("TEST_MONGODB_URI")
+
+@pytest.fixture(params=["mongo", "sqlite"])
+async def storage(request, tmp_path):
+    if request.param == "mongo":
+        if not TEST_MONGODB_URI:
+            from benchmarks.fakes import use_memory_mongo
+            use_memory_mongo()
+        db_name = f"news_test_{uuid.uuid4().hex[:12]}"
+        storage = NewsStorage(TEST_MONGODB_URI, db_name=db_name)
+        await storage.init()
+        yield storage
+        await storage.client.drop_database(db_name)
+    else:
+        storage = SQLiteNewsStorage(str(tmp_path / "news.db"))
+        await storage.init()
+        yield storage
+    storage.close()
+
+def is_memory_mongo(storage) -> bool:
+    return isinstance(storage, NewsStorage) and not TEST_MONGODB_URI
+
+def require_text_index(storage):
+    """메모리 MongoDB는 $text를 지원하지 않으므로 토큰/구문 검색은 실제 서버에서만 검사"""
+    if is_memory_mongo(storage):
+        pytest.skip("mongomock은 $text를 지원하지 않습니다 (TEST_MONGODB_URI로 실제 서버 지정)")
+
+def require_immediate_expiry(storage):
+    """실제 MongoDB의 TTL 삭제는 백그라운드(60초 주기)에서 일어나므로 메모리 MongoDB/SQLite에서만 검사"""
+    if isinstance(storage, NewsStorage) and TEST_MONGODB_URI:
+        pytest.skip("실제 MongoDB의 TTL 삭제 시점은 보장되지 않습니다")
+
+async def backdate(storage, table: str, days: float, ids: Optional[List] = None, field: str = "timestamp", key: str = "_id"):
+    """테스트용으로 문서 시각을 days일 전으로 변경 (ids가 없으면 전체)"""
+    value = datetime.now() - timedelta(days=days)
+    if isinstance(storage, NewsStorage):
+        query = {key: {"$in": ids}} if ids is not None else {}
+        await storage.db[table].update_many(query, {"$set": {field: value}})
+        return
+    column = "id" if key == "_id" else key
+    if ids is None:
+        await storage._write(lambda conn: conn.execute(f"UPDATE {table} SET {field} = ?", (_iso(value),)))
+    else:
+        await storage._write(lambda conn: conn.executemany(
+            f"UPDATE {table} SET {field} = ? WHERE {column} = ?", [(_iso(value), str(i)) for i in ids]
+        ))
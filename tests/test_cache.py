@@ -0,0 +1,192 @@
+"""LLM 결과 캐시와 검색 캐시 검사"""
+from datetime import datetime
+from types import SimpleNamespace
+import asyncio
+
+from src.cache.llm_cache import CachedChain, LLMResultCache, LRUCache, make_cache_key
+from src.cache.search_cache import SearchCache
+from src.cache.shared_store import SQLiteCacheTier
+
+class SlowChain:
+    """호출 횟수를 세는 LLMChain 대역 (arun이 잠시 대기)"""
+    def __init__(self, delay: float = 0.05):
+        self.llm = SimpleNamespace(model_name="fake", temperature=0.0)
+        self.prompt = SimpleNamespace(template="요약: {content}")
+        self.delay = delay
+        self.calls = 0
+
+    async def arun(self, content: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"요약 {content}"
+
+def test_cache_key_normalizes_content():
+    key = make_cache_key("요약: {content}", "gpt-4o-mini", 0.0, "AI  chip\n export ")
+    assert key == make_cache_key("요약: {content}", "gpt-4o-mini", 0.0, "AI chip export")
+    # 한글 자모 분리(NFD) 입력도 같은 키
+    assert make_cache_key("t", "m", 0.0, "한국") == make_cache_key("t", "m", 0.0, "\u1112\u1161\u11ab\u1100\u116e\u11a8")
+    assert key != make_cache_key("분석: {content}", "gpt-4o-mini", 0.0, "AI chip export")
+    assert key != make_cache_key("요약: {content}", "gpt-4o", 0.0, "AI chip export")
+    assert key != make_cache_key("요약: {content}", "gpt-4o-mini", 0.7, "AI chip export")
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("1", None, "3")
+    assert len(cache) == 2
+
+async def test_persistent_hit_is_promoted_to_memory(tmp_path):
+    tier = SQLiteCacheTier(str(tmp_path / "cache.db"), "llm")
+    await tier.set("key", "저장된 결과")
+    cache = LLMResultCache(max_size=4, persistent=tier)
+
+    assert await cache.get("missing") is None
+    assert await cache.get("key") == "저장된 결과"
+    assert await cache.get("key") == "저장된 결과"
+    assert cache.stats() == {
+        "hits": 1, "persistent_hits": 1, "misses": 1, "coalesced": 0, "size": 1, "hit_rate": 0.6667
+    }
+
+    await cache.set("new", "새 결과")
+    assert await tier.get("new") == "새 결과"
+
+async def test_sqlite_tier_namespaces_and_expiry(tmp_path):
+    path = str(tmp_path / "shared" / "cache.db")
+    llm, search = SQLiteCacheTier(path, "llm"), SQLiteCacheTier(path, "search")
+    await llm.set("key", "llm")
+    await search.set("key", "search")
+    await search.set("expired", "old", ttl_seconds=-1)
+    assert (await llm.get("key"), await search.get("key")) == ("llm", "search")
+    assert await search.get("expired") is None
+    llm.close()
+    search.close()
+
+async def test_storage_cache_tier(storage):
+    # mongo는 MongoCacheTier(TTL 인덱스), sqlite는 저장소 파일의 SQLiteCacheTier
+    tier = storage.cache_tier("llm", ttl_seconds=60)
+    await tier.set("key", "결과")
+    assert await tier.get("key") == "결과"
+    assert await storage.cache_tier("search", ttl_seconds=60).get("key") is None
+
+    await storage.cache_tier("llm", ttl_seconds=-1).set("expired", "old")
+    assert await tier.get("expired") is None
+
+async def test_concurrent_misses_call_llm_once(tmp_path):
+    chain = SlowChain()
+    cache = LLMResultCache(persistent=SQLiteCacheTier(str(tmp_path / "cache.db"), "llm"))
+    cached = CachedChain(chain, cache)
+
+    results = await asyncio.gather(*(cached.arun("같은 본문") for _ in range(5)))
+    assert results == ["요약 같은 본문"] * 5
+    assert chain.calls == 1
+    assert cache.stats()["coalesced"] == 4
+    assert cache.inflight(cached.cache_key("같은 본문")) is None
+
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    chain = SlowChain()
+    cached = CachedChain(chain, LLMResultCache())
+
+    first = asyncio.ensure_future(cached.arun("본문"))
+    second = asyncio.ensure_future(cached.arun("본문"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == "요약 본문"
+    assert chain.calls == 1
+
+async def test_failed_call_is_not_cached():
+    class FailingChain(SlowChain):
+        async def arun(self, content: str) -> str:
+            self.calls += 1
+            raise RuntimeError("upstream")
+
+    chain = FailingChain()
+    cached = CachedChain(chain, LLMResultCache())
+    results = await asyncio.gather(cached.arun("본문"), cached.arun("본문"), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert chain.calls == 1
+    assert len(cached.cache.memory) == 0
+
+async def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    chain = SlowChain(delay=0)
+    first = CachedChain(chain, LLMResultCache(persistent=SQLiteCacheTier(path, "llm")))
+    await first.arun("본문")
+
+    # 새 프로세스처럼 빈 메모리 캐시로 다시 만들어도 디스크 계층에서 적중
+    restarted = LLMResultCache(persistent=SQLiteCacheTier(path, "llm"))
+    assert await CachedChain(chain, restarted).arun("본문") == "요약 본문"
+    assert chain.calls == 1
+    assert restarted.stats()["persistent_hits"] == 1
+
+class FakeSearch:
+    """호출 횟수를 세는 Tavily 검색 대역"""
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, query, max_results, **kwargs):
+        self.calls.append((query, max_results, kwargs))
+        await asyncio.sleep(self.delay)
+        return [{"title": f"{query} {i}", "timestamp": datetime(2024, 6, 1, 9, i)} for i in range(max_results)]
+
+async def test_search_cache_single_flight():
+    fetch = FakeSearch()
+    cache = SearchCache(fetch, ttl=60)
+
+    results = await asyncio.gather(*(cache.search("AI  Chip", 2) for _ in range(3)), cache.search("ai chip", 2))
+    assert len(fetch.calls) == 1
+    assert all(result == results[0] for result in results)
+    # 호출자마다 사본을 받으므로 한 응답을 고쳐도 다른 응답은 그대로
+    results[0][0]["title"] = "changed"
+    assert (await cache.search("ai chip", 2))[0]["title"] == "AI  Chip 0"
+    assert cache.stats() == {"hits": 1, "shared_hits": 0, "coalesced": 3, "misses": 1}
+
+    # max_results, 도메인 목록이 다르면 다른 요청
+    await cache.search("ai chip", 3)
+    await cache.search("ai chip", 2, include_domains=["bbc.com", "reuters.com"])
+    await cache.search("ai chip", 2, include_domains=["reuters.com", "bbc.com"])
+    assert len(fetch.calls) == 3
+    assert fetch.calls[-1][2] == {"include_domains": ["bbc.com", "reuters.com"]}
+
+async def test_search_cache_ttl_expiry():
+    fetch = FakeSearch(delay=0)
+    cache = SearchCache(fetch, ttl=0.05)
+    await cache.search("ai", 1)
+    await cache.search("ai", 1)
+    await asyncio.sleep(0.06)
+    await cache.search("ai", 1)
+    assert len(fetch.calls) == 2
+
+async def test_search_cache_cancelled_caller_and_errors():
+    fetch = FakeSearch()
+    cache = SearchCache(fetch)
+    first = asyncio.ensure_future(cache.search("ai", 1))
+    second = asyncio.ensure_future(cache.search("ai", 1))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert len(await second) == 1
+    assert len(fetch.calls) == 1
+
+    async def failing(query, max_results, **kwargs):
+        raise RuntimeError("upstream")
+
+    cache = SearchCache(failing)
+    results = await asyncio.gather(cache.search("ai", 1), cache.search("ai", 1), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache._inflight == {}
+
+async def test_search_cache_shared_tier(tmp_path):
+    path = str(tmp_path / "cache.db")
+    fetch = FakeSearch(delay=0)
+    first = SearchCache(fetch, shared=SQLiteCacheTier(path, "search"))
+    results = await first.search("ai", 2)
+
+    # 다른 워커 프로세스의 캐시처럼 새 인스턴스에서도 공유 계층 결과를 재사용 (datetime 복원)
+    other = SearchCache(fetch, shared=SQLiteCacheTier(path, "search"))
+    assert await other.search("ai", 2) == results
+    assert isinstance((await other.search("ai", 2))[0]["timestamp"], datetime)
+    assert len(fetch.calls) == 1
+    assert other.stats()["shared_hits"] == 1
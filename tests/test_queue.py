@@ -0,0 +1,93 @@
+"""수집 작업 큐 실행/실패/dead 처리/종료 시 반환 검사"""
+import asyncio
+
+from src.jobs.queue import INTERACTIVE, SCHEDULED, IngestionQueue
+from src.ratelimit import limiter
+
+class FakeController:
+    """워크플로우 실행을 기록하는 컨트롤러 대역"""
+    def __init__(self, storage, workflow=None):
+        self.storage = storage
+        self.workflow = workflow
+        self.calls = []
+
+    async def execute_langgraph_workflow(self, query, run_id, max_results=10, include_domains=None):
+        self.calls.append((query, limiter.request_priority.get()))
+        if self.workflow is not None:
+            return await self.workflow(query)
+        return {"saved_count": max_results}
+
+async def wait_for_status(queue, job_id, *statuses, timeout=5.0):
+    async def poll():
+        while True:
+            job = await queue.get(job_id)
+            if job["status"] in statuses:
+                return job
+            await asyncio.sleep(0.01)
+    return await asyncio.wait_for(poll(), timeout)
+
+async def test_runs_jobs_by_priority(storage):
+    controller = FakeController(storage)
+    queue = IngestionQueue(controller, workers=1, poll_interval=0.01)
+    scheduled = await queue.submit("scheduled", max_results=3, priority=SCHEDULED, source="schedule")
+    interactive = await queue.submit("interactive", max_results=5, priority=INTERACTIVE)
+
+    await queue.start()
+    try:
+        job = await wait_for_status(queue, scheduled, "done")
+    finally:
+        await queue.stop()
+    assert job["result"] == {"saved_count": 3}
+    assert (await queue.get(interactive))["result"] == {"saved_count": 5}
+    # 대화형 작업이 먼저, 주기 수집 작업은 백그라운드 몫으로 실행
+    assert controller.calls == [("interactive", limiter.INTERACTIVE), ("scheduled", limiter.BACKGROUND)]
+
+async def test_failed_workflow_marks_job_failed(storage):
+    async def workflow(query):
+        raise RuntimeError("검색 실패")
+
+    queue = IngestionQueue(FakeController(storage, workflow), workers=1, poll_interval=0.01)
+    job_id = await queue.submit("ai")
+    await queue.start()
+    try:
+        job = await wait_for_status(queue, job_id, "failed")
+    finally:
+        await queue.stop()
+    assert job["error"] == "검색 실패"
+    assert job["finished_at"] is not None
+
+async def test_repeatedly_abandoned_job_is_dead_lettered(storage):
+    controller = FakeController(storage)
+    queue = IngestionQueue(controller, workers=1, poll_interval=0.01, max_attempts=2)
+    job_id = await queue.submit("ai")
+    await queue.store.init()
+    # 처리 중 워커가 두 번 죽어 lease가 만료된 상태
+    for _ in range(2):
+        await queue.store.claim("crashed", lease_seconds=-1)
+
+    await queue.start()
+    try:
+        job = await wait_for_status(queue, job_id, "dead")
+    finally:
+        await queue.stop()
+    assert job["error"].startswith("2회")
+    assert controller.calls == []
+
+async def test_stop_releases_running_job(storage):
+    started = asyncio.Event()
+
+    async def workflow(query):
+        started.set()
+        await asyncio.Event().wait()
+
+    queue = IngestionQueue(FakeController(storage, workflow), workers=1, poll_interval=0.01)
+    job_id = await queue.submit("ai")
+    await queue.start()
+    await asyncio.wait_for(started.wait(), 5)
+    assert (await queue.get(job_id))["status"] == "running"
+
+    # 종료 시 끝나지 않은 작업은 시도 횟수를 늘리지 않고 queued로 반환
+    await queue.stop(timeout=0.01)
+    job = await queue.get(job_id)
+    assert (job["status"], job["attempts"]) == ("queued", 0)
+    assert await queue.store.claim("next-worker", lease_seconds=60) is not None
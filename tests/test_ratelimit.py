@@ -0,0 +1,131 @@
+"""토큰 버킷과 AIMD 동시성 한도 검사"""
+from types import SimpleNamespace
+import asyncio
+import time
+
+import pytest
+
+from src.ratelimit.limiter import (
+    BACKGROUND, INTERACTIVE, AdaptiveConcurrency, TokenBucket, UpstreamLimiter, estimate_tokens, is_overload
+)
+
+async def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(per_minute=600, capacity=2)
+    started = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    # 초당 10개 충전이므로 세 번째 토큰은 약 0.1초 뒤
+    await bucket.acquire()
+    assert time.monotonic() - started >= 0.09
+
+async def test_token_bucket_clamps_large_requests():
+    bucket = TokenBucket(per_minute=6000, capacity=10)
+    await asyncio.wait_for(bucket.acquire(1000), timeout=1)
+    assert bucket.tokens < 1
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("abcd" * 10) == 11
+    assert estimate_tokens("반도체") == 4
+
+@pytest.mark.parametrize("error, expected", [
+    (asyncio.TimeoutError(), True),
+    (SimpleNamespace(status_code=429), True),
+    (SimpleNamespace(status=503), True),
+    (SimpleNamespace(status_code=400), False),
+    (ValueError("bad"), False),
+])
+def test_is_overload(error, expected):
+    assert is_overload(error) is expected
+
+async def test_aimd_additive_increase_and_max():
+    concurrency = AdaptiveConcurrency(initial=2, max_limit=3)
+    for _ in range(2):
+        await concurrency.acquire()
+        await concurrency.release(latency=0.01, overloaded=False)
+    # 성공마다 1/limit씩 증가 (2 -> 2.5 -> 2.9)
+    assert concurrency.limit == pytest.approx(2.9)
+    for _ in range(20):
+        await concurrency.acquire()
+        await concurrency.release(latency=0.01, overloaded=False)
+    assert concurrency.limit == 3
+    assert concurrency.in_flight == 0
+
+async def test_aimd_multiplicative_decrease_once_per_window():
+    concurrency = AdaptiveConcurrency(initial=16, min_limit=2)
+    # 성공 지연 기준값 10초: 그 안의 연속 과부하는 한 번만 줄임
+    await concurrency.acquire()
+    await concurrency.release(latency=10.0, overloaded=False)
+    limit = concurrency.limit
+    await concurrency.acquire()
+    await concurrency.release(latency=0.0, overloaded=True)
+    assert concurrency.limit == limit / 2
+    concurrency.on_overload()
+    assert concurrency.limit == limit / 2
+    # 과부하 응답은 지연 기준값에 반영하지 않음
+    assert concurrency.baseline == 10.0
+
+async def test_aimd_latency_spike_and_min_limit():
+    concurrency = AdaptiveConcurrency(initial=4, min_limit=3)
+    concurrency.baseline = 0.01
+    await concurrency.acquire()
+    await concurrency.release(latency=1.0, overloaded=False)
+    assert concurrency.limit == 3
+    concurrency._last_decrease = 0.0
+    concurrency.on_overload()
+    assert concurrency.limit == 3
+
+async def test_concurrency_share_limits_background():
+    concurrency = AdaptiveConcurrency(initial=4)
+    await concurrency.acquire(share=0.5)
+    await concurrency.acquire(share=0.5)
+    assert not concurrency.available(share=0.5)
+    assert concurrency.available()
+
+    waiter = asyncio.ensure_future(concurrency.acquire(share=0.5))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    await concurrency.release(latency=0.01, overloaded=False)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert concurrency.in_flight == 2
+
+async def test_upstream_limiter_priorities_and_stats():
+    limiter = UpstreamLimiter("llm", requests_per_minute=6000, tokens_per_minute=60000, max_concurrency=8, background_share=0.5)
+    assert limiter.concurrency.limit == 2
+
+    entered = asyncio.Event()
+    release = asyncio.Event()
+
+    async def hold(priority):
+        async with limiter.slot(tokens=10, priority=priority):
+            entered.set()
+            await release.wait()
+
+    background = asyncio.ensure_future(hold(BACKGROUND))
+    await entered.wait()
+    # 백그라운드 몫(2 x 0.5 = 1)을 다 써도 대화형 호출은 실행됨
+    queued = asyncio.ensure_future(hold(BACKGROUND))
+    await asyncio.sleep(0.01)
+    assert limiter.stats()["queue_depth"] == {INTERACTIVE: 0, BACKGROUND: 1}
+    async with limiter.slot(priority=INTERACTIVE):
+        assert limiter.concurrency.in_flight == 2
+
+    release.set()
+    await asyncio.gather(background, queued)
+    stats = limiter.stats()
+    assert stats["calls"] == {INTERACTIVE: 1, BACKGROUND: 2}
+    assert stats["in_flight"] == 0
+    assert stats["avg_wait_seconds"][BACKGROUND] > 0
+
+async def test_upstream_limiter_records_overload():
+    limiter = UpstreamLimiter("mcp", requests_per_minute=6000, max_concurrency=32)
+    limit = limiter.concurrency.limit
+    with pytest.raises(asyncio.TimeoutError):
+        async with limiter.slot():
+            raise asyncio.TimeoutError()
+    assert limiter.concurrency.limit == limit / 2
+    assert limiter.stats()["overloads"] == 1
+
+    limiter.record_overload()
+    assert limiter.stats()["overloads"] == 2
+    assert limiter.concurrency.in_flight == 0
@@ -0,0 +1,157 @@
+"""벡터 인덱스와 요약 리트리버 검사"""
+import numpy as np
+import pytest
+
+from src.retrieval.retriever import SummaryRetriever
+from src.retrieval.vector_index import VectorIndex
+
+DIM = 16
+
+def vectors(count, seed=0):
+    return np.random.default_rng(seed).normal(size=(count, DIM)).astype(np.float32)
+
+def ids(count, prefix="doc"):
+    return [f"{prefix}-{i}" for i in range(count)]
+
+def top_id(index, vector):
+    return index.search(vector, k=1)[0][0]
+
+@pytest.fixture(params=["memory", "disk"])
+def index_path(request, tmp_path):
+    return None if request.param == "memory" else str(tmp_path / "index")
+
+def test_add_search_and_update(index_path):
+    index = VectorIndex(DIM, index_path)
+    data = vectors(20)
+    index.add(ids(20), data)
+    assert len(index) == 20
+    assert "doc-3" in index
+    hits = index.search(data[3], k=3)
+    assert hits[0][0] == "doc-3"
+    assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+    assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+
+    # 같은 id는 갱신
+    index.add(["doc-3"], data[4:5])
+    assert len(index) == 20
+    assert dict(index.search(data[4], k=2)) == {
+        "doc-3": pytest.approx(1.0, abs=1e-5), "doc-4": pytest.approx(1.0, abs=1e-5)
+    }
+
+def test_remove_before_and_after_save(index_path):
+    index = VectorIndex(DIM, index_path)
+    data = vectors(10)
+    index.add(ids(10), data)
+    index.remove(["doc-1"])
+    index.save()
+    index.remove(["doc-2", "missing"])
+
+    assert len(index) == 8
+    assert "doc-1" not in index and "doc-2" not in index
+    found = {doc_id for doc_id, _ in index.search(data[1], k=10)}
+    assert found == set(ids(10)) - {"doc-1", "doc-2"}
+
+    # 삭제 후 다시 추가하면 검색됨
+    index.add(["doc-2"], data[2:3])
+    assert top_id(index, data[2]) == "doc-2"
+
+def test_save_merges_delta(index_path):
+    index = VectorIndex(DIM, index_path)
+    data = vectors(30)
+    index.add(ids(20), data[:20])
+    index.save()
+    index.add(ids(10, "new"), data[20:])
+    index.save()
+    assert len(index) == 30
+    assert top_id(index, data[5]) == "doc-5"
+    assert top_id(index, data[25]) == "new-5"
+
+def test_in_memory_save_compacts_removed_rows():
+    index = VectorIndex(DIM)
+    data = vectors(40)
+    index.add(ids(40), data)
+    index.save()
+    index.remove(ids(30))
+    index.save()
+    assert len(index._base_ids) == 10
+    assert {doc_id for doc_id, _ in index.search(data[35], k=40)} == set(ids(40)[30:])
+
+def test_ivf_search_finds_exact_match(index_path):
+    index = VectorIndex(DIM, index_path, ivf_threshold=200, nprobe=4)
+    data = vectors(400)
+    index.add(ids(400), data)
+    index.save()
+    assert index._centroids is not None
+    for i in (0, 123, 399):
+        assert top_id(index, data[i]) == f"doc-{i}"
+
+    # 학습 이후 추가된 벡터도 기존 중심점에 할당되어 검색됨
+    extra = vectors(50, seed=1)
+    index.add(ids(50, "extra"), extra)
+    index.save()
+    assert top_id(index, extra[7]) == "extra-7"
+
+def test_disk_index_reloads_and_refreshes(tmp_path):
+    path = str(tmp_path / "index")
+    data = vectors(20)
+    writer = VectorIndex(DIM, path)
+    writer.add(ids(10), data[:10])
+    writer.save()
+
+    reader = VectorIndex(DIM, path)
+    assert len(reader) == 10
+    assert top_id(reader, data[3]) == "doc-3"
+
+    # 다른 워커가 저장한 새 세대는 검색 시 다시 열림
+    writer.add(ids(10, "new"), data[10:])
+    writer.save()
+    assert top_id(reader, data[15]) == "new-5"
+    assert len(reader) == 20
+
+def test_concurrent_savers_keep_both_deltas(tmp_path):
+    path = str(tmp_path / "index")
+    data = vectors(20)
+    first, second = VectorIndex(DIM, path), VectorIndex(DIM, path)
+    first.add(ids(10, "a"), data[:10])
+    second.add(ids(10, "b"), data[10:])
+    first.save()
+    second.save()
+
+    merged = VectorIndex(DIM, path)
+    assert len(merged) == 20
+    assert top_id(merged, data[2]) == "a-2"
+    assert top_id(merged, data[12]) == "b-2"
+
+async def test_retriever_indexes_saved_summaries(storage):
+    retriever = SummaryRetriever(storage)
+    [headline_id] = await storage.save_headlines_bulk([{"title": "AI chip", "url": "https://example.com/1", "keywords": ["ai"]}])
+    await storage.save_summary({"headline_id": headline_id, "summary": "AI 반도체 수출 규제 강화", "content": "본문"})
+
+    # 저장 리스너로 바로 반영
+    assert str(headline_id) in retriever.index
+    [doc] = await retriever.search("반도체 수출 규제", k=3)
+    assert str(doc["headline_id"]) == str(headline_id)
+    assert doc["summary"] == "AI 반도체 수출 규제 강화"
+    assert doc["score"] > 0
+
+async def test_retriever_sync_adds_missing_summaries(storage, tmp_path):
+    headline_ids = await storage.save_headlines_bulk([
+        {"title": f"news {i}", "url": f"https://example.com/{i}", "keywords": []} for i in range(3)
+    ])
+    await storage.save_summaries_bulk([
+        {"headline_id": headline_id, "summary": summary, "content": "본문"}
+        for headline_id, summary in zip(headline_ids, ["금리 인하 기대", "전기차 배터리 증설", "우주 발사체 시험"])
+    ])
+
+    retriever = SummaryRetriever(storage, index_path=str(tmp_path / "index"))
+    assert len(retriever.index) == 0
+    await retriever.sync(days=30, batch_size=2)
+    assert len(retriever.index) == 3
+    assert str((await retriever.search("배터리 증설", k=1))[0]["headline_id"]) == str(headline_ids[1])
+
+    # 저장 후 재시작한 리트리버는 디스크 인덱스를 열고 빠진 요약만 추가
+    retriever.save()
+    restarted = SummaryRetriever(storage, index_path=str(tmp_path / "index"))
+    assert len(restarted.index) == 3
+    await restarted.sync(days=30)
+    assert len(restarted.index) == 3
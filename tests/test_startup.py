@@ -0,0 +1,70 @@
+"""앱 import/컨트롤러 생성 시 지연 초기화 검사 (새 인터프리터에서 실행)
+
+구조 검사는 항상 실행한다. 벽시계 예산 검사는 부하에 따라 흔들리므로
+STARTUP_BUDGET_TESTS=1일 때만 실행하며, 예산은 STARTUP_IMPORT_BUDGET_MS, STARTUP_CONTROLLER_BUDGET_MS로 조정한다.
+"""
+from pathlib import Path
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.startup_bench import CONTROLLER_SNIPPET, IMPORT_SNIPPET, measure
+
+ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", 800))
+CONTROLLER_BUDGET_MS = float(os.getenv("STARTUP_CONTROLLER_BUDGET_MS", 3000))
+
+budget = pytest.mark.skipif(
+    os.getenv("STARTUP_BUDGET_TESTS") != "1", reason="벽시계 예산 검사는 STARTUP_BUDGET_TESTS=1일 때만 실행"
+)
+
+LAZY_MODULES = ("langchain", "langchain_core", "langchain_openai", "langgraph", "openai", "numpy")
+
+IMPORT_PROBE = """
+import json, sys
+import src.api.news_api
+print(json.dumps(sorted(name for name in sys.modules if name.split(".")[0] in %r)))
+""" % (LAZY_MODULES,)
+
+CONTROLLER_PROBE = """
+import json, os, socket
+connects = []
+original = socket.socket.connect
+def connect(self, address):
+    connects.append(repr(address))
+    return original(self, address)
+socket.socket.connect = connect
+os.environ.update(SMITHERY_API_KEY="probe", OPENAI_API_KEY="probe", MONGODB_URI="mongodb://127.0.0.1:1")
+os.environ.pop("NEWS_STORAGE_BACKEND", None)
+from src.langchain_controller import LangChainController
+controller = LangChainController()
+print(json.dumps({"connects": connects, "initialized": controller.storage._initialized}))
+"""
+
+def probe(snippet: str):
+    output = subprocess.run(
+        [sys.executable, "-c", snippet], check=True, capture_output=True, text=True, cwd=str(ROOT)
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def test_app_import_defers_llm_modules():
+    assert probe(IMPORT_PROBE) == []
+
+def test_controller_startup_opens_no_connections():
+    result = probe(CONTROLLER_PROBE)
+    assert result["connects"] == []
+    assert result["initialized"] is False
+
+@budget
+def test_app_import_within_budget():
+    result = measure(IMPORT_SNIPPET, repeat=3, cwd=str(ROOT))
+    assert result["p50_ms"] <= IMPORT_BUDGET_MS, result
+
+@budget
+def test_controller_startup_within_budget():
+    result = measure(CONTROLLER_SNIPPET, repeat=3, cwd=str(ROOT))
+    assert result["p50_ms"] <= CONTROLLER_BUDGET_MS, result
@@ -0,0 +1,343 @@
+"""두 저장소 백엔드(mongo, sqlite)가 같은 동작을 하는지 검사"""
+from datetime import datetime, timedelta
+
+import pytest
+from pymongo import TEXT
+
+from conftest import backdate, is_memory_mongo, require_immediate_expiry, require_text_index
+from src.analytics.trends import count_increments, get_trends, window_key
+from src.storage.news_storage import NewsStorage
+from src.storage.sqlite_storage import SQLiteNewsStorage
+
+HEADLINES = [
+    {"title": "AI chip export rules tighten", "url": "https://example.com/1", "source": "reuters.com", "keywords": ["ai", "chip", "export"]},
+    {"title": "Central bank signals rate cut", "url": "https://example.com/2", "source": "bbc.com", "keywords": ["rate", "inflation"]},
+    {"title": "반도체 수출 증가", "url": "https://example.com/3", "source": "reuters.com", "keywords": ["반도체", "수출"]},
+    {"title": "Airline strike ends", "url": "https://example.com/4", "source": "bbc.com", "keywords": ["airline", "strike"]},
+    {"title": "Cutting rate expectations", "url": "https://example.com/5", "source": "ap.org", "keywords": ["rate"]},
+]
+
+def titles(docs):
+    return {doc["title"] for doc in docs}
+
+async def collect_pages(fetch, limit):
+    """next_cursor가 없을 때까지 페이지를 모아 (문서 목록, 페이지 크기 목록) 반환"""
+    docs, sizes, cursor = [], [], None
+    while True:
+        page = await fetch(limit=limit, cursor=cursor)
+        docs.extend(page["items"])
+        sizes.append(len(page["items"]))
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return docs, sizes
+
+async def test_headline_upsert_is_idempotent(storage):
+    ids = await storage.save_headlines_bulk(HEADLINES)
+    first = {doc["url"]: doc["timestamp"] for doc in await storage.get_headlines()}
+
+    updated = [dict(HEADLINES[0], title="AI chip export rules tighten further"), *HEADLINES[1:]]
+    assert await storage.save_headlines_bulk(updated) == ids
+    assert await storage.save_headline(HEADLINES[1]) == ids[1]
+
+    docs = await storage.get_headlines()
+    assert len(docs) == len(HEADLINES)
+    # 최초 수집 시점은 유지하고 나머지 필드만 갱신
+    assert {doc["url"]: doc["timestamp"] for doc in docs} == first
+    assert "AI chip export rules tighten further" in titles(docs)
+    assert await storage.existing_urls(["https://example.com/1", "https://example.com/9"]) == {"https://example.com/1"}
+
+async def test_summary_upsert_is_idempotent(storage):
+    ids = await storage.save_headlines_bulk(HEADLINES[:1])
+    await storage.save_summary({"headline_id": ids[0], "summary": "첫 요약", "content": "본문"})
+    await storage.save_summaries_bulk([{"headline_id": ids[0], "summary": "다시 요약", "content": "본문"}])
+
+    summaries = await storage.get_summaries(headline_id=str(ids[0]))
+    assert [doc["summary"] for doc in summaries] == ["다시 요약"]
+
+async def test_prefix_search(storage):
+    await storage.save_headlines_bulk(HEADLINES)
+    assert titles(await storage.search_news("ai*")) == {"AI chip export rules tighten", "Airline strike ends"}
+    assert titles(await storage.search_news("AIR*")) == {"Airline strike ends"}
+    assert await storage.search_news("zzz*") == []
+
+async def test_token_search(storage):
+    require_text_index(storage)
+    await storage.save_headlines_bulk(HEADLINES)
+    docs = await storage.search_news("반도체 strike")
+    assert titles(docs) == {"반도체 수출 증가", "Airline strike ends"}
+    assert all("score" in doc for doc in docs)
+
+async def test_phrase_search(storage):
+    require_text_index(storage)
+    await storage.save_headlines_bulk(HEADLINES)
+    assert titles(await storage.search_news('"rate cut"')) == {"Central bank signals rate cut"}
+    assert titles(await storage.search_news("rate")) == {"Central bank signals rate cut", "Cutting rate expectations"}
+
+async def test_token_search_matches_summary(storage):
+    require_text_index(storage)
+    ids = await storage.save_headlines_bulk(HEADLINES[:2])
+    await storage.save_summary({"headline_id": ids[1], "summary": "Lenders expect cheaper mortgages", "content": "본문"})
+    assert titles(await storage.search_news("mortgages")) == {"Central bank signals rate cut"}
+
+async def test_outdated_text_index_is_replaced(storage):
+    if not isinstance(storage, NewsStorage):
+        pytest.skip("MongoDB 텍스트 인덱스 전용")
+    await storage.headlines.drop_index("headline_search")
+    await storage.headlines.create_index([("title", TEXT)], name="headline_text", default_language="none")
+    storage._initialized = False
+    await storage.init()
+
+    info = await storage.headlines.index_information()
+    assert "headline_text" not in info
+    assert {field for field, _ in info["headline_search"]["key"]} >= {"title", "keywords", "summary"}
+
+async def test_search_days_filter(storage):
+    ids = await storage.save_headlines_bulk(HEADLINES)
+    await backdate(storage, "headlines", 10, ids=ids[:1])
+    assert titles(await storage.search_news("ai*", days=7)) == {"Airline strike ends"}
+
+async def test_iteration_does_not_hold_reader(storage):
+    if not isinstance(storage, SQLiteNewsStorage):
+        pytest.skip("SQLite 읽기 연결 풀 전용")
+    await storage.save_headlines_bulk(HEADLINES)
+    readers = storage._readers.qsize()
+    stream = storage.iter_headlines()
+    await stream.__anext__()
+    # 소비 도중에도 읽기 연결은 모두 반납된 상태
+    assert storage._readers.qsize() == readers
+    assert len([doc async for doc in stream]) == len(HEADLINES) - 1
+
+async def test_headline_keyset_paging(storage):
+    headlines = [{"title": f"ai news {i}", "url": f"https://example.com/page/{i}", "keywords": ["ai"]} for i in range(7)]
+    await storage.save_headlines_bulk(headlines)
+    # 같은 시각의 문서는 _id로 순서를 정해야 누락/중복이 없다
+    await backdate(storage, "headlines", 1)
+
+    docs, sizes = await collect_pages(storage.get_headlines_page, limit=3)
+    assert sizes == [3, 3, 1]
+    assert [doc["_id"] for doc in docs] == [doc["_id"] for doc in await storage.get_headlines()]
+
+    docs, sizes = await collect_pages(lambda **page: storage.search_news_page("ai*", **page), limit=4)
+    assert sizes == [4, 3]
+    assert len({doc["_id"] for doc in docs}) == len(headlines)
+
+async def test_summary_keyset_paging(storage):
+    ids = await storage.save_headlines_bulk(HEADLINES)
+    await storage.save_summaries_bulk([{"headline_id": i, "summary": f"요약 {n}"} for n, i in enumerate(ids)])
+
+    docs, sizes = await collect_pages(storage.get_summaries_page, limit=2)
+    assert sizes == [2, 2, 1]
+    assert [doc["_id"] for doc in docs] == [doc["_id"] for doc in await storage.get_summaries()]
+
+@pytest.mark.parametrize("fields", [["-timestamp"], ["-timestamp", "-keywords"], ["title"]])
+async def test_paging_keeps_timestamp_for_cursor(storage, fields):
+    await storage.save_headlines_bulk(HEADLINES)
+    docs, sizes = await collect_pages(lambda **page: storage.get_headlines_page(fields=fields, **page), limit=2)
+    assert sizes == [2, 2, 1]
+    assert all("timestamp" in doc for doc in docs)
+
+async def test_exact_page_has_no_next_cursor(storage):
+    await storage.save_headlines_bulk(HEADLINES[:2])
+    page = await storage.get_headlines_page(limit=2)
+    assert len(page["items"]) == 2
+    assert page["next_cursor"] is None
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30=", "eyJ0IjogInllc3RlcmRheSJ9"])
+async def test_bad_cursor_raises_value_error(storage, cursor):
+    await storage.save_headlines_bulk(HEADLINES)
+    with pytest.raises(ValueError):
+        await storage.get_headlines_page(limit=2, cursor=cursor)
+    with pytest.raises(ValueError):
+        await storage.get_summaries_page(limit=2, cursor=cursor)
+    with pytest.raises(ValueError):
+        await storage.search_news_page("ai*", limit=2, cursor=cursor)
+
+async def test_summary_is_copied_to_headline(storage):
+    ids = await storage.save_headlines_bulk(HEADLINES[:2])
+    analysis = {"sentiment": "positive", "keywords": ["ai"]}
+    await storage.save_summary({"headline_id": ids[0], "summary": "AI 요약", "content": "본문", "analysis": analysis})
+
+    summaries = await storage.get_summaries_by_headline_ids([ids[0], ids[1]])
+    assert [(doc["summary"], doc["analysis"]) for doc in summaries] == [("AI 요약", analysis)]
+
+    # 검색/조회 결과에 조인 없이 최신 요약과 분석이 포함
+    [doc] = await storage.search_news("ai*")
+    assert (doc["summary"], doc["analysis"]) == ("AI 요약", analysis)
+    headlines = {doc["url"]: doc for doc in await storage.get_headlines()}
+    assert headlines["https://example.com/1"]["summary"] == "AI 요약"
+    assert "summary" not in headlines["https://example.com/2"]
+
+async def test_expired_summary_copy_is_removed(storage):
+    ids = await storage.save_headlines_bulk(HEADLINES[:2])
+    await storage.save_summaries_bulk([{"headline_id": i, "summary": "요약"} for i in ids])
+    await backdate(storage, "headlines", 31, ids=ids[:1], field="summarized_at")
+
+    assert await storage.expire_summary_view() == 1
+    headlines = {doc["url"]: doc for doc in await storage.get_headlines()}
+    assert "summary" not in headlines["https://example.com/1"]
+    assert headlines["https://example.com/2"]["summary"] == "요약"
+
+async def test_archive_summaries(storage):
+    ids = await storage.save_headlines_bulk(HEADLINES)
+    await storage.save_summaries_bulk([{"headline_id": i, "summary": f"요약 {n}", "content": "본문"} for n, i in enumerate(ids)])
+    await backdate(storage, "summaries", 29, ids=ids[:3], key="headline_id")
+    month = (datetime.now() - timedelta(days=29)).strftime("%Y-%m")
+
+    assert await storage.archive_summaries() == 3
+    # 이미 보관한 요약은 다시 보관하지 않음
+    assert await storage.archive_summaries() == 0
+
+    items = await storage.get_archive(month)
+    assert sorted(item["summary"] for item in items) == ["요약 0", "요약 1", "요약 2"]
+    assert {str(item["headline_id"]) for item in items} == {str(i) for i in ids[:3]}
+    assert all("content" not in item for item in items)
+
+async def test_keyword_trends(storage):
+    await storage.save_headlines_bulk(HEADLINES)
+    # 이미 저장된 URL은 다시 세지 않음
+    await storage.save_headlines_bulk(HEADLINES)
+    yesterday = datetime.now() - timedelta(days=1)
+    await storage.add_keyword_counts(count_increments([{"timestamp": yesterday, "source": "bbc.com", "keywords": ["rate", "ai"]}]))
+
+    trends = await get_trends(storage, "day", k=3)
+    assert trends["key"] == datetime.now().date().isoformat()
+    assert trends["terms"][0] == {"term": "rate", "count": 2, "previous": 1, "change": 1}
+    assert len(trends["terms"]) == 3
+
+    trends = await get_trends(storage, "day", source="bbc.com", k=10)
+    assert {term["term"]: term["count"] for term in trends["terms"]} == {"rate": 1, "inflation": 1, "airline": 1, "strike": 1}
+
+    month = await get_trends(storage, "month", k=1)
+    assert month["terms"][0]["term"] == "rate"
+
+async def test_keyword_trends_validation(storage):
+    for k in (0, -1, 101):
+        with pytest.raises(ValueError):
+            await get_trends(storage, "day", k=k)
+    with pytest.raises(ValueError):
+        await get_trends(storage, "year")
+
+async def test_reset_keyword_counts(storage):
+    await storage.save_headlines_bulk(HEADLINES)
+    assert await storage.reset_keyword_counts() > 0
+    assert await storage.top_keywords(window_key("day", datetime.now().date())) == []
+
+async def test_purge_expired(storage):
+    require_immediate_expiry(storage)
+    ids = await storage.save_headlines_bulk(HEADLINES[:2])
+    await storage.save_summaries_bulk([{"headline_id": i, "summary": "요약"} for i in ids])
+    await backdate(storage, "headlines", 366, ids=ids[:1])
+    await backdate(storage, "summaries", 31, ids=ids[:1], key="headline_id")
+    old = datetime.now() - timedelta(days=800)
+    await storage.add_keyword_counts(count_increments([{"timestamp": old, "source": "bbc.com", "keywords": ["ai"]}]))
+
+    jobs = storage.job_store()
+    await jobs.init()
+    for job_id in ("old", "recent"):
+        await jobs.insert({"_id": job_id, "query": "ai", "priority": 0, "status": "queued", "created_at": datetime.now()})
+    await jobs.finish("old", {"status": "done", "finished_at": datetime.now() - timedelta(days=8)})
+    await jobs.finish("recent", {"status": "done", "finished_at": datetime.now()})
+    checkpoints = storage.checkpoint_store()
+    await checkpoints.start("old", "ai")
+    await checkpoints.start("recent", "ai")
+    await backdate(storage, "workflow_runs", 8, ids=["old"], field="updated_at")
+
+    # MongoDB는 TTL 인덱스가 지우므로 0을 반환
+    await storage.purge_expired()
+    assert [doc["url"] for doc in await storage.get_headlines()] == ["https://example.com/2"]
+    assert [str(doc["headline_id"]) for doc in await storage.get_summaries()] == [str(ids[1])]
+    assert await storage.top_keywords(window_key("day", old.date())) == []
+    assert await jobs.get("old") is None
+    assert (await jobs.get("recent"))["status"] == "done"
+    assert await checkpoints.load("old") is None
+    assert await checkpoints.load("recent") is not None
+
+def make_job(job_id, priority, created_at):
+    return {"_id": job_id, "query": job_id, "max_results": 5, "include_domains": None, "priority": priority,
+            "source": "api", "status": "queued", "created_at": created_at}
+
+async def test_job_store_claims_by_priority(storage):
+    jobs = storage.job_store()
+    await jobs.init()
+    now = datetime.now()
+    await jobs.insert(make_job("scheduled", 10, now - timedelta(minutes=5)))
+    await jobs.insert(make_job("interactive", 0, now))
+
+    job = await jobs.claim("worker-1", lease_seconds=60)
+    assert (job["_id"], job["status"], job["worker"], job["attempts"]) == ("interactive", "running", "worker-1", 1)
+    assert job["lease_until"] > now
+    assert (await jobs.claim("worker-2", lease_seconds=60))["_id"] == "scheduled"
+    assert await jobs.claim("worker-3", lease_seconds=60) is None
+
+    await jobs.renew("interactive", "worker-1", lease_seconds=600)
+    assert (await jobs.get("interactive"))["lease_until"] > now + timedelta(seconds=300)
+
+    await jobs.finish("interactive", {"status": "done", "result": {"saved_count": 2}, "finished_at": datetime.now()})
+    job = await jobs.get("interactive")
+    assert (job["status"], job["result"]) == ("done", {"saved_count": 2})
+    assert "lease_until" not in job
+
+async def test_job_store_release_and_expired_lease(storage):
+    jobs = storage.job_store()
+    await jobs.init()
+    await jobs.insert(make_job("job", 0, datetime.now()))
+
+    await jobs.claim("worker-1", lease_seconds=60)
+    # 다른 워커의 해제 요청은 무시
+    await jobs.release("job", "worker-2")
+    assert (await jobs.get("job"))["status"] == "running"
+    # 종료로 중단된 작업은 시도 횟수에 포함하지 않음
+    await jobs.release("job", "worker-1")
+    job = await jobs.get("job")
+    assert (job["status"], job["attempts"]) == ("queued", 0)
+
+    # lease가 만료된 작업은 다른 워커가 다시 점유
+    await jobs.claim("worker-1", lease_seconds=-1)
+    job = await jobs.claim("worker-2", lease_seconds=60)
+    assert (job["_id"], job["worker"], job["attempts"]) == ("job", "worker-2", 2)
+
+async def test_job_store_saved_queries(storage):
+    if is_memory_mongo(storage):
+        pytest.skip("mongomock은 날짜에 대한 $add 갱신 파이프라인을 지원하지 않습니다")
+    jobs = storage.job_store()
+    await jobs.init()
+    now = datetime.now()
+    saved_id = await jobs.add_saved_query({"query": "ai", "interval_seconds": 3600, "max_results": 5, "next_run_at": now})
+    assert isinstance(saved_id, str)
+
+    saved = await jobs.next_due_saved_query(now)
+    assert (saved["query"], saved["max_results"]) == ("ai", 5)
+    # 다음 실행 시각이 interval_seconds만큼 밀려 같은 주기에는 다시 꺼내지 않음
+    assert await jobs.next_due_saved_query(now) is None
+    assert (await jobs.next_due_saved_query(now + timedelta(hours=1)))["query"] == "ai"
+
+async def test_checkpoint_store(storage):
+    checkpoints = storage.checkpoint_store()
+    assert await checkpoints.load("run") is None
+
+    await checkpoints.start("run", "ai")
+    await checkpoints.save_items("run", [{"title": "AI chip", "url": "https://example.com/1"}])
+    await checkpoints.update_articles("run", {"0": {"summary": "요약"}})
+    await checkpoints.update_articles("run", {"0": {"saved": True}, "1": {"analysis": {"sentiment": "neutral"}}})
+    await checkpoints.update_articles("run", {})
+    # 재시작 시 start를 다시 호출해도 진행 상태는 유지
+    await checkpoints.start("run", "ai")
+    await checkpoints.finish("run")
+
+    run = await checkpoints.load("run")
+    assert (run["query"], run["status"]) == ("ai", "done")
+    assert run["items"] == [{"title": "AI chip", "url": "https://example.com/1"}]
+    assert run["articles"] == {"0": {"summary": "요약", "saved": True}, "1": {"analysis": {"sentiment": "neutral"}}}
+
+async def test_job_progress_reads_checkpoint(storage):
+    jobs = storage.job_store()
+    await jobs.init()
+    await jobs.insert(make_job("job", 0, datetime.now()))
+    checkpoints = storage.checkpoint_store()
+    await checkpoints.start("job", "ai")
+    await checkpoints.save_items("job", [{"title": "AI chip"}])
+    await checkpoints.update_articles("job", {"0": {"summary": "요약", "saved": True}})
+
+    run = await jobs.get_run("job")
+    assert run["items"] == [{"title": "AI chip"}]
+    assert run["articles"] == {"0": {"summary": "요약", "saved": True}}
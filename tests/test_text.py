@@ -0,0 +1,103 @@
+"""근접 중복 탐지, 토큰 청크 분할, 키워드 추출 검사"""
+from src.text.chunking import TokenChunker, chunk_budget, strip_boilerplate
+from src.text.dedup import band_keys, cluster, decode, encode, minhash, nearest, similarity
+from src.text.keywords import KeywordExtractor, tokenize
+
+ORIGINAL = "삼성전자 반도체 수출 3개월 연속 증가 전망 나와"
+REWRITTEN = "삼성전자 반도체 수출 3개월 연속 증가 전망"
+UNRELATED = "Central bank signals rate cut amid inflation"
+
+def test_minhash_similarity():
+    original, rewritten, unrelated = minhash(ORIGINAL), minhash(REWRITTEN), minhash(UNRELATED)
+    assert similarity(original, minhash(ORIGINAL)) == 1.0
+    assert similarity(original, rewritten) >= 0.6
+    assert similarity(original, unrelated) < 0.2
+    # 비슷한 기사는 LSH 밴드를 공유해 후보로 조회됨
+    assert set(band_keys(original)) & set(band_keys(rewritten))
+    assert not set(band_keys(original)) & set(band_keys(unrelated))
+    assert all(0 <= key < 2 ** 63 for key in band_keys(original))
+
+def test_minhash_encode_roundtrip():
+    signature = minhash(ORIGINAL)
+    assert (decode(encode(signature)) == signature).all()
+
+def test_cluster_and_nearest():
+    signatures = [minhash(ORIGINAL), minhash(UNRELATED), minhash(REWRITTEN)]
+    assert cluster(signatures) == [0, 1, 0]
+
+    candidates = [
+        {"_id": "unrelated", "minhash": encode(signatures[1])},
+        {"_id": "original", "minhash": encode(signatures[0])},
+    ]
+    assert nearest(signatures[2], candidates)["_id"] == "original"
+    assert nearest(minhash("우주 발사체 시험 성공"), candidates) is None
+
+def words(count, start=0):
+    return " ".join(f"word{i}." for i in range(start, start + count))
+
+def test_chunker_respects_budget():
+    chunker = TokenChunker(max_tokens=40, count=lambda text: len(text.split()))
+    text = "\n\n".join(words(15, start) for start in range(0, 150, 15))
+    chunks = chunker.split_text(text)
+    assert len(chunks) > 1
+    assert all(len(chunk.split()) <= 40 for chunk in chunks)
+    # 겹침이 없으면 모든 단어가 한 번씩만 포함
+    assert " ".join(chunks).split() == text.split()
+
+def test_chunker_overlaps_last_sentence():
+    chunker = TokenChunker(max_tokens=10, overlap_tokens=3, count=lambda text: len(text.split()))
+    chunks = chunker.split_text(" ".join(f"Item{i} ends." for i in range(9)))
+    assert all(len(chunk.split()) <= 10 for chunk in chunks)
+    # 다음 청크는 앞 청크의 끝 문장(overlap_tokens 이내)으로 시작
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.split("\n\n")[0] == previous.split("\n\n")[-1]
+    assert chunks[-1].endswith("Item8 ends.")
+
+def test_chunker_splits_long_sentence_by_characters():
+    chunker = TokenChunker(max_tokens=10)
+    text = "가나다라마바사아자차" * 5
+    pieces = chunker.split_text(text)
+    assert len(pieces) > 1
+    assert all(chunker.count(piece) <= 10 for piece in pieces)
+    assert "".join(pieces) == text
+
+def test_chunker_strips_boilerplate_and_repeats():
+    text = "\n\n".join([
+        "(서울=연합뉴스) 홍길동 기자 = 반도체 수출이 늘었다.",
+        "반도체 수출이 늘었다.",
+        "▶ 관련 기사 더 보기",
+        "ⓒ 연합뉴스, 무단 전재 및 재배포 금지",
+    ])
+    assert strip_boilerplate(text) == "반도체 수출이 늘었다."
+    assert TokenChunker(max_tokens=100).split_text(text) == ["반도체 수출이 늘었다."]
+    # 공백 없는 긴 한글 줄도 바로 처리 (바이라인 패턴 역추적 회귀 방지)
+    assert strip_boilerplate("가나다라마바사아자차" * 100) == "가나다라마바사아자차" * 100
+
+def test_chunk_budget():
+    assert chunk_budget("gpt-4o-mini", 500, 512, 3000) == 3000
+    assert chunk_budget("unknown-model", 500, 512, 5000) == 4096 - 500 - 512
+    assert chunk_budget("unknown-model", 5000, 512, 3000) == 1
+
+def test_tokenize_drops_stopwords_and_particles():
+    assert tokenize("삼성전자는 반도체를 수출했다 and the Reuters said chips AI") == ["삼성전자", "반도체", "chips"]
+
+def test_keyword_extractor_prefers_rare_terms():
+    extractor = KeywordExtractor(top_k=2)
+    extractor.load(100, {"market": 90, "robot": 2})
+    texts = ["market market market robot export", "market trends"]
+    assert extractor.extract_batch(texts) == [["export", "robot"], ["trends", "market"]]
+    # 같은 입력과 DF 상태에서는 같은 결과
+    assert extractor.extract_batch(texts) == extractor.extract_batch(texts)
+    assert extractor.extract_batch(texts, top_k=1) == [["export"], ["trends"]]
+
+def test_keyword_extractor_observe_and_drain():
+    extractor = KeywordExtractor()
+    extractor.observe(["robot export robot", "robot market"])
+    assert extractor.doc_count == 2
+    assert extractor.df["robot"] == 2
+
+    doc_count, df = extractor.drain()
+    assert (doc_count, dict(df)) == (2, {"robot": 2, "export": 1, "market": 1})
+    assert extractor.drain() == (0, {})
+    # 꺼낸 뒤에도 누적 DF는 유지
+    assert extractor.df["robot"] == 2